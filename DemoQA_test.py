@@ -3,6 +3,7 @@
 Проверяет наличие основных компонентов: навигация, кнопки, формы и т.д.
 """
 
+import argparse
 import os
 import time
 import random
@@ -10,10 +11,15 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from driver_pool import get_pool
+from driver_resolver import make_chrome_service
+from page_waits import navigate, mark_document, wait_for_page_ready
+from input_strategies import fill_text
+from form_data_generator import FormDataGenerator
+from screenshot_writer import capture, flush_screenshots
+from result_store import ResultStore, PASS, FAIL, WARNING
 
 # Отключаем SSL проверку для WebDriverManager
 os.environ['WDM_SSL_VERIFY'] = '0'
@@ -26,11 +32,16 @@ os.makedirs(SCREENSHOTS_DIR, exist_ok=True)
 class DemoQAUITest:
     """Класс для тестирования UI элементов на DemoQA"""
 
-    def __init__(self):
+    def __init__(self, data_seed=None, text_box_rows=1):
         self.driver = None
         self.wait = None
+        self.pool = None
         self.base_url = "https://demoqa.com"
-        self.test_results = []
+        self.test_results = ResultStore("demoqa_ui")
+
+        # Данные Text Box - синтетические записи разных локалей, воспроизводимые по seed
+        self.form_data = FormDataGenerator(seed=data_seed)
+        self.text_box_rows = text_box_rows
 
     def setup_driver(self):
         """Настройка и запуск браузера"""
@@ -48,8 +59,10 @@ class DemoQAUITest:
         options.add_argument(f"--user-agent={random.choice(user_agents)}")
 
         try:
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
+            # Берем прогретый браузер из общего пула (Chrome стартует только один раз)
+            self.pool = get_pool("demoqa", lambda: webdriver.Chrome(
+                service=make_chrome_service(), options=options))
+            self.driver = self.pool.acquire()
             self.wait = WebDriverWait(self.driver, 10)
 
             # Скрываем признаки автоматизации
@@ -65,40 +78,39 @@ class DemoQAUITest:
     def take_screenshot(self, name):
         """Сделать скриншот"""
         if self.driver:
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-            filename = f"{name}_{timestamp}.png"
-            filepath = os.path.join(SCREENSHOTS_DIR, filename)
-            self.driver.save_screenshot(filepath)
+            filepath = capture(self.driver, SCREENSHOTS_DIR, name)
             print(f"📸 Скриншот сохранен: {filepath}")
             return filepath
         return None
 
     def check_element_exists(self, locator, element_name, timeout=5):
         """Проверить существование элемента"""
+        started = time.perf_counter()
         try:
             element = WebDriverWait(self.driver, timeout).until(
                 EC.presence_of_element_located(locator)
             )
             print(f"✅ {element_name}: найден")
-            self.test_results.append(f"✅ {element_name}: PASS")
+            self.test_results.add(PASS, element_name, duration=time.perf_counter() - started)
             return element
         except TimeoutException:
             print(f"❌ {element_name}: НЕ найден")
-            self.test_results.append(f"❌ {element_name}: FAIL")
+            self.test_results.add(FAIL, element_name, duration=time.perf_counter() - started)
             return None
 
     def check_element_clickable(self, locator, element_name, timeout=5):
         """Проверить, что элемент кликабельный"""
+        started = time.perf_counter()
         try:
             element = WebDriverWait(self.driver, timeout).until(
                 EC.element_to_be_clickable(locator)
             )
             print(f"✅ {element_name}: кликабельный")
-            self.test_results.append(f"✅ {element_name} (кликабельный): PASS")
+            self.test_results.add(PASS, f"{element_name} (кликабельный)", duration=time.perf_counter() - started)
             return element
         except TimeoutException:
             print(f"❌ {element_name}: НЕ кликабельный")
-            self.test_results.append(f"❌ {element_name} (кликабельный): FAIL")
+            self.test_results.add(FAIL, f"{element_name} (кликабельный)", duration=time.perf_counter() - started)
             return None
 
     def check_text_content(self, locator, element_name, expected_text=None):
@@ -110,19 +122,19 @@ class DemoQAUITest:
             if expected_text:
                 if expected_text.lower() in actual_text.lower():
                     print(f"✅ {element_name}: текст корректный ('{actual_text}')")
-                    self.test_results.append(f"✅ {element_name} текст: PASS")
+                    self.test_results.add(PASS, f"{element_name} текст")
                 else:
                     print(f"❌ {element_name}: неверный текст. Ожидали: '{expected_text}', получили: '{actual_text}'")
-                    self.test_results.append(f"❌ {element_name} текст: FAIL")
+                    self.test_results.add(FAIL, f"{element_name} текст")
             else:
                 print(f"✅ {element_name}: содержит текст ('{actual_text}')")
-                self.test_results.append(f"✅ {element_name} текст: PASS")
+                self.test_results.add(PASS, f"{element_name} текст")
 
             return actual_text
 
         except Exception as e:
             print(f"❌ {element_name}: ошибка проверки текста - {e}")
-            self.test_results.append(f"❌ {element_name} текст: FAIL")
+            self.test_results.add(FAIL, f"{element_name} текст")
             return None
 
     def test_homepage_elements(self):
@@ -130,18 +142,17 @@ class DemoQAUITest:
         print("\n🏠 === ТЕСТИРОВАНИЕ ГЛАВНОЙ СТРАНИЦЫ ===")
 
         # Переходим на главную страницу
-        self.driver.get(self.base_url)
-        time.sleep(2)
+        navigate(self.driver, self.base_url)
         self.take_screenshot("01_homepage_loaded")
 
         # Проверяем заголовок страницы
         page_title = self.driver.title
         if "DEMOQA" in page_title.upper():
             print(f"✅ Заголовок страницы: корректный ('{page_title}')")
-            self.test_results.append("✅ Заголовок страницы: PASS")
+            self.test_results.add(PASS, "Заголовок страницы")
         else:
             print(f"❌ Заголовок страницы: некорректный ('{page_title}')")
-            self.test_results.append("❌ Заголовок страницы: FAIL")
+            self.test_results.add(FAIL, "Заголовок страницы")
 
         # Проверяем логотип/главный заголовок
         logo_selectors = [
@@ -184,8 +195,9 @@ class DemoQAUITest:
             elements_card = self.wait.until(
                 EC.element_to_be_clickable((By.XPATH, "//h5[text()='Elements']"))
             )
+            token = mark_document(self.driver)
             elements_card.click()
-            time.sleep(2)
+            wait_for_page_ready(self.driver, navigated_from=token)
             self.take_screenshot("03_elements_page_loaded")
 
             # Проверяем боковое меню
@@ -205,7 +217,7 @@ class DemoQAUITest:
 
         except Exception as e:
             print(f"❌ Ошибка перехода на страницу Elements: {e}")
-            self.test_results.append("❌ Переход на страницу Elements: FAIL")
+            self.test_results.add(FAIL, "Переход на страницу Elements")
 
     def test_text_box_functionality(self):
         """Тест функциональности Text Box"""
@@ -216,8 +228,9 @@ class DemoQAUITest:
             text_box_menu = self.wait.until(
                 EC.element_to_be_clickable((By.XPATH, "//span[text()='Text Box']"))
             )
+            token = mark_document(self.driver)
             text_box_menu.click()
-            time.sleep(2)
+            wait_for_page_ready(self.driver, navigated_from=token)
             self.take_screenshot("04_text_box_page")
 
             # Проверяем элементы формы
@@ -235,53 +248,61 @@ class DemoQAUITest:
             # Проверяем, что кнопку Submit можно нажать
             self.check_element_clickable((By.ID, "submit"), "Кнопка 'Submit'")
 
-            # Заполняем форму тестовыми данными
-            test_data = {
-                "userName": "Тестовый Пользователь",
-                "userEmail": "test@example.com",
-                "currentAddress": "Текущий адрес, ул. Тестовая, д. 1",
-                "permanentAddress": "Постоянный адрес, ул. Постоянная, д. 2"
-            }
+            # Заполняем форму записями генератора (text_box_rows > 1 - прогон по нескольким записям)
+            for row, record in enumerate(self.form_data.records(self.text_box_rows), 1):
+                self.submit_text_box(record, row)
 
-            for field_id, value in test_data.items():
-                try:
-                    field = self.driver.find_element(By.ID, field_id)
-                    field.clear()
-                    field.send_keys(value)
-                    print(f"✅ Поле '{field_id}': заполнено значением '{value}'")
-                except Exception as e:
-                    print(f"❌ Ошибка заполнения поля '{field_id}': {e}")
-
-            time.sleep(1)
+        except Exception as e:
+            print(f"❌ Ошибка тестирования Text Box: {e}")
+            self.test_results.add(FAIL, "Тестирование Text Box")
+
+    def submit_text_box(self, record, row=1):
+        """Заполнение и отправка Text Box одной записью генератора"""
+        name = "Отправка формы Text Box" + (f" #{row}" if self.text_box_rows > 1 else "")
+        test_data = {
+            "userName": record["full_name"],
+            "userEmail": record["email"],
+            "currentAddress": record["address"],
+            "permanentAddress": self.form_data.one(record["locale"])["address"]
+        }
+
+        for field_id, value in test_data.items():
+            try:
+                field = self.driver.find_element(By.ID, field_id)
+                fill_text(field, value)
+                print(f"✅ Поле '{field_id}': заполнено значением '{value}'")
+            except Exception as e:
+                print(f"❌ Ошибка заполнения поля '{field_id}': {e}")
+
+        wait_for_page_ready(self.driver, timeout=3, network_idle=False)
+        if row == 1:
             self.take_screenshot("05_text_box_filled")
 
-            # Нажимаем Submit
-            submit_btn = self.driver.find_element(By.ID, "submit")
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", submit_btn)
-            time.sleep(1)
-            submit_btn.click()
-            time.sleep(2)
+        # Нажимаем Submit
+        submit_btn = self.driver.find_element(By.ID, "submit")
+        self.driver.execute_script("arguments[0].scrollIntoView(true);", submit_btn)
+        time.sleep(1)
+        token = mark_document(self.driver)
+        submit_btn.click()
+        wait_for_page_ready(self.driver, navigated_from=token)
 
-            # Проверяем результат
-            try:
-                output = self.wait.until(
-                    EC.presence_of_element_located((By.ID, "output"))
-                )
-                if output.is_displayed():
-                    print("✅ Результат формы: отображается")
-                    self.test_results.append("✅ Отправка формы Text Box: PASS")
+        # Проверяем результат: блок вывода показан и содержит отправленное имя
+        try:
+            output = self.wait.until(
+                EC.presence_of_element_located((By.ID, "output"))
+            )
+            if output.is_displayed() and record["full_name"] in output.text:
+                print(f"✅ Результат формы: отображается ({record['locale']})")
+                self.test_results.add(PASS, name)
+                if row == 1:
                     self.take_screenshot("06_text_box_result")
-                else:
-                    print("❌ Результат формы: не отображается")
-                    self.test_results.append("❌ Отправка формы Text Box: FAIL")
-
-            except TimeoutException:
-                print("❌ Результат формы: не найден")
-                self.test_results.append("❌ Отправка формы Text Box: FAIL")
+            else:
+                print("❌ Результат формы: не отображается или не совпадает с данными")
+                self.test_results.add(FAIL, name)
 
-        except Exception as e:
-            print(f"❌ Ошибка тестирования Text Box: {e}")
-            self.test_results.append("❌ Тестирование Text Box: FAIL")
+        except TimeoutException:
+            print("❌ Результат формы: не найден")
+            self.test_results.add(FAIL, name)
 
     def test_buttons_page(self):
         """Тест страницы с кнопками"""
@@ -292,8 +313,9 @@ class DemoQAUITest:
             buttons_menu = self.wait.until(
                 EC.element_to_be_clickable((By.XPATH, "//span[text()='Buttons']"))
             )
+            token = mark_document(self.driver)
             buttons_menu.click()
-            time.sleep(2)
+            wait_for_page_ready(self.driver, navigated_from=token)
             self.take_screenshot("07_buttons_page")
 
             # Проверяем наличие кнопок
@@ -310,39 +332,39 @@ class DemoQAUITest:
             # Тестируем обычный клик
             try:
                 click_btn = self.driver.find_element(By.XPATH, "//button[text()='Click Me']")
+                token = mark_document(self.driver)
                 click_btn.click()
-                time.sleep(1)
+                wait_for_page_ready(self.driver, timeout=3, navigated_from=token)
 
                 # Проверяем сообщение после клика
                 try:
                     message = self.driver.find_element(By.ID, "dynamicClickMessage")
                     if message.is_displayed():
                         print(f"✅ Сообщение после клика: '{message.text}'")
-                        self.test_results.append("✅ Обычный клик по кнопке: PASS")
+                        self.test_results.add(PASS, "Обычный клик по кнопке")
                     else:
                         print("❌ Сообщение после клика: не отображается")
-                        self.test_results.append("❌ Обычный клик по кнопке: FAIL")
+                        self.test_results.add(FAIL, "Обычный клик по кнопке")
                 except NoSuchElementException:
                     print("❌ Сообщение после клика: не найдено")
-                    self.test_results.append("❌ Обычный клик по кнопке: FAIL")
+                    self.test_results.add(FAIL, "Обычный клик по кнопке")
 
             except Exception as e:
                 print(f"❌ Ошибка тестирования обычного клика: {e}")
-                self.test_results.append("❌ Обычный клик по кнопке: FAIL")
+                self.test_results.add(FAIL, "Обычный клик по кнопке")
 
             self.take_screenshot("08_buttons_tested")
 
         except Exception as e:
             print(f"❌ Ошибка тестирования кнопок: {e}")
-            self.test_results.append("❌ Тестирование кнопок: FAIL")
+            self.test_results.add(FAIL, "Тестирование кнопок")
 
     def test_navigation_elements(self):
         """Тест навигационных элементов"""
         print("\n🧭 === ТЕСТИРОВАНИЕ НАВИГАЦИИ ===")
 
         # Возвращаемся на главную страницу
-        self.driver.get(self.base_url)
-        time.sleep(2)
+        navigate(self.driver, self.base_url)
 
         # Проверяем навигационные элементы
         nav_elements = [
@@ -365,10 +387,10 @@ class DemoQAUITest:
 
             if visible_links:
                 print(f"✅ Найдено {len(visible_links)} видимых ссылок")
-                self.test_results.append(f"✅ Навигационные ссылки ({len(visible_links)} шт.): PASS")
+                self.test_results.add(PASS, "Навигационные ссылки", f"Навигационные ссылки ({len(visible_links)} шт.)")
             else:
                 print("⚠️ Видимые ссылки не найдены")
-                self.test_results.append("⚠️ Навигационные ссылки: WARNING")
+                self.test_results.add(WARNING, "Навигационные ссылки")
 
         except Exception as e:
             print(f"❌ Ошибка проверки ссылок: {e}")
@@ -376,6 +398,7 @@ class DemoQAUITest:
     def run_all_tests(self):
         """Запуск всех тестов"""
         print("🚀 НАЧАЛО ТЕСТИРОВАНИЯ UI ЭЛЕМЕНТОВ НА DEMOQA.COM")
+        print(f"🧬 Seed данных формы: {self.form_data.seed}")
         print("=" * 60)
 
         if not self.setup_driver():
@@ -398,6 +421,7 @@ class DemoQAUITest:
 
         finally:
             self.cleanup()
+            flush_screenshots()
             self.print_test_summary()
 
     def print_test_summary(self):
@@ -406,22 +430,25 @@ class DemoQAUITest:
         print("📊 ИТОГОВЫЙ ОТЧЕТ ТЕСТИРОВАНИЯ")
         print("=" * 60)
 
-        passed_tests = [result for result in self.test_results if "PASS" in result]
-        failed_tests = [result for result in self.test_results if "FAIL" in result]
-        warning_tests = [result for result in self.test_results if "WARNING" in result]
+        passed_count = self.test_results.count(PASS)
 
-        print(f"✅ Пройдено: {len(passed_tests)}")
-        print(f"❌ Провалено: {len(failed_tests)}")
-        print(f"⚠️ Предупреждения: {len(warning_tests)}")
+        print(f"✅ Пройдено: {passed_count}")
+        print(f"❌ Провалено: {self.test_results.count(FAIL)}")
+        print(f"⚠️ Предупреждения: {self.test_results.count(WARNING)}")
         print(f"📊 Всего проверок: {len(self.test_results)}")
 
-        if len(passed_tests) > 0:
-            success_rate = (len(passed_tests) / len(self.test_results)) * 100
+        if passed_count > 0:
+            success_rate = (passed_count / len(self.test_results)) * 100
             print(f"📈 Процент успешности: {success_rate:.1f}%")
 
         print("\nДЕТАЛИ:")
         for result in self.test_results:
-            print(f"  {result}")
+            print(f"  {result}: {result.status}")
+
+        self.test_results.close()
+        junit_path = self.test_results.export_junit()
+        print(f"\n📄 JSONL: {self.test_results.jsonl_path}")
+        print(f"📄 JUnit XML: {junit_path}")
 
         print("\n" + "=" * 60)
         print("🎯 ТЕСТИРОВАНИЕ ЗАВЕРШЕНО")
@@ -431,11 +458,17 @@ class DemoQAUITest:
     def cleanup(self):
         """Очистка ресурсов"""
         if self.driver:
-            self.driver.quit()
-            print("🔒 Браузер закрыт")
+            self.pool.release(self.driver)
+            self.driver = None
+            print("🔒 Браузер возвращен в пул")
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UI тестирование DemoQA")
+    parser.add_argument("--seed", type=int, default=None, help="Seed данных формы (повтор прогона)")
+    parser.add_argument("--rows", type=int, default=1, help="Сколько записей отправить в Text Box")
+    args = parser.parse_args()
+
     # Запуск тестирования
-    ui_test = DemoQAUITest()
+    ui_test = DemoQAUITest(data_seed=args.seed, text_box_rows=max(1, args.rows))
     ui_test.run_all_tests()
@@ -5,7 +5,11 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_pool import get_pool
+from driver_resolver import make_chrome_service
+from page_waits import navigate, mark_document, wait_for_page_ready
+from input_strategies import fill_text, is_fast_mode
+from screenshot_writer import capture, flush_screenshots
 
 # РЕШЕНИЕ 1: Отключить SSL-проверку для WebDriverManager
 os.environ['WDM_SSL_VERIFY'] = '0'
@@ -22,6 +26,10 @@ def human_delay(min_s=0.8, max_s=2.5):
 
 def human_typing(element, text):
     """Печать по буквам с задержками"""
+    if is_fast_mode():
+        fill_text(element, text)
+        return
+
     for letter in text:
         element.send_keys(letter)
         time.sleep(random.uniform(0.07, 0.22))
@@ -30,8 +38,7 @@ def human_typing(element, text):
 
 
 def take_screenshot(driver, step):
-    filename = os.path.join(SCREENSHOTS_DIR, f"{step}.png")
-    driver.save_screenshot(filename)
+    filename = capture(driver, SCREENSHOTS_DIR, step, timestamped=False)
     print(f"Скриншот сохранен: {filename}")
 
 
@@ -56,8 +63,9 @@ def test_google_kitten_search():
 
     try:
         # РЕШЕНИЕ 2: Создаем драйвер с отключением SSL-проверки
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
+        pool = get_pool("kitty_search", lambda: webdriver.Chrome(
+            service=make_chrome_service(), options=options), size=1)
+        driver = pool.acquire()
 
         print("✅ Браузер успешно запущен!")
 
@@ -70,8 +78,7 @@ def test_google_kitten_search():
 
     try:
         # Остальной код теста остается тем же
-        driver.get("https://www.google.com/")
-        human_delay(1, 2)
+        navigate(driver, "https://www.google.com/")
         take_screenshot(driver, "01_google_home")
 
         # Принять куки (если нужно)
@@ -89,8 +96,9 @@ def test_google_kitten_search():
                         consent = driver.find_element(By.XPATH, selector)
                     else:
                         consent = driver.find_element(By.CSS_SELECTOR, selector)
+                    token = mark_document(driver)
                     consent.click()
-                    human_delay()
+                    wait_for_page_ready(driver, timeout=5, navigated_from=token)
                     take_screenshot(driver, "02_consent_accepted")
                     break
                 except:
@@ -132,6 +140,7 @@ def test_google_kitten_search():
         take_screenshot(driver, "04_query_typed")
 
         # Нажать Enter или выбрать автодополнение
+        token = mark_document(driver)
         if random.random() < 0.5:
             search_box.send_keys(Keys.RETURN)
         else:
@@ -140,7 +149,7 @@ def test_google_kitten_search():
             time.sleep(0.4)
             search_box.send_keys(Keys.RETURN)
 
-        human_delay(2, 3)
+        wait_for_page_ready(driver, navigated_from=token)
         take_screenshot(driver, "05_search_results")
 
         # Открыть вкладку "Картинки"
@@ -162,8 +171,9 @@ def test_google_kitten_search():
                 continue
 
         if images_tab:
+            token = mark_document(driver)
             images_tab.click()
-            human_delay(2, 3)
+            wait_for_page_ready(driver, navigated_from=token)
             take_screenshot(driver, "06_images_tab")
             print("🖼️ Перешли во вкладку 'Картинки'")
         else:
@@ -172,7 +182,8 @@ def test_google_kitten_search():
         # Прокручивать страницу
         for i in range(3):
             driver.execute_script(f"window.scrollBy(0, {random.randint(250, 550)});")
-            human_delay(0.7, 1.6)
+            # Ждем догрузки ленивых картинок после прокрутки
+            wait_for_page_ready(driver, timeout=3, dom_settle=False)
             take_screenshot(driver, f"07_scrolled_{i + 1}")
             print(f"📜 Прокрутка {i + 1}/3")
 
@@ -185,8 +196,9 @@ def test_google_kitten_search():
                 img = random.choice(visible_images[:min(10, len(visible_images))])
                 driver.execute_script("arguments[0].scrollIntoView(true);", img)
                 human_delay(0.4, 0.9)
+                token = mark_document(driver)
                 img.click()
-                human_delay(1, 2)
+                wait_for_page_ready(driver, timeout=5, navigated_from=token)
                 take_screenshot(driver, "08_kitten_image_opened")
                 print("🐱 Кликнули на изображение котенка!")
             else:
@@ -202,7 +214,8 @@ def test_google_kitten_search():
         take_screenshot(driver, "error_screenshot")
 
     finally:
-        driver.quit()
+        flush_screenshots()
+        pool.release(driver)
 
 
 # АЛЬТЕРНАТИВНОЕ РЕШЕНИЕ: Без WebDriverManager
@@ -223,8 +236,7 @@ def test_google_kitten_search_manual():
         print("✅ Браузер запущен с локальным ChromeDriver!")
 
         # Далее тот же код теста...
-        driver.get("https://www.google.com/")
-        human_delay(2, 3)
+        navigate(driver, "https://www.google.com/")
         print("🌐 Google загружен")
 
     except Exception as e:
@@ -10,6 +10,9 @@ import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium_stealth import stealth
+from page_waits import navigate, mark_document, wait_for_page_ready
+from input_strategies import fill_text, is_fast_mode
+from screenshot_writer import capture, flush_screenshots
 
 # ========== НАСТРОЙКИ ========== #
 SCREEN_DIR = "spy_screens"
@@ -29,16 +32,18 @@ def human_delay(a=0.4, b=1.2):
 
 def human_typing(element, text):
     """Ввод текста по буквам с паузой."""
-    for ch in text:
-        element.send_keys(ch)
-        human_delay(0.05, 0.2)
+    if is_fast_mode():
+        fill_text(element, text)
+    else:
+        for ch in text:
+            element.send_keys(ch)
+            human_delay(0.05, 0.2)
     element.send_keys(Keys.ENTER)
 
 
 def take_shot(driver, name):
     """Сохранить скриншот в папку."""
-    path = os.path.join(SCREEN_DIR, f"{name}.png")
-    driver.save_screenshot(path)
+    path = capture(driver, SCREEN_DIR, name, timestamped=False)
     print(f"📸 Скриншот сохранён: {path}")
 
 
@@ -62,8 +67,7 @@ def run_spy_test():
 
     try:
         # 1. Открываем Google
-        driver.get("https://www.google.com/")
-        human_delay(1, 2)
+        navigate(driver, "https://www.google.com/")
 
         # 2. Принимаем куки, если будет поп-ап
         try:
@@ -77,19 +81,22 @@ def run_spy_test():
         query = random.choice(SEARCH_QUERIES)
         print(f"🔍 Ищем: {query}")
         box.click()
+        token = mark_document(driver)
         human_typing(box, query)
 
         # 4. Ждём результаты, переходим во вкладку «Картинки»
-        human_delay(2, 3)
+        wait_for_page_ready(driver, navigated_from=token)
         images_link = driver.find_element(By.CSS_SELECTOR, "a[href*='tbm=isch']")
+        token = mark_document(driver)
         images_link.click()
-        human_delay(2, 3)
+        wait_for_page_ready(driver, navigated_from=token)
 
         # 5. Финальный скриншот страницы с картинками
         take_shot(driver, "kittens_images")
 
         print("✅ Шпионский тест завершён")
     finally:
+        flush_screenshots()
         driver.quit()
 
 
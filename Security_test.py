@@ -4,18 +4,36 @@
 Тестовый сайт: http://testphp.vulnweb.com (Acunetix Test Site)
 """
 
+import argparse
 import os
 import time
 import random
+from urllib.parse import urlsplit
 from selenium import webdriver
 from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.common.exceptions import TimeoutException, UnexpectedAlertPresentException
+from selenium.common.exceptions import TimeoutException, UnexpectedAlertPresentException, WebDriverException
 import re
+from driver_pool import get_pool
+from driver_resolver import make_chrome_service
+from page_waits import mark_document, wait_for_page_ready, pop_dismissed_alert
+from input_strategies import fill_text
+from screenshot_writer import capture, flush_screenshots
+from result_store import ResultStore, VULNERABLE, WARNING, SECURE
+from security_executor import ParallelPayloadExecutor
+from rate_governor import RateGovernor, governed_navigate, governed_submit
+from http_prescreen import HttpPrescreener
+from response_matcher import ResponseMatcher
+from form_schema import FormSchemaCache
+from site_crawler import SiteCrawler
+from payload_corpus import PayloadCorpus, iter_chunks
+from payload_scheduler import PayloadScheduler
+from devtools_events import install_event_capture, has_event_capture, begin_attempt, drain_events
+from scan_journal import ScanJournal, attempt_key, login_key
+from findings_index import FindingsIndex
 
 # Отключаем SSL проверку
 os.environ['WDM_SSL_VERIFY'] = '0'
@@ -24,15 +42,89 @@ os.environ['WDM_SSL_VERIFY'] = '0'
 SCREENSHOTS_DIR = "security_test_screenshots"
 os.makedirs(SCREENSHOTS_DIR, exist_ok=True)
 
+# Признаки ошибок СУБД в ответе
+SQL_ERROR_INDICATORS = [
+    "mysql_fetch", "sql syntax", "mysqli_", "mysql error",
+    "warning: mysql", "valid mysql result", "mysqlclient",
+    "postgresql", "sqlite", "oracle", "odbc", "jdbc",
+    "sqlstate", "syntax error", "invalid query", "database error"
+]
+
+# Признаки успешного входа после SQL-обхода
+LOGIN_BYPASS_MARKERS = ["welcome", "dashboard", "logout"]
+
+# Признаки для теста страницы входа
+LOGIN_SUCCESS_MARKERS = ["welcome", "dashboard", "logout", "profile", "admin panel"]
+LOGIN_SQL_ERRORS = ["mysql", "sql syntax", "database error", "sqlstate"]
+
+# Страницы по умолчанию, если обход сайта выключен или ничего не нашел
+DEFAULT_SEARCH_PATHS = ["/search.php", "/", "/index.php", "/search/"]
+DEFAULT_LOGIN_PATHS = ["/login.php", "/admin/", "/login/", "/signin/"]
+DEFAULT_TEST_PAGES = ["/", "/search.php", "/categories.php", "/artists.php"]
+
+# Бюджет обхода сайта (запросов/с) для внешних хостов; локальный стенд обходится без лимита частоты
+DEFAULT_CRAWL_RPS = 20
+LOCAL_HOSTS = {"localhost", "127.0.0.1", "::1"}
+
+# Поток задач выполняется порциями: в памяти одновременно не больше порции (порядок по истории - внутри порции)
+TASK_CHUNK_SIZE = 500
+
+# Запросы полей, которые фиксируются в схеме страницы при первом разборе
+FIELD_QUERIES = {
+    "xss": "input[type='text'], input[type='search'], textarea",
+    "sql": "input[type='text'], input[type='password'], input[type='search']",
+    "search": "input[type='search'], input[name*='search'], input[name*='q'], input[placeholder*='search']",
+    "login_user": "input[name*='user'], input[name*='login'], input[name*='email'], input[type='text']",
+    "login_pass": "input[name*='pass'], input[type='password']",
+}
+
 
 class SecurityTestSuite:
     """Класс для тестирования безопасности веб-приложений"""
 
-    def __init__(self):
+    def __init__(self, workers=1, requests_per_second=4, max_requests_per_second=None, prescreen=True, crawl=True, max_pages=300, max_depth=3,
+                 payload_files=(), payload_tags=None, payload_budget=None, base_url="http://testphp.vulnweb.com",
+                 resume=False, crawl_rps=None):
         self.driver = None
         self.wait = None
-        self.base_url = "http://testphp.vulnweb.com"  # Официальный тестовый сайт Acunetix[248]
-        self.test_results = []
+        self.pool = None
+        self.base_url = base_url.rstrip("/")  # По умолчанию - официальный тестовый сайт Acunetix[248]
+        self.test_results = ResultStore("security")
+        # Уникальные находки (URL, параметр, класс) с выгрузкой в JSON и SARIF по ходу прогона
+        self.findings = FindingsIndex(self.base_url, os.path.splitext(self.test_results.junit_path)[0] + "_findings")
+        self.skipped_tasks = 0  # payload-задачи, потерянные при остановке воркеров
+        self.current_check = None  # (страница, поле) текущей проверки - для id результатов
+        self.workers = workers  # число параллельных браузеров для payload-задач
+        # Все навигации, отправки форм и HTTP-запросы к хосту идут через один регулятор
+        self.governor = RateGovernor(requests_per_second, max_in_flight=max(4, workers),
+                                     max_rate=max_requests_per_second)
+        # Все наборы сигнатур ответа проверяются одним матчером
+        self.matcher = ResponseMatcher({
+            "sql_error": SQL_ERROR_INDICATORS,
+            "login_bypass": LOGIN_BYPASS_MARKERS,
+            "login_success": LOGIN_SUCCESS_MARKERS,
+            "login_sql_error": LOGIN_SQL_ERRORS,
+        })
+        # HTTP-предотбор: браузер подтверждает только payload'ы-кандидаты
+        self.prescreener = HttpPrescreener(self.matcher, pool_size=max(4, workers),
+                                           governor=self.governor) if prescreen else None
+        # Схемы форм: каждая страница разбирается один раз за прогон
+        self.schemas = FormSchemaCache(FIELD_QUERIES)
+        # Обход сайта: инвентарь страниц и форм вместо ручных списков
+        self.crawl = crawl
+        self.max_pages = max_pages
+        self.max_depth = max_depth
+        # Свой бюджет для обхода: GET-запросы краулера дешевле payload-проверок, поэтому он не делит
+        # 4 запроса/с с браузерами. None - без лимита частоты для локального стенда, 20/с для внешнего хоста
+        if crawl_rps is None:
+            crawl_rps = 0 if urlsplit(self.base_url).hostname in LOCAL_HOSTS else DEFAULT_CRAWL_RPS
+        self.crawl_rps = crawl_rps
+        self.inventory = []
+        # Порядок payload'ов по истории находок и ранняя остановка после подтверждения
+        self.scheduler = PayloadScheduler()
+        # Журнал завершенных попыток: с resume=True сделанное в прошлом прогоне не повторяется;
+        # файл открывается при начале сканирования, а не при создании набора
+        self.journal = ScanJournal(self.base_url, resume=resume)
 
         # XSS Payloads для тестирования[234][237][252]
         self.xss_payloads = [
@@ -62,8 +154,32 @@ class SecurityTestSuite:
             "' AND 1=0 UNION SELECT null, username, password FROM users--"
         ]
 
-    def setup_driver(self):
-        """Настройка браузера для тестирования безопасности"""
+        # Корпус: встроенные списки + файлы; в прогон попадает выборка по тегам и бюджету
+        self.corpus = PayloadCorpus().add_builtin("xss", self.xss_payloads).add_builtin("sql", self.sql_payloads)
+        for path in payload_files:
+            self.corpus.add_file(path)
+
+        # Выборка не материализуется: payload'ы читаются из корпуса потоком при построении задач
+        self.payload_selection = None
+        if payload_files or payload_tags or payload_budget:
+            self.payload_selection = (payload_tags, payload_budget)
+            unique = sum(1 for _ in self.corpus.iter_payloads())  # один проход - только счетчики
+            print(f"📚 Корпус: прочитано {self.corpus.stats['read']}, уникальных {unique}, "
+                  f"дубликатов {self.corpus.stats['duplicates']}")
+
+    def iter_payload_texts(self, kind):
+        """Поток payload'ов класса xss/sql: встроенный список или выборка из корпуса"""
+        if self.payload_selection is None:
+            return iter(self.xss_payloads if kind == "xss" else self.sql_payloads)
+        tags, budget = self.payload_selection
+        return (payload.text for payload in self.corpus.select(kind, tags, budget=budget))
+
+    def payload_count(self, kind):
+        """Число payload'ов класса в прогоне (подсчет проходом по потоку)"""
+        return sum(1 for _ in self.iter_payload_texts(kind))
+
+    def build_options(self):
+        """Настройки Chrome для тестирования безопасности"""
         options = Options()
         options.add_argument("--start-maximized")
         options.add_argument("--disable-web-security")
@@ -71,14 +187,25 @@ class SecurityTestSuite:
         options.add_argument("--disable-xss-auditor")  # Отключаем встроенную защиту от XSS для тестирования[249]
         options.add_argument("--disable-blink-features=AutomationControlled")
 
-        # Логирование консоли для обнаружения XSS
+        # Логирование консоли для обнаружения XSS (запасной путь, если перехват через DevTools недоступен)
         options.add_experimental_option("detach", True)
-        caps = options.to_capabilities()
-        caps['goog:loggingPrefs'] = {'browser': 'ALL'}
+        options.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
+        return options
 
+    def create_driver(self):
+        """Новый браузер с настройками набора (фабрика для пулов)"""
+        driver = webdriver.Chrome(service=make_chrome_service(), options=self.build_options())
+        # Консоль и диалоги каждой вкладки пишутся в буфер событий
+        if not install_event_capture(driver):
+            print("⚠️ Перехват событий через DevTools недоступен - используем get_log и switch_to.alert")
+        return driver
+
+    def setup_driver(self):
+        """Настройка браузера для тестирования безопасности"""
         try:
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
+            # Прогретая сессия из общего пула вместо холодного старта
+            self.pool = get_pool("security", self.create_driver)
+            self.driver = self.pool.acquire()
             self.wait = WebDriverWait(self.driver, 10)
 
             print("✅ Браузер для security testing запущен")
@@ -88,221 +215,429 @@ class SecurityTestSuite:
             print(f"❌ Ошибка запуска браузера: {e}")
             return False
 
-    def take_screenshot(self, name):
+    def take_screenshot(self, name, driver=None):
         """Создать скриншот"""
-        if self.driver:
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-            filename = f"{name}_{timestamp}.png"
-            filepath = os.path.join(SCREENSHOTS_DIR, filename)
-            self.driver.save_screenshot(filepath)
+        driver = driver or self.driver
+        if driver:
+            filepath = capture(driver, SCREENSHOTS_DIR, name)
             print(f"📸 Скриншот безопасности: {filepath}")
             return filepath
         return None
 
-    def check_for_alert(self, expected_text=None):
-        """Проверить наличие JavaScript alert (признак успешного XSS)"""
-        try:
-            alert = self.driver.switch_to.alert
-            alert_text = alert.text
-            print(f"🚨 ALERT обнаружен: '{alert_text}'")
-
-            if expected_text and expected_text in alert_text:
-                print(f"✅ XSS успешно выполнен: найден ожидаемый текст '{expected_text}'")
-                self.test_results.append(f"🔥 XSS УЯЗВИМОСТЬ: payload выполнился - {expected_text}")
-                alert.accept()
-                return True
-            else:
-                alert.accept()
-                return True
+    def open_page(self, driver, url):
+        """Открыть страницу через регулятор нагрузки на хост"""
+        return governed_navigate(self.governor, driver, url)
+
+    def make_finding(self, status, detector, check, message, artifacts=None, **details):
+        """Находка одной попытки (в общий результат попадает после слияния); check - (страница, поле)"""
+        page, parameter = check or ("/", None)
+        check_id = f"{detector}:{page}:{parameter}" if parameter else f"{detector}:{page}"
+        # Страница и поле хранятся отдельно: в пути с query бывает ':', id проверки обратно не разбирается
+        return {"status": status, "check_id": check_id, "message": message,
+                "detector": detector, "page": page, "parameter": parameter,
+                "artifacts": list(artifacts or []), "details": details}
+
+    def record_findings(self, findings):
+        """Записать находки в результаты набора"""
+        for finding in findings:
+            self.test_results.add(finding["status"], finding["check_id"], finding["message"],
+                                  artifacts=finding["artifacts"], **finding["details"])
+            self.findings.add(finding)
+
+    def check_for_alert(self, expected_text=None, driver=None, check=None, events=None):
+        """Проверить наличие JavaScript alert (признак успешного XSS); вернуть список находок"""
+        driver = driver or self.driver
+        check = check or self.current_check
+
+        if events is not None:
+            # Диалоги уже в буфере событий попытки - обращаться к WebDriver не нужно
+            dialogs = [event["text"] for event in events if event["type"] == "dialog"]
+            if not dialogs:
+                return []
+            alert_text = next((text for text in dialogs if expected_text and expected_text in text), dialogs[0])
+        else:
+            # Диалог мог быть закрыт WebDriver'ом, пока мы ждали загрузку страницы
+            alert_text = pop_dismissed_alert(driver)
+            if alert_text is None:
+                try:
+                    alert = driver.switch_to.alert
+                    alert_text = alert.text
+                    alert.accept()
+                except WebDriverException:
+                    return []
 
-        except:
-            return False
+        print(f"🚨 ALERT обнаружен: '{alert_text}'")
+
+        if expected_text and expected_text in alert_text:
+            print(f"✅ XSS успешно выполнен: найден ожидаемый текст '{expected_text}'")
+            return [self.make_finding(VULNERABLE, "xss_alert", check,
+                                      f"XSS УЯЗВИМОСТЬ: payload выполнился - {expected_text}")]
+
+        if not expected_text:
+            # Payload из корпуса без маркера - сам факт диалога означает выполнение
+            return [self.make_finding(VULNERABLE, "xss_alert", check,
+                                      f"XSS УЯЗВИМОСТЬ: payload выполнился - {alert_text[:50]}")]
+
+        return [self.make_finding(WARNING, "xss_alert", check,
+                                  f"ALERT без ожидаемого маркера: {alert_text[:100]}")]
+
+    def check_console_logs(self, driver=None, check=None, events=None):
+        """Проверить логи консоли на наличие XSS[240]; вернуть список находок"""
+        driver = driver or self.driver
+        check = check or self.current_check
 
-    def check_console_logs(self):
-        """Проверить логи консоли на наличие XSS[240]"""
         try:
-            logs = self.driver.get_log('browser')
-            xss_detected = False
+            if events is not None:
+                messages = [event["text"] for event in events if event["type"] == "console"]
+            else:
+                messages = [log['message'] for log in driver.get_log('browser')]
+            findings = []
 
-            for log in logs:
-                message = log['message']
+            for message in messages:
                 if any(xss_marker in message for xss_marker in ['XSS_TEST_', 'alert', 'console.log']):
                     print(f"🔍 Подозрительная запись в консоли: {message}")
-                    xss_detected = True
-                    self.test_results.append(f"⚠️ XSS в консоли: {message[:100]}")
+                    findings.append(self.make_finding(WARNING, "xss_console", check,
+                                                      f"XSS в консоли: {message[:100]}"))
 
-            return xss_detected
+            return findings
 
         except Exception as e:
             print(f"Ошибка проверки логов консоли: {e}")
+            return []
+
+    def page_slug(self, url_path):
+        """Часть имени файла для страницы (путь с query)"""
+        return re.sub(r"[^\w.-]", "_", url_path)
+
+    def discover_targets(self):
+        """Обойти сайт и собрать инвентарь страниц с формами"""
+        if self.journal.inventory is not None:
+            self.inventory = self.journal.inventory
+            print(f"\n📓 Инвентарь из журнала: {len(self.inventory)} страниц - обход пропущен")
+        else:
+            rate = f"{self.crawl_rps:g} запр/с" if self.crawl_rps else "без лимита частоты"
+            print(f"\n🕸️ Обход сайта: до {self.max_pages} страниц, глубина {self.max_depth}, {rate}")
+            started = time.time()
+
+            concurrency = max(8, self.workers)
+            # Отдельный регулятор: AIMD и Retry-After по-прежнему защищают хост, но обход не ждет токенов payload-фазы
+            crawl_governor = RateGovernor(self.crawl_rps, max_in_flight=concurrency)
+            crawler = SiteCrawler(self.base_url, max_pages=self.max_pages, max_depth=self.max_depth,
+                                  concurrency=concurrency, governor=crawl_governor)
+            self.inventory = crawler.crawl()
+            self.journal.record_inventory(self.inventory)
+            print(f"✅ Обход за {time.time() - started:.1f}с (ошибок: {crawler.errors})")
+
+        # Формы уже разобраны - HTTP-предотбору не нужно скачивать страницы повторно
+        if self.prescreener:
+            for page in self.inventory:
+                self.prescreener.remember_forms(page["url"], page["forms"])
+
+        with_forms = sum(1 for page in self.inventory if page["forms"])
+        print(f"✅ Найдено страниц: {len(self.inventory)}, с формами: {with_forms}")
+        return self.inventory
+
+    def inventory_paths(self, predicate):
+        """Пути страниц инвентаря, где есть форма, подходящая под условие"""
+        return [page["path"] for page in self.inventory if any(predicate(form) for form in page["forms"])]
+
+    def unique_form_pages(self):
+        """Страницы, на которых впервые встречается каждая форма (шапка сайта не тестируется 300 раз)"""
+        seen, paths = set(), []
+        for page in self.inventory:
+            signatures = {(form["action"], form["method"], tuple(sorted(form["fields"]))) for form in page["forms"]}
+            if signatures - seen:
+                seen |= signatures
+                paths.append(page["path"])
+        return paths
+
+    def page_schema(self, url_path):
+        """Схема форм страницы: из кэша или одним разбором после перехода"""
+        return self.schemas.get(self.driver, f"{self.base_url}{url_path}", self.open_page)
+
+    @staticmethod
+    def field_label(field):
+        """Имя поля для задач и отчета"""
+        return field["name"] or field["id"] or 'unknown_field'
+
+    def build_payload_tasks(self, url_path, kind, form_fields, schema):
+        """Поток независимых задач (страница, поле, payload): payload'ы читаются по одному"""
+        for i, payload in enumerate(self.iter_payload_texts(kind)):
+            for field in form_fields:
+                yield {
+                    "page": url_path,
+                    "field_selector": field["selector"],
+                    "field_type": field.get("type"),
+                    "maxlength": field.get("maxlength"),
+                    "submit_selector": schema.submit_for(field),
+                    "field_name": self.field_label(field),
+                    "kind": kind,
+                    "payload_index": i,
+                    "payload": payload,
+                }
+
+    def run_payload_attempt(self, driver, task):
+        """Одна попытка: открыть страницу, ввести payload, отправить, проанализировать ответ"""
+        self.open_page(driver, f"{self.base_url}{task['page']}")
+
+        field = driver.find_element(By.CSS_SELECTOR, task["field_selector"])
+
+        # Все события консоли и диалоги с этого момента относятся к этой попытке
+        task["attempt_id"] = f"{task['kind']}|{task['page']}|{task['field_name']}|{task['payload_index']}"
+        begin_attempt(driver, task["attempt_id"])
+        fill_text(field, task["payload"])
+
+        # Кнопка отправки известна из схемы формы - повторно не ищем
+        submit_buttons = driver.find_elements(By.CSS_SELECTOR, task["submit_selector"]) if task["submit_selector"] else []
+
+        with governed_submit(self.governor, driver, f"{self.base_url}{task['page']}"):
+            token = mark_document(driver)
+            if submit_buttons:
+                submit_buttons[0].click()
+            elif task["kind"] == "xss":
+                # Если нет кнопки submit, пробуем Enter
+                field.send_keys(Keys.RETURN)
+            wait_for_page_ready(driver, timeout=5, navigated_from=token)
+
+        check = (task["page"], task["field_name"])
+        if task["kind"] == "xss":
+            return self.analyze_xss_response(driver, task, check)
+        return self.analyze_sql_response(driver, task, check)
+
+    def analyze_xss_response(self, driver, task, check):
+        """Признаки XSS после отправки: alert, консоль, отражение без экранирования"""
+        i, payload = task["payload_index"], task["payload"]
+        findings = []
+
+        # События попытки одним запросом (None - перехват недоступен, проверяем по-старому)
+        events = drain_events(driver, task["attempt_id"]) if has_event_capture(driver) else None
+
+        # Проверяем на alert (маркер XSS_TEST_N есть только у встроенных payload'ов)
+        marker = re.search(r"XSS_TEST_\d+", payload)
+        alert_findings = self.check_for_alert(marker.group(0) if marker else None, driver, check, events)
+        if alert_findings:
+            screenshot = self.take_screenshot(f"xss_vulnerability_found_{task['field_name']}_{i}", driver)
+            for finding in alert_findings:
+                finding["artifacts"].append(screenshot)
+            findings.extend(alert_findings)
+
+        # Проверяем консольные логи
+        findings.extend(self.check_console_logs(driver, check, events))
+        for finding in findings:
+            finding["details"].setdefault("payload", payload)
+
+        # Проверяем, отобразился ли payload на странице без экранирования
+        if "<script>" in payload and self.matcher.match_page(driver, [payload]).get("reflected"):
+            print(f"⚠️ Payload отображается на странице без экранирования: {payload[:50]}")
+            findings.append(self.make_finding(VULNERABLE, "xss_reflected", check,
+                                              f"XSS REFLECTED: {payload[:50]} в поле {task['field_name']}",
+                                              payload=payload))
+
+        return findings
+
+    def analyze_sql_response(self, driver, task, check):
+        """Признаки SQL Injection после отправки: ошибки СУБД и обход входа"""
+        i, payload = task["payload_index"], task["payload"]
+        findings = []
+
+        # Анализируем ответ на наличие SQL ошибок (поиск внутри страницы, в Python - только совпадения)
+        hits = self.matcher.match_page(driver)
+
+        if hits.get("sql_error"):
+            error_indicator = hits["sql_error"][0]
+            print(f"🔥 SQL ERROR обнаружена: '{error_indicator}' с payload: {payload}")
+            screenshot = self.take_screenshot(f"sql_error_{task['field_name']}_{i}", driver)
+            findings.append(self.make_finding(VULNERABLE, "sqli_error", check,
+                                              f"SQL INJECTION: {error_indicator} - {payload[:50]}",
+                                              artifacts=[screenshot], payload=payload, indicator=error_indicator))
+
+        # Проверяем на неожиданное поведение (например, вход без правильных credentials)
+        if hits.get("login_bypass"):
+            if self.is_bypass_payload(payload):
+                print(f"⚠️ Возможный SQL Injection bypass: успешный вход с payload {payload}")
+                screenshot = self.take_screenshot(f"sql_bypass_{task['field_name']}_{i}", driver)
+                findings.append(self.make_finding(VULNERABLE, "sqli_bypass", check,
+                                                  f"SQL BYPASS: успешный вход - {payload[:50]}",
+                                                  artifacts=[screenshot], payload=payload))
+
+        return findings
+
+    def is_bypass_payload(self, payload):
+        """Payload рассчитан на обход проверки пароля"""
+        return "OR '1'='1" in payload or "OR 1=1" in payload
+
+    def prescreen_tasks(self, tasks):
+        """Оставить задачи, которые HTTP-предотбор считает кандидатами для браузера"""
+        if not self.prescreener or not tasks:
+            return tasks
+
+        groups = {}
+        for task in tasks:
+            groups.setdefault((task["page"], task["field_name"], task["kind"]), []).append(task)
+
+        keep = set()
+        for (page, field_name, kind), group in groups.items():
+            candidates = self.prescreener.screen(f"{self.base_url}{page}", field_name, kind,
+                                                 [(task["payload_index"], task["payload"]) for task in group])
+            for task in group:
+                if candidates is None:
+                    keep.add(id(task))  # форму не разобрали - проверяем все в браузере
+                    continue
+
+                reason = candidates.get(task["payload_index"])
+                if reason == "login_marker" and not self.is_bypass_payload(task["payload"]):
+                    reason = None
+                if reason:
+                    task["prescreen"] = reason
+                    keep.add(id(task))
+                else:
+                    # Отсеяна по ответу сервера - попытка завершена без находок, при --resume не повторяется
+                    self.journal.record_attempt(attempt_key(task), [])
+
+        selected = [task for task in tasks if id(task) in keep]
+        print(f"🧪 HTTP-предотбор: в браузер {len(selected)} из {len(tasks)} попыток")
+        return selected
+
+    def execute_task(self, driver, task):
+        """Выполнить задачу в указанном браузере; None - попытка завершилась ошибкой"""
+        if not self.scheduler.should_run(task):
+            return []  # поле уже подтверждено уязвимым для этого класса
+
+        try:
+            findings = self.run_payload_attempt(driver, task)
+        except Exception as e:
+            kind = "XSS" if task["kind"] == "xss" else "SQL Injection"
+            print(f"Ошибка тестирования {kind} с payload {task['payload_index'] + 1}: {e}")
+            # Ни в историю планировщика, ни в журнал не пишем: ошибка - не промах, попытка повторится
+            return None
+
+        self.scheduler.record(task, findings)
+        self.journal.record_attempt(attempt_key(task), findings)
+        return findings
+
+    def recover_driver(self):
+        """Заменить основной браузер, если он перестал отвечать; True - браузер заменен"""
+        if self.pool.is_healthy(self.driver):
             return False
 
+        print("⚠️ Браузер не отвечает, запускаем новый")
+        self.pool.release(self.driver, broken=True)
+        self.driver = None
+        self.driver = self.pool.acquire()
+        self.wait = WebDriverWait(self.driver, 10)
+        return True
+
+    def restore_journaled(self, tasks):
+        """Отделить задачи, завершенные в прошлом прогоне; вернуть (оставшиеся задачи, их прежние находки)"""
+        pending, findings = [], []
+        for task in tasks:
+            key = attempt_key(task)
+            if self.journal.is_done(key):
+                restored = self.journal.restore(key)
+                self.scheduler.restore(task, restored)
+                findings.extend(restored)
+            else:
+                pending.append(task)
+        return pending, findings
+
+    def run_payload_tasks(self, tasks):
+        """Выполнить поток задач порциями (последовательно или параллельно) и записать находки"""
+        findings = []
+        for chunk in iter_chunks(tasks, TASK_CHUNK_SIZE):
+            findings.extend(self.run_task_chunk(chunk))
+        return findings
+
+    def run_task_chunk(self, tasks):
+        """Порция задач: журнал, предотбор, план, выполнение, запись находок"""
+        tasks, findings = self.restore_journaled(tasks)
+        tasks = self.scheduler.plan(self.prescreen_tasks(tasks))
+
+        if self.workers > 1 and len(tasks) > 1:
+            executor = ParallelPayloadExecutor(self, self.workers)
+            findings.extend(executor.run(tasks))
+            self.skipped_tasks += executor.skipped
+        else:
+            for task in tasks:
+                task_findings = self.execute_task(self.driver, task)
+                if task_findings is None and self.recover_driver():
+                    task_findings = self.execute_task(self.driver, task)  # повтор на новом браузере
+                findings.extend(task_findings or [])
+
+        self.record_findings(findings)
+        return findings
+
     def test_xss_vulnerability(self, url_path="/", form_fields=None):
         """Тестирование XSS уязвимостей"""
         print(f"\n🔍 === ТЕСТИРОВАНИЕ XSS НА {url_path} ===")
 
-        target_url = f"{self.base_url}{url_path}"
-        self.driver.get(target_url)
-        time.sleep(2)
-        self.take_screenshot(f"xss_test_{url_path.replace('/', '_')}_before")
+        schema, fresh = self.page_schema(url_path)
+        if fresh:
+            self.take_screenshot(f"xss_test_{self.page_slug(url_path)}_before")
 
-        # Если не указаны конкретные поля, ищем все input поля
+        # Если не указаны конкретные поля, берем все текстовые поля из схемы
         if form_fields is None:
-            form_fields = self.driver.find_elements(By.CSS_SELECTOR,
-                                                    "input[type='text'], input[type='search'], textarea")
-
-        vulnerabilities_found = 0
+            form_fields = schema.fields_for("xss")
+        tasks = self.build_payload_tasks(url_path, "xss", form_fields, schema)
 
-        for field in form_fields:
-            field_name = field.get_attribute('name') or field.get_attribute('id') or 'unknown_field'
-            print(f"\n🎯 Тестируем поле: {field_name}")
-
-            for i, payload in enumerate(self.xss_payloads):
-                try:
-                    # Очищаем поле и вводим payload
-                    field.clear()
-                    field.send_keys(payload)
-
-                    # Пытаемся отправить форму
-                    submit_buttons = self.driver.find_elements(By.CSS_SELECTOR,
-                                                               "input[type='submit'], button[type='submit'], button:contains('Search'), button:contains('Submit')")
-
-                    if submit_buttons:
-                        submit_buttons[0].click()
-                        time.sleep(1)
-                    else:
-                        # Если нет кнопки submit, пробуем Enter
-                        from selenium.webdriver.common.keys import Keys
-                        field.send_keys(Keys.RETURN)
-                        time.sleep(1)
-
-                    # Проверяем на alert
-                    expected_text = f"XSS_TEST_{i + 1}"
-                    if self.check_for_alert(expected_text):
-                        vulnerabilities_found += 1
-                        self.take_screenshot(f"xss_vulnerability_found_{field_name}_{i}")
-
-                    # Проверяем консольные логи
-                    if self.check_console_logs():
-                        vulnerabilities_found += 1
-
-                    # Проверяем, отобразился ли payload на странице без экранирования
-                    page_source = self.driver.page_source
-                    if payload in page_source and "<script>" in payload:
-                        print(f"⚠️ Payload отображается на странице без экранирования: {payload[:50]}")
-                        self.test_results.append(f"🔥 XSS REFLECTED: {payload[:50]} в поле {field_name}")
-                        vulnerabilities_found += 1
-
-                    time.sleep(0.5)  # Небольшая пауза между тестами
-
-                except Exception as e:
-                    print(f"Ошибка тестирования XSS с payload {i + 1}: {e}")
-                    continue
+        print(f"🎯 Поля: {', '.join(sorted({self.field_label(field) for field in form_fields})) or 'нет'}")
+        vulnerabilities_found = len(self.run_payload_tasks(tasks))
 
         if vulnerabilities_found == 0:
             print("✅ XSS уязвимости не обнаружены в данной форме")
-            self.test_results.append(f"✅ XSS тест {url_path}: защищено")
+            self.test_results.add(SECURE, f"xss:{url_path}", f"XSS тест {url_path}: защищено")
         else:
             print(f"🚨 Обнаружено {vulnerabilities_found} потенциальных XSS уязвимостей!")
 
-        self.take_screenshot(f"xss_test_{url_path.replace('/', '_')}_after")
+        self.take_screenshot(f"xss_test_{self.page_slug(url_path)}_after")
         return vulnerabilities_found
 
     def test_sql_injection_vulnerability(self, url_path="/", form_fields=None):
         """Тестирование SQL Injection уязвимостей"""
         print(f"\n💉 === ТЕСТИРОВАНИЕ SQL INJECTION НА {url_path} ===")
 
-        target_url = f"{self.base_url}{url_path}"
-        self.driver.get(target_url)
-        time.sleep(2)
-        self.take_screenshot(f"sql_test_{url_path.replace('/', '_')}_before")
+        schema, fresh = self.page_schema(url_path)
+        if fresh:
+            self.take_screenshot(f"sql_test_{self.page_slug(url_path)}_before")
 
-        # Ищем поля для ввода
+        # Поля для ввода - из схемы страницы
         if form_fields is None:
-            form_fields = self.driver.find_elements(By.CSS_SELECTOR,
-                                                    "input[type='text'], input[type='password'], input[type='search']")
-
-        vulnerabilities_found = 0
-
-        for field in form_fields:
-            field_name = field.get_attribute('name') or field.get_attribute('id') or 'unknown_field'
-            print(f"\n🎯 Тестируем SQL injection в поле: {field_name}")
+            form_fields = schema.fields_for("sql")
+        tasks = self.build_payload_tasks(url_path, "sql", form_fields, schema)
 
-            for i, payload in enumerate(self.sql_payloads):
-                try:
-                    # Очищаем и вводим SQL payload
-                    field.clear()
-                    field.send_keys(payload)
-
-                    # Отправляем форму
-                    submit_buttons = self.driver.find_elements(By.CSS_SELECTOR,
-                                                               "input[type='submit'], button[type='submit'], button")
-
-                    if submit_buttons:
-                        submit_buttons[0].click()
-                        time.sleep(2)
-
-                    # Анализируем ответ на наличие SQL ошибок
-                    page_source = self.driver.page_source.lower()
-                    sql_error_indicators = [
-                        "mysql_fetch", "sql syntax", "mysqli_", "mysql error",
-                        "warning: mysql", "valid mysql result", "mysqlclient",
-                        "postgresql", "sqlite", "oracle", "odbc", "jdbc",
-                        "sqlstate", "syntax error", "invalid query", "database error"
-                    ]
-
-                    for error_indicator in sql_error_indicators:
-                        if error_indicator in page_source:
-                            print(f"🔥 SQL ERROR обнаружена: '{error_indicator}' с payload: {payload}")
-                            self.test_results.append(f"🔥 SQL INJECTION: {error_indicator} - {payload[:50]}")
-                            vulnerabilities_found += 1
-                            self.take_screenshot(f"sql_error_{field_name}_{i}")
-                            break
-
-                    # Проверяем на неожиданное поведение (например, вход без правильных credentials)
-                    if "welcome" in page_source or "dashboard" in page_source or "logout" in page_source:
-                        if "OR '1'='1" in payload or "OR 1=1" in payload:
-                            print(f"⚠️ Возможный SQL Injection bypass: успешный вход с payload {payload}")
-                            self.test_results.append(f"🔥 SQL BYPASS: успешный вход - {payload[:50]}")
-                            vulnerabilities_found += 1
-                            self.take_screenshot(f"sql_bypass_{field_name}_{i}")
-
-                    time.sleep(0.5)
-
-                except Exception as e:
-                    print(f"Ошибка тестирования SQL Injection с payload {i + 1}: {e}")
-                    continue
+        print(f"🎯 Поля для SQL injection: {', '.join(sorted({self.field_label(field) for field in form_fields})) or 'нет'}")
+        vulnerabilities_found = len(self.run_payload_tasks(tasks))
 
         if vulnerabilities_found == 0:
             print("✅ SQL Injection уязвимости не обнаружены")
-            self.test_results.append(f"✅ SQL тест {url_path}: защищено")
+            self.test_results.add(SECURE, f"sqli:{url_path}", f"SQL тест {url_path}: защищено")
         else:
             print(f"🚨 Обнаружено {vulnerabilities_found} потенциальных SQL Injection уязвимостей!")
 
-        self.take_screenshot(f"sql_test_{url_path.replace('/', '_')}_after")
+        self.take_screenshot(f"sql_test_{self.page_slug(url_path)}_after")
         return vulnerabilities_found
 
-    def test_login_security(self):
+    def test_login_security(self, login_paths=None):
         """Специальный тест безопасности страницы входа"""
         print("\n🔐 === ТЕСТИРОВАНИЕ БЕЗОПАСНОСТИ ЛОГИНА ===")
 
         # Ищем страницу входа
-        login_paths = ["/login.php", "/admin/", "/login/", "/signin/"]
+        login_paths = login_paths or DEFAULT_LOGIN_PATHS
 
         for path in login_paths:
             try:
-                self.driver.get(f"{self.base_url}{path}")
-                time.sleep(2)
+                schema, _ = self.page_schema(path)
 
                 # Ищем поля username и password
-                username_field = None
-                password_field = None
+                username_fields = schema.fields_for("login_user")
+                password_fields = schema.fields_for("login_pass")
 
                 try:
-                    username_field = self.driver.find_element(By.CSS_SELECTOR,
-                                                              "input[name*='user'], input[name*='login'], input[name*='email'], input[type='text']")
-                    password_field = self.driver.find_element(By.CSS_SELECTOR,
-                                                              "input[name*='pass'], input[type='password']")
+                    if not username_fields or not password_fields:
+                        continue
+
+                    username_field = username_fields[0]
+                    password_field = password_fields[0]
+                    login_button_selector = schema.submit_for(password_field)
 
                     print(f"✅ Найдена страница входа: {path}")
 
@@ -318,35 +653,47 @@ class SecurityTestSuite:
                     ]
 
                     for username, password in dangerous_credentials:
-                        try:
-                            username_field.clear()
-                            password_field.clear()
-
-                            username_field.send_keys(username)
-                            password_field.send_keys(password)
+                        key = login_key(path, username, password)
+                        if self.journal.is_done(key):
+                            self.record_findings(self.journal.restore(key))
+                            continue
 
-                            # Ищем кнопку входа
-                            login_button = self.driver.find_element(By.CSS_SELECTOR,
-                                                                    "input[type='submit'], button[type='submit'], button")
-                            login_button.click()
+                        try:
+                            self.open_page(self.driver, f"{self.base_url}{path}")
+                            fill_text(self.driver.find_element(By.CSS_SELECTOR, username_field["selector"]), username)
+                            fill_text(self.driver.find_element(By.CSS_SELECTOR, password_field["selector"]), password)
 
-                            time.sleep(2)
+                            # Кнопка входа - из схемы формы
+                            login_button = self.driver.find_element(By.CSS_SELECTOR, login_button_selector)
+                            with governed_submit(self.governor, self.driver, f"{self.base_url}{path}"):
+                                token = mark_document(self.driver)
+                                login_button.click()
+                                wait_for_page_ready(self.driver, timeout=5, navigated_from=token)
 
                             # Проверяем результат
-                            page_source = self.driver.page_source.lower()
+                            hits = self.matcher.match_page(self.driver)
+                            findings = []
 
-                            if any(success_indicator in page_source for success_indicator in
-                                   ["welcome", "dashboard", "logout", "profile", "admin panel"]):
+                            if hits.get("login_success"):
                                 print(f"🔥 SQL INJECTION УСПЕШЕН! Логин: {username}, Пароль: {password}")
-                                self.test_results.append(f"🔥 LOGIN BYPASS: {username} / {password}")
-                                self.take_screenshot(f"login_bypass_success")
+                                screenshot = self.take_screenshot(f"login_bypass_success")
+                                findings.append(self.make_finding(VULNERABLE, "login_bypass", (path, None),
+                                                                  f"LOGIN BYPASS: {username} / {password}",
+                                                                  artifacts=[screenshot], username=username,
+                                                                  password=password,
+                                                                  payload=f"{username} / {password}"))
 
                             # Проверяем SQL ошибки
-                            sql_errors = ["mysql", "sql syntax", "database error", "sqlstate"]
-                            if any(error in page_source for error in sql_errors):
+                            if hits.get("login_sql_error"):
                                 print(f"⚠️ SQL ошибка при входе с: {username} / {password}")
-                                self.test_results.append(f"⚠️ LOGIN SQL ERROR: {username}")
-                                self.take_screenshot(f"login_sql_error")
+                                screenshot = self.take_screenshot(f"login_sql_error")
+                                findings.append(self.make_finding(WARNING, "login_sql_error", (path, None),
+                                                                  f"LOGIN SQL ERROR: {username}",
+                                                                  artifacts=[screenshot], username=username,
+                                                                  payload=f"{username} / {password}"))
+
+                            self.record_findings(findings)
+                            self.journal.record_attempt(key, findings)
 
                         except Exception as e:
                             print(f"Ошибка тестирования логина: {e}")
@@ -364,20 +711,18 @@ class SecurityTestSuite:
             except:
                 continue
 
-    def test_search_functionality(self):
+    def test_search_functionality(self, search_paths=None):
         """Тестирование функции поиска"""
         print("\n🔍 === ТЕСТИРОВАНИЕ БЕЗОПАСНОСТИ ПОИСКА ===")
 
-        search_paths = ["/search.php", "/", "/index.php", "/search/"]
+        search_paths = search_paths or DEFAULT_SEARCH_PATHS
 
         for path in search_paths:
             try:
-                self.driver.get(f"{self.base_url}{path}")
-                time.sleep(2)
+                schema, _ = self.page_schema(path)
 
                 # Ищем поле поиска
-                search_fields = self.driver.find_elements(By.CSS_SELECTOR,
-                                                          "input[type='search'], input[name*='search'], input[name*='q'], input[placeholder*='search']")
+                search_fields = schema.fields_for("search")
 
                 if search_fields:
                     print(f"✅ Найдена функция поиска на: {path}")
@@ -402,25 +747,37 @@ class SecurityTestSuite:
         print("🛡️ ЗАПУСК КОМПЛЕКСНОГО SECURITY ТЕСТИРОВАНИЯ")
         print("=" * 60)
         print(f"🎯 Целевой сайт: {self.base_url}")
-        print(f"📋 XSS payloads: {len(self.xss_payloads)}")
-        print(f"💉 SQL payloads: {len(self.sql_payloads)}")
+        print(f"📋 XSS payloads: {self.payload_count('xss')}")
+        print(f"💉 SQL payloads: {self.payload_count('sql')}")
+        print(f"⚡ Параллельных браузеров: {self.workers}")
         print("=" * 60)
 
         if not self.setup_driver():
             return False
 
+        # Сканирование началось - только теперь журнал открывается (без --resume - перезаписывается)
+        self.journal.start()
+
         try:
             # Тестируем главную страницу
-            self.driver.get(self.base_url)
-            time.sleep(3)
+            self.open_page(self.driver, self.base_url)
             self.take_screenshot("00_target_site_loaded")
 
+            # Цели: из обхода сайта, а если он выключен или пуст - списки по умолчанию
+            search_paths = login_paths = test_pages = None
+            if self.crawl and self.discover_targets():
+                search_paths = self.inventory_paths(lambda form: any(
+                    field_type == "search" or "search" in name.lower() or name.lower() in ("q", "query")
+                    for name, field_type in form["types"].items()))
+                login_paths = self.inventory_paths(lambda form: "password" in form["types"].values())
+                test_pages = self.unique_form_pages()
+
             # Запускаем все тесты безопасности
-            self.test_search_functionality()
-            self.test_login_security()
+            self.test_search_functionality(search_paths)
+            self.test_login_security(login_paths)
 
             # Тестируем другие возможные страницы
-            test_pages = ["/", "/search.php", "/categories.php", "/artists.php"]
+            test_pages = test_pages or DEFAULT_TEST_PAGES
 
             for page in test_pages:
                 try:
@@ -440,32 +797,42 @@ class SecurityTestSuite:
 
         finally:
             self.cleanup()
+            flush_screenshots()
             self.print_security_report()
 
+    def format_finding(self, entry):
+        """Строка отчета для уникальной находки"""
+        where = f" [{entry['parameter']}]" if entry["parameter"] else ""
+        detectors = ", ".join(sorted(entry["detectors"]))
+        return (f"{entry['class'].upper()} {entry['url']}{where}: срабатываний {entry['hits']} ({detectors}), "
+                f"первый payload: {str(entry['first_payload'])[:50]}")
+
     def print_security_report(self):
         """Вывод отчета по безопасности"""
         print("\n" + "=" * 60)
         print("🛡️ ОТЧЕТ ПО БЕЗОПАСНОСТИ")
         print("=" * 60)
 
-        vulnerabilities = [result for result in self.test_results if "🔥" in result]
-        warnings = [result for result in self.test_results if "⚠️" in result]
-        secure_tests = [result for result in self.test_results if "✅" in result]
+        # Оценка - по уникальным находкам (URL, параметр, класс), а не по числу срабатываний payload'ов
+        vulnerabilities = self.findings.by_status(VULNERABLE)
+        warnings = self.findings.by_status(WARNING)
 
         print(f"🔥 КРИТИЧЕСКИЕ УЯЗВИМОСТИ: {len(vulnerabilities)}")
         print(f"⚠️ ПРЕДУПРЕЖДЕНИЯ: {len(warnings)}")
-        print(f"✅ ЗАЩИЩЕННЫЕ КОМПОНЕНТЫ: {len(secure_tests)}")
-        print(f"📊 ВСЕГО ПРОВЕРОК: {len(self.test_results)}")
+        print(f"✅ ЗАЩИЩЕННЫЕ КОМПОНЕНТЫ: {self.test_results.count(SECURE)}")
+        print(f"📊 ВСЕГО ПРОВЕРОК: {len(self.test_results)} (срабатываний: {self.findings.hits})")
+        if self.skipped_tasks:
+            print(f"⏭️ НЕ ВЫПОЛНЕНО ЗАДАЧ: {self.skipped_tasks} - отчет неполный (продолжить: --resume)")
 
         if vulnerabilities:
             print(f"\n🚨 ОБНАРУЖЕНЫ КРИТИЧЕСКИЕ УЯЗВИМОСТИ:")
             for vuln in vulnerabilities:
-                print(f"  {vuln}")
+                print(f"  {self.format_finding(vuln)}")
 
         if warnings:
             print(f"\n⚠️ ПРЕДУПРЕЖДЕНИЯ:")
             for warn in warnings:
-                print(f"  {warn}")
+                print(f"  {self.format_finding(warn)}")
 
         if len(vulnerabilities) == 0 and len(warnings) == 0:
             print("\n🎉 ПОЗДРАВЛЯЕМ! Критических уязвимостей не обнаружено.")
@@ -485,13 +852,45 @@ class SecurityTestSuite:
             print("🔴 СЛАБАЯ ЗАЩИТА - ТРЕБУЕТСЯ ВМЕШАТЕЛЬСТВО!")
 
         print(f"\n📸 Скриншоты сохранены в: {SCREENSHOTS_DIR}")
+
+        self.test_results.close()
+        junit_path = self.test_results.export_junit()
+        self.findings.flush()
+        print(f"📄 JSONL: {self.test_results.jsonl_path}")
+        print(f"📄 JUnit XML: {junit_path}")
+        print(f"📄 Находки: {self.findings.json_path}, SARIF: {self.findings.sarif_path}")
         print("=" * 60)
 
     def cleanup(self):
         """Очистка ресурсов"""
         if self.driver:
-            self.driver.quit()
-            print("🔒 Браузер безопасности закрыт")
+            self.pool.release(self.driver)
+            self.driver = None
+            print("🔒 Браузер безопасности возвращен в пул")
+
+        if self.prescreener:
+            print(f"🧪 HTTP-запросов предотбора: {self.prescreener.requests_sent}")
+            self.prescreener.close()
+
+        for host, stats in self.governor.stats().items():
+            print(f"🚦 {host}: запросов {stats['requests']}, итоговая частота {stats['rate']}/с, откатов {stats['backoffs']}")
+
+        print(f"🧾 Схемы форм: разобрано {self.schemas.extractions}, из кэша {self.schemas.hits}")
+
+        saved = self.scheduler.saved
+        print(f"🧭 Попыток выполнено: {self.scheduler.executed}, сэкономлено: {self.scheduler.saved_total()} "
+              f"(тип поля: {saved['field_type']}, maxlength: {saved['maxlength']}, "
+              f"после находки: {saved['after_finding']})")
+        try:
+            self.scheduler.save()
+        except OSError as e:
+            print(f"⚠️ Не удалось сохранить историю payload'ов: {e}")
+
+        if self.journal.restored:
+            print(f"📓 Из журнала восстановлено попыток: {self.journal.restored}")
+        if self.journal.started:
+            print(f"📓 Журнал сканирования: {self.journal.path} (продолжить: --resume)")
+        self.journal.close()
 
 
 if __name__ == "__main__":
@@ -499,8 +898,31 @@ if __name__ == "__main__":
     print("Тестирование XSS и SQL Injection уязвимостей")
     print("=" * 50)
 
+    parser = argparse.ArgumentParser(description="Security тестирование XSS и SQL Injection")
+    parser.add_argument("--base-url", default="http://testphp.vulnweb.com", help="целевой сайт (для локального стенда - его адрес)")
+    parser.add_argument("--workers", type=int, default=1, help="число параллельных браузеров")
+    parser.add_argument("--rps", type=float, default=4, help="стартовая частота запросов в секунду к одному хосту (0 - без лимита)")
+    parser.add_argument("--max-rps", type=float, help="потолок адаптивной частоты (по умолчанию 4 x --rps)")
+    parser.add_argument("--no-prescreen", action="store_true", help="проверять каждый payload в браузере")
+    parser.add_argument("--crawl-rps", type=float, help="частота запросов краулера (0 - без лимита; по умолчанию "
+                                                         "20, для localhost - без лимита)")
+    parser.add_argument("--no-crawl", action="store_true", help="не обходить сайт, использовать списки страниц по умолчанию")
+    parser.add_argument("--max-pages", type=int, default=300, help="лимит страниц при обходе")
+    parser.add_argument("--max-depth", type=int, default=3, help="лимит глубины ссылок при обходе")
+    parser.add_argument("--payloads", action="append", default=[], help="файл корпуса payload'ов (.txt/.jsonl), можно несколько")
+    parser.add_argument("--payload-tags", help="теги через запятую: брать только payload'ы с этими тегами")
+    parser.add_argument("--payload-budget", type=int, help="максимум payload'ов каждого класса")
+    parser.add_argument("--resume", action="store_true", help="продолжить прерванный прогон по журналу, не повторяя завершенное")
+    args = parser.parse_args()
+
     # Запуск тестирования
-    security_test = SecurityTestSuite()
+    security_test = SecurityTestSuite(workers=args.workers, requests_per_second=args.rps,
+                                      max_requests_per_second=args.max_rps,
+                                      prescreen=not args.no_prescreen, crawl=not args.no_crawl,
+                                      max_pages=args.max_pages, max_depth=args.max_depth,
+                                      payload_files=args.payloads, payload_budget=args.payload_budget,
+                                      payload_tags=args.payload_tags.split(",") if args.payload_tags else None,
+                                      base_url=args.base_url, resume=args.resume, crawl_rps=args.crawl_rps)
     security_test.run_comprehensive_security_test()
 
     print("\n🎯 Security тестирование завершено!")
@@ -5,39 +5,72 @@
 - Копирование/вставка данных
 - Ротация прокси для смены геолокации
 - Интеграция с Tor для анонимности
+- Данные формы генерируются по локали страны прокси и воспроизводятся по seed
 """
 
 import os
 import time
 import random
-import json
-import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import pyperclip  # Для работы с буфером обмена
+from driver_pool import get_pool
+from driver_resolver import make_chrome_service
+from page_waits import mark_document, wait_for_page_ready
+from rate_governor import get_governor, governed_navigate, governed_submit
+from proxy_probe import ProxyProber, proxy_key
+from ip_verifier import get_ip_verifier
+from field_resolver import FieldResolver
+from submit_finder import SubmitFinder
+from form_data_generator import FormDataGenerator, locale_for_country
+from input_strategies import fill_text, is_fast_mode
+from screenshot_writer import capture, flush_screenshots
+from result_store import ResultStore, PASS, FAIL
 
 # Отключаем SSL проверки
 os.environ['WDM_SSL_VERIFY'] = '0'
 
 
+# Поля записи генератора, которые заполняются в форме
+FORM_FIELDS = ("first_name", "last_name", "email", "phone", "address", "company", "zip_code", "city")
+# Поля, без которых форма не считается отрисованной
+EXPECTED_FIELDS = ("first_name", "last_name", "email")
+
+
 class GeoProxyFormTester:
     """Класс для тестирования форм с прокси и геолокацией"""
 
-    def __init__(self):
+    def __init__(self, stream_results=True, data_seed=None):
         self.driver = None
         self.wait = None
+        self.pool = None
         self.current_proxy = None
         self.current_country = None
         self.screenshots_dir = "geo_form_screenshots"
-        self.test_results = []
+        self.test_results = ResultStore("geo_form", stream=stream_results)
+        self.screenshots = []
+        self.results_lock = threading.Lock()
+
+        # Темп обращений к каждому хосту - общий для всех воркеров процесса, вместо пауз между прокси
+        self.governor = get_governor("geo", requests_per_second=0.5, max_in_flight=2, max_rate=4)
+
+        # IP и страна маршрута проверяются HTTP-клиентом; сессии и кэш общие для воркеров
+        self.ip_verifier = get_ip_verifier()
+
+        # Кнопка отправки ищется относительно формы заполненных полей, с кэшем по сигнатуре формы
+        self.submit_finder = SubmitFinder()
+        self.form_anchor = None
+
+        # Буфер обмена общий для всей системы - в параллельном режиме отключается
+        self.clipboard_enabled = True
 
         # Создаем папки
         os.makedirs(self.screenshots_dir, exist_ok=True)
@@ -70,49 +103,11 @@ class GeoProxyFormTester:
             },
         ]
 
-        # Данные для заполнения формы по странам
-        self.form_data_by_country = {
-            "US": {
-                "first_name": "John",
-                "last_name": "Smith",
-                "email": "john.smith.us@example.com",
-                "phone": "+1 (555) 123-4567",
-                "address": "123 Main Street, New York, NY 10001",
-                "company": "American Corp LLC",
-                "zip_code": "10001",
-                "city": "New York"
-            },
-            "UK": {
-                "first_name": "James",
-                "last_name": "Wilson",
-                "email": "james.wilson.uk@example.com",
-                "phone": "+44 20 7946 0958",
-                "address": "45 Baker Street, London, W1U 6TW",
-                "company": "British Ltd",
-                "zip_code": "W1U 6TW",
-                "city": "London"
-            },
-            "IN": {
-                "first_name": "Raj",
-                "last_name": "Patel",
-                "email": "raj.patel.in@example.com",
-                "phone": "+91 98765 43210",
-                "address": "MG Road, Bangalore, Karnataka 560001",
-                "company": "Indian Tech Solutions",
-                "zip_code": "560001",
-                "city": "Bangalore"
-            },
-            "BR": {
-                "first_name": "Carlos",
-                "last_name": "Silva",
-                "email": "carlos.silva.br@example.com",
-                "phone": "+55 11 99999-8888",
-                "address": "Av. Paulista, 1000, São Paulo, SP 01310-100",
-                "company": "Brasil Empresa Ltda",
-                "zip_code": "01310-100",
-                "city": "São Paulo"
-            }
-        }
+        # Данные для формы генерируются по локали страны прокси; тот же seed - те же данные прогона
+        self.form_data = FormDataGenerator(
+            seed=data_seed,
+            locales=sorted({locale_for_country(proxy["country"]) for proxy in self.proxy_pool})
+        )
 
         # Настройки Tor (для более продвинутой анонимности)
         self.tor_config = {
@@ -171,8 +166,18 @@ class GeoProxyFormTester:
         options.add_experimental_option("prefs", prefs)
 
         try:
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
+            # Прокси задается при запуске Chrome, поэтому пул - отдельный на каждый маршрут;
+            # маршрут используется один раз, и release_driver закрывает его пул
+            if use_tor:
+                pool_key = "geo:tor"
+            elif proxy_info:
+                pool_key = f"geo:{proxy_info['ip']}:{proxy_info['port']}"
+            else:
+                pool_key = "geo:direct"
+
+            self.pool = get_pool(pool_key, lambda: webdriver.Chrome(
+                service=make_chrome_service(), options=options), size=1)
+            self.driver = self.pool.acquire()
             self.wait = WebDriverWait(self.driver, 15)
 
             # Скрываем автоматизацию
@@ -187,63 +192,53 @@ class GeoProxyFormTester:
 
         except Exception as e:
             print(f"❌ Ошибка запуска браузера: {e}")
+            self.release_driver()
             return False
 
+    def release_driver(self):
+        """Закрыть браузер маршрута после теста"""
+        if self.driver:
+            self.pool.release(self.driver)
+            self.driver = None
+        # Каждый маршрут проверяется один раз за прогон - простаивающий Chrome в пуле не нужен
+        if self.pool:
+            self.pool.shutdown()
+            self.pool = None
+            print("🔒 Браузер маршрута закрыт")
+
+    def route_proxy_url(self):
+        """Прокси-URL текущего маршрута браузера для HTTP-клиента (None - напрямую)"""
+        if self.current_country == 'TOR':
+            return f"socks5h://127.0.0.1:{self.tor_config['socks_port']}"
+        if self.current_proxy:
+            return f"http://{self.current_proxy['ip']}:{self.current_proxy['port']}"
+        return None
+
     def verify_ip_and_location(self):
-        """Проверка IP адреса и геолокации"""
+        """Проверка IP адреса и геолокации (HTTP-клиентом через тот же маршрут, без переходов браузера)"""
         print("\n🔍 Проверка IP и геолокации...")
 
         try:
-            # Проверяем IP через несколько сервисов
-            ip_services = [
-                "https://httpbin.org/ip",
-                "https://api.ipify.org?format=json",
-                "https://ipinfo.io/json"
-            ]
-
-            for service in ip_services:
-                try:
-                    self.driver.get(service)
-                    time.sleep(3)
-
-                    # Получаем JSON ответ
-                    body = self.driver.find_element(By.TAG_NAME, "body").text
-
-                    if "httpbin.org" in service:
-                        import json
-                        data = json.loads(body)
-                        ip = data.get("origin", "Unknown")
-                        print(f"📍 IP (httpbin): {ip}")
-
-                    elif "ipify" in service:
-                        data = json.loads(body)
-                        ip = data.get("ip", "Unknown")
-                        print(f"📍 IP (ipify): {ip}")
-
-                    elif "ipinfo.io" in service:
-                        data = json.loads(body)
-                        ip = data.get("ip", "Unknown")
-                        country = data.get("country", "Unknown")
-                        city = data.get("city", "Unknown")
-                        region = data.get("region", "Unknown")
-
-                        print(f"📍 IP (ipinfo): {ip}")
-                        print(f"🌍 Страна: {country}")
-                        print(f"🏙️ Город: {city}, {region}")
-
-                        # Проверяем соответствие ожидаемой стране
-                        if self.current_proxy and country != self.current_proxy.get('country'):
-                            print(f"⚠️ Предупреждение: ожидали {self.current_proxy['country']}, получили {country}")
-                        else:
-                            print("✅ Геолокация соответствует прокси")
-
-                        break
+            # Все сервисы опрашиваются параллельно, результат кэшируется на маршрут
+            result = self.ip_verifier.verify(self.route_proxy_url())
+            if result is None:
+                print("❌ Ни один IP-сервис не ответил")
+                return False
 
-                except Exception as e:
-                    print(f"⚠️ Ошибка с сервисом {service}: {e}")
-                    continue
+            source = "кэш" if result["cached"] else f"{result['elapsed_ms']} мс"
+            print(f"📍 IP: {result['ip']} ({result['service']}, {source})")
+
+            country = result["country"] or "Unknown"
+            if result["country"]:
+                print(f"🌍 Страна: {country}")
+                print(f"🏙️ Город: {result['city'] or 'Unknown'}, {result['region'] or 'Unknown'}")
+
+            # Проверяем соответствие ожидаемой стране
+            if self.current_proxy and country != self.current_proxy.get('country'):
+                print(f"⚠️ Предупреждение: ожидали {self.current_proxy['country']}, получили {country}")
+            else:
+                print("✅ Геолокация соответствует прокси")
 
-            self.take_screenshot("ip_verification")
             return True
 
         except Exception as e:
@@ -253,12 +248,10 @@ class GeoProxyFormTester:
     def take_screenshot(self, name):
         """Создание скриншота"""
         if self.driver:
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
             country = self.current_country or "unknown"
-            filename = f"{name}_{country}_{timestamp}.png"
-            filepath = os.path.join(self.screenshots_dir, filename)
-            self.driver.save_screenshot(filepath)
-            print(f"📸 Скриншот: {filename}")
+            filepath = capture(self.driver, self.screenshots_dir, f"{name}_{country}")
+            self.screenshots.append(filepath)
+            print(f"📸 Скриншот: {os.path.basename(filepath)}")
             return filepath
         return None
 
@@ -271,6 +264,11 @@ class GeoProxyFormTester:
             'very_fast': (0.01, 0.03)
         }
 
+        if is_fast_mode():
+            # CI/нагрузочные прогоны: вся строка за один вызов
+            fill_text(element, text)
+            return
+
         min_delay, max_delay = speeds.get(typing_speed, speeds['normal'])
 
         element.clear()
@@ -282,6 +280,17 @@ class GeoProxyFormTester:
         """Копирование и вставка данных через буфер обмена"""
         print(f"📋 Копируем и вставляем: {text[:30]}...")
 
+        if is_fast_mode():
+            # Без системного буфера обмена и фиксированных пауз
+            fill_text(element, text)
+            return
+
+        if not self.clipboard_enabled:
+            # Параллельные воркеры не должны делить системный буфер обмена
+            element.clear()
+            element.send_keys(text)
+            return
+
         # Копируем в буфер обмена
         pyperclip.copy(text)
 
@@ -293,6 +302,11 @@ class GeoProxyFormTester:
         element.send_keys(Keys.CONTROL + 'v')
         time.sleep(0.5)
 
+    def form_data_for(self, country=None):
+        """Следующая запись для формы: локаль страны прокси или случайная локаль пула"""
+        record = self.form_data.one(locale_for_country(country) if country else None)
+        return {field: record[field] for field in FORM_FIELDS}, record["country"]
+
     def fill_form_with_mixed_input(self, form_data):
         """Заполнение формы смешанными методами ввода"""
         print(f"\n📝 Заполнение формы для страны: {self.current_country}")
@@ -322,30 +336,27 @@ class GeoProxyFormTester:
         }
 
         filled_fields = 0
+        self.form_anchor = None
+
+        # Все поля ищутся одним запросом; ждем только найденные, но еще скрытые или недоступные
+        resolver = FieldResolver(self.driver, field_selectors)
+        # Появления в DOM ждем только для основных полей; необязательные (company, zip...) - без ожидания
+        ready, missing, not_ready = resolver.resolve_ready([name for name in form_data if name in field_selectors],
+                                                           wait_for=EXPECTED_FIELDS)
+        for field_name in missing:
+            print(f"⚠️ Поле {field_name} не найдено")
+        for field_name in not_ready:
+            print(f"⚠️ Поле {field_name} найдено, но недоступно для ввода")
 
         for field_name, field_value in form_data.items():
-            if field_name in field_selectors:
+            if field_name in ready:
                 try:
-                    # Ищем поле
-                    selectors = field_selectors[field_name].split(', ')
-                    element = None
-
-                    for selector in selectors:
-                        try:
-                            element = self.wait.until(
-                                EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                            )
-                            break
-                        except:
-                            continue
-
-                    if not element:
-                        print(f"⚠️ Поле {field_name} не найдено")
-                        continue
+                    element = ready[field_name]["element"]
 
                     # Прокручиваем к элементу
-                    self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                    time.sleep(0.5)
+                    if not is_fast_mode():
+                        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+                        time.sleep(0.5)
 
                     # Применяем метод ввода
                     input_method = input_methods.get(field_name, 'type_normal')
@@ -357,10 +368,12 @@ class GeoProxyFormTester:
                         self.human_type(element, field_value, speed)
 
                     filled_fields += 1
+                    self.form_anchor = self.form_anchor or element
                     print(f"✅ {field_name}: {field_value}")
 
                     # Случайная пауза между полями
-                    time.sleep(random.uniform(0.5, 2.0))
+                    if not is_fast_mode():
+                        time.sleep(random.uniform(0.5, 2.0))
 
                 except Exception as e:
                     print(f"❌ Ошибка заполнения {field_name}: {e}")
@@ -369,9 +382,10 @@ class GeoProxyFormTester:
         print(f"📊 Заполнено полей: {filled_fields}/{len(form_data)}")
         return filled_fields > 0
 
-    def test_form_with_proxy(self, proxy_info, target_url):
+    def test_form_with_proxy(self, proxy_info, target_url, form_data=None):
         """Тестирование формы с конкретным прокси"""
         print(f"\n🌍 === ТЕСТИРОВАНИЕ С ПРОКСИ {proxy_info['name']} ===")
+        started = time.perf_counter()
 
         # Настраиваем браузер с прокси
         if not self.setup_driver_with_proxy(proxy_info):
@@ -383,16 +397,13 @@ class GeoProxyFormTester:
 
             # Переходим на тестовый сайт
             print(f"🌐 Переходим на: {target_url}")
-            self.driver.get(target_url)
-            time.sleep(3)
+            governed_navigate(self.governor, self.driver, target_url)
 
             self.take_screenshot("01_page_loaded")
 
             # Получаем данные для текущей страны
-            form_data = self.form_data_by_country.get(
-                proxy_info['country'],
-                self.form_data_by_country['US']  # По умолчанию US
-            )
+            if form_data is None:
+                form_data = self.form_data_for(proxy_info['country'])[0]
 
             # Заполняем форму
             success = self.fill_form_with_mixed_input(form_data)
@@ -400,58 +411,47 @@ class GeoProxyFormTester:
             if success:
                 self.take_screenshot("02_form_filled")
 
-                # Ищем и нажимаем кнопку отправки
-                submit_buttons = [
-                    "button[type='submit']",
-                    "input[type='submit']",
-                    "button:contains('Submit')",
-                    "button:contains('Send')",
-                    ".submit-btn",
-                    "#submit"
-                ]
-
-                for selector in submit_buttons:
+                # Лучшая кнопка отправки для формы заполненных полей - одним скриптом в странице
+                submit = self.submit_finder.find(self.driver, self.form_anchor)
+                if submit:
                     try:
-                        if 'contains' not in selector:
-                            submit_btn = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        else:
-                            # XPath для contains
-                            xpath = selector.replace('button:contains', '//button[contains(text()').replace("')", "')]")
-                            submit_btn = self.driver.find_element(By.XPATH, xpath)
+                        print(f"📤 Отправляем форму ({submit['selector']})...")
+                        submit_btn = submit["element"]
 
-                        if submit_btn.is_displayed() and submit_btn.is_enabled():
-                            print("📤 Отправляем форму...")
+                        # Прокручиваем к кнопке
+                        self.driver.execute_script("arguments[0].scrollIntoView(true);", submit_btn)
+                        time.sleep(1)
 
-                            # Прокручиваем к кнопке
-                            self.driver.execute_script("arguments[0].scrollIntoView(true);", submit_btn)
-                            time.sleep(1)
-
-                            # Нажимаем кнопку
+                        # Нажимаем кнопку (отправка тоже идет через регулятор хоста)
+                        with governed_submit(self.governor, self.driver):
+                            token = mark_document(self.driver)
                             submit_btn.click()
-                            time.sleep(3)
-
-                            self.take_screenshot("03_form_submitted")
-                            print("✅ Форма отправлена успешно!")
+                            wait_for_page_ready(self.driver, navigated_from=token)
 
-                            break
+                        self.take_screenshot("03_form_submitted")
+                        print("✅ Форма отправлена успешно!")
                     except Exception as e:
-                        continue
-
-                self.test_results.append({
-                    'country': proxy_info['name'],
-                    'proxy': f"{proxy_info['ip']}:{proxy_info['port']}",
-                    'success': True,
-                    'fields_filled': len(form_data)
-                })
+                        print(f"⚠️ Не удалось отправить форму: {e}")
+                else:
+                    print("⚠️ Кнопка отправки не найдена")
+
+                self.test_results.add(
+                    PASS, f"geo:{proxy_info['country']}", proxy_info['name'],
+                    duration=time.perf_counter() - started,
+                    country=proxy_info['name'],
+                    proxy=f"{proxy_info['ip']}:{proxy_info['port']}",
+                    fields_filled=len(form_data)
+                )
 
             else:
                 print("❌ Не удалось заполнить форму")
-                self.test_results.append({
-                    'country': proxy_info['name'],
-                    'proxy': f"{proxy_info['ip']}:{proxy_info['port']}",
-                    'success': False,
-                    'fields_filled': 0
-                })
+                self.test_results.add(
+                    FAIL, f"geo:{proxy_info['country']}", proxy_info['name'],
+                    duration=time.perf_counter() - started,
+                    country=proxy_info['name'],
+                    proxy=f"{proxy_info['ip']}:{proxy_info['port']}",
+                    fields_filled=0
+                )
 
             return success
 
@@ -461,9 +461,7 @@ class GeoProxyFormTester:
             return False
 
         finally:
-            if self.driver:
-                self.driver.quit()
-                print("🔒 Браузер закрыт")
+            self.release_driver()
 
     def test_form_with_tor(self, target_url):
         """Тестирование формы через Tor"""
@@ -498,15 +496,12 @@ class GeoProxyFormTester:
 
             # Переходим на тестовый сайт
             print(f"🌐 Переходим на: {target_url}")
-            self.driver.get(target_url)
-            time.sleep(5)  # Tor может быть медленнее
+            governed_navigate(self.governor, self.driver, target_url, timeout=30)  # Tor может быть медленнее
 
             self.take_screenshot("tor_01_page_loaded")
 
             # Используем случайные данные для Tor
-            countries = list(self.form_data_by_country.keys())
-            random_country = random.choice(countries)
-            form_data = self.form_data_by_country[random_country]
+            form_data, random_country = self.form_data_for()
 
             print(f"🎲 Используем данные для: {random_country}")
 
@@ -517,12 +512,12 @@ class GeoProxyFormTester:
                 self.take_screenshot("tor_02_form_filled")
                 print("✅ Форма заполнена через Tor!")
 
-                self.test_results.append({
-                    'country': 'TOR Network',
-                    'proxy': 'SOCKS5://127.0.0.1:9150',
-                    'success': True,
-                    'fields_filled': len(form_data)
-                })
+                self.test_results.add(
+                    PASS, "geo:TOR", "TOR Network",
+                    country='TOR Network',
+                    proxy='SOCKS5://127.0.0.1:9150',
+                    fields_filled=len(form_data)
+                )
 
             return success
 
@@ -531,34 +526,108 @@ class GeoProxyFormTester:
             return False
 
         finally:
-            if self.driver:
-                self.driver.quit()
-                print("🔒 Браузер закрыт")
+            self.release_driver()
 
-    def run_comprehensive_geo_test(self, target_url):
+    def run_proxy_isolated(self, proxy_info, target_url, form_data=None):
+        """Прогон одного прокси в отдельном тестировщике со своим браузером"""
+        worker = GeoProxyFormTester(stream_results=False)
+        worker.screenshots_dir = self.screenshots_dir
+        worker.clipboard_enabled = False
+        worker.submit_finder = self.submit_finder  # кэш кнопок по сигнатуре формы общий для воркеров
+
+        try:
+            worker.test_form_with_proxy(proxy_info, target_url, form_data)
+        finally:
+            # Пул маршрута воркера закрывается в любом случае - простаивающие браузеры не копятся
+            worker.release_driver()
+        return list(worker.test_results), worker.screenshots
+
+    def run_parallel_proxy_tests(self, target_url, workers):
+        """Параллельный прогон пула прокси: каждый воркер - свой браузер и прокси"""
+        print(f"⚡ Параллельный режим: {workers} воркеров")
+
+        collected = {}
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                # Данные выдаются здесь по порядку пула - как в последовательном режиме, независимо от потоков
+                executor.submit(self.run_proxy_isolated, proxy, target_url,
+                                self.form_data_for(proxy['country'])[0]): i
+                for i, proxy in enumerate(self.proxy_pool)
+            }
+
+            for future in as_completed(futures):
+                i = futures[future]
+                proxy = self.proxy_pool[i]
+                try:
+                    collected[i] = future.result()
+                except Exception as e:
+                    print(f"⚠️ Прокси {proxy['name']} завершился с ошибкой: {e}")
+                    collected[i] = ([], [])
+
+                if not any(r.status == PASS for r in collected[i][0]):
+                    print(f"⚠️ Прокси {proxy['name']} не работает")
+
+        # Сливаем результаты в порядке пула, чтобы отчет не зависел от порядка завершения
+        with self.results_lock:
+            for i in sorted(collected):
+                results, screenshots = collected[i]
+                self.test_results.extend(results)
+                self.screenshots.extend(screenshots)
+
+    def preflight_proxies(self, target_url):
+        """Опросить весь пул без браузера; оставить рабочие прокси, быстрые первыми"""
+        print(f"\n🩺 Предполетная проверка {len(self.proxy_pool)} прокси...")
+        started = time.perf_counter()
+
+        prober = ProxyProber(target_url=target_url)
+        usable = prober.usable(self.proxy_pool)
+        prober.print_table(self.proxy_pool)
+
+        # Отброшенные прокси остаются в отчете как неуспешные - без запуска браузера
+        for proxy in self.proxy_pool:
+            if proxy not in usable:
+                entry = prober.table.entries[proxy_key(proxy)]
+                self.test_results.add(
+                    FAIL, f"geo:{proxy['country']}", f"{proxy['name']}: {entry['error']}",
+                    country=proxy['name'],
+                    proxy=proxy_key(proxy),
+                    fields_filled=0,
+                    preflight_error=entry['error']
+                )
+
+        dropped = len(self.proxy_pool) - len(usable)
+        print(f"⏱️ Проверка за {time.perf_counter() - started:.2f}с (опрошено {prober.probed}, "
+              f"из кэша {len(self.proxy_pool) - prober.probed}); отброшено: {dropped}")
+        return usable
+
+    def run_comprehensive_geo_test(self, target_url, workers=1):
         """Запуск полного тестирования с ротацией прокси"""
         print("🌍 ЗАПУСК КОМПЛЕКСНОГО ГЕО-ТЕСТИРОВАНИЯ")
         print("=" * 60)
         print(f"🎯 Целевой URL: {target_url}")
         print(f"🌐 Прокси в пуле: {len(self.proxy_pool)}")
+        print(f"⚡ Воркеров: {workers}")
+        print(f"🧬 Seed данных формы: {self.form_data.seed}")
         print("=" * 60)
 
         start_time = time.time()
 
-        # Тестируем каждый прокси
-        for i, proxy in enumerate(self.proxy_pool, 1):
-            print(f"\n🔄 ЭТАП {i}/{len(self.proxy_pool)}")
-            print("-" * 40)
+        # Chrome запускается только для прокси, прошедших предполетную проверку
+        self.proxy_pool = self.preflight_proxies(target_url)
 
-            success = self.test_form_with_proxy(proxy, target_url)
+        if workers > 1:
+            self.run_parallel_proxy_tests(target_url, workers)
+        else:
+            # Тестируем каждый прокси
+            for i, proxy in enumerate(self.proxy_pool, 1):
+                print(f"\n🔄 ЭТАП {i}/{len(self.proxy_pool)}")
+                print("-" * 40)
 
-            if not success:
-                print(f"⚠️ Прокси {proxy['name']} не работает")
+                success = self.test_form_with_proxy(proxy, target_url)
 
-            # Пауза между прокси
-            if i < len(self.proxy_pool):
-                print("⏳ Пауза перед следующим прокси...")
-                time.sleep(random.uniform(3, 8))
+                if not success:
+                    print(f"⚠️ Прокси {proxy['name']} не работает")
 
         # Тестируем через Tor (опционально)
         print(f"\n🔄 ЭТАП {len(self.proxy_pool) + 1}: TOR")
@@ -569,7 +638,11 @@ class GeoProxyFormTester:
         except Exception as e:
             print(f"⚠️ Tor тест пропущен: {e}")
 
+        for host, stats in self.governor.stats().items():
+            print(f"🚦 {host}: запросов {stats['requests']}, итоговая частота {stats['rate']}/с, откатов {stats['backoffs']}")
+
         # Итоговый отчет
+        flush_screenshots()
         self.print_test_report(time.time() - start_time)
 
     def print_test_report(self, total_time):
@@ -578,32 +651,37 @@ class GeoProxyFormTester:
         print("📊 ИТОГОВЫЙ ОТЧЕТ ГЕО-ТЕСТИРОВАНИЯ")
         print("=" * 60)
 
-        successful_tests = [r for r in self.test_results if r['success']]
-        failed_tests = [r for r in self.test_results if not r['success']]
+        successful_count = self.test_results.count(PASS)
+        failed_count = self.test_results.count(FAIL)
 
-        print(f"✅ Успешных тестов: {len(successful_tests)}")
-        print(f"❌ Неуспешных тестов: {len(failed_tests)}")
+        print(f"✅ Успешных тестов: {successful_count}")
+        print(f"❌ Неуспешных тестов: {failed_count}")
         print(f"📊 Всего тестов: {len(self.test_results)}")
         print(f"⏱️ Общее время: {total_time:.1f} секунд")
 
-        if len(successful_tests) > 0:
-            success_rate = (len(successful_tests) / len(self.test_results)) * 100
+        if successful_count > 0:
+            success_rate = (successful_count / len(self.test_results)) * 100
             print(f"📈 Процент успешности: {success_rate:.1f}%")
 
         print(f"\n📋 ДЕТАЛИ ПО СТРАНАМ:")
         for result in self.test_results:
-            status = "✅ SUCCESS" if result['success'] else "❌ FAILED"
-            print(f"  🌍 {result['country']}: {status}")
-            print(f"     📡 Прокси: {result['proxy']}")
-            print(f"     📝 Полей заполнено: {result['fields_filled']}")
+            status = "✅ SUCCESS" if result.status == PASS else "❌ FAILED"
+            print(f"  🌍 {result.details['country']}: {status}")
+            print(f"     📡 Прокси: {result.details['proxy']}")
+            print(f"     📝 Полей заполнено: {result.details['fields_filled']}")
+
+        print(f"\n📸 Скриншотов: {len(self.screenshots)}, сохранены в: {self.screenshots_dir}")
 
-        print(f"\n📸 Скриншоты сохранены в: {self.screenshots_dir}")
+        self.test_results.close()
+        junit_path = self.test_results.export_junit()
+        print(f"📄 JSONL: {self.test_results.jsonl_path}")
+        print(f"📄 JUnit XML: {junit_path}")
         print("=" * 60)
 
         # Рекомендации
-        if len(successful_tests) == len(self.test_results):
+        if successful_count == len(self.test_results):
             print("🎉 ОТЛИЧНО! Все тесты прошли успешно!")
-        elif len(successful_tests) > len(failed_tests):
+        elif successful_count > failed_count:
             print("👍 ХОРОШО! Большинство тестов успешны")
         else:
             print("⚠️ ВНИМАНИЕ! Много неуспешных тестов")
@@ -663,8 +741,15 @@ if __name__ == "__main__":
             selected_scenario = scenarios[scenario_index]
             print(f"\n✅ Выбран сценарий: {selected_scenario['name']}")
 
+            workers = input("Количество параллельных воркеров (Enter = 1): ").strip()
+            workers = max(1, int(workers)) if workers else 1
+
+            data_seed = input("Seed данных формы (Enter = случайный): ").strip()
+            if data_seed:
+                geo_tester.form_data = FormDataGenerator(seed=int(data_seed), locales=geo_tester.form_data.locales)
+
             # Запускаем тестирование
-            geo_tester.run_comprehensive_geo_test(selected_scenario['url'])
+            geo_tester.run_comprehensive_geo_test(selected_scenario['url'], workers=workers)
 
         else:
             print("❌ Неверный выбор сценария")
@@ -18,13 +18,15 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.action_chains import ActionChains
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import threading
 import queue
+from driver_pool import get_pool
+from driver_resolver import make_chrome_service
+from page_waits import mark_document, wait_for_page_ready
+from screenshot_writer import capture, flush_screenshots
 
 # Отключаем SSL проверки
 os.environ['WDM_SSL_VERIFY'] = '0'
@@ -36,6 +38,7 @@ class CookieClickerAI:
     def __init__(self):
         self.driver = None
         self.wait = None
+        self.pool = None
         self.game_url = "https://orteil.dashnet.org/cookieclicker/"
 
         # Папки для данных
@@ -100,8 +103,11 @@ class CookieClickerAI:
         options.add_experimental_option("prefs", prefs)
 
         try:
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
+            # Сессия из общего пула; игра тяжелая, поэтому порог памяти выше
+            self.pool = get_pool("cookie_clicker", lambda: webdriver.Chrome(
+                service=make_chrome_service(), options=options),
+                size=1, max_memory_mb=1536)
+            self.driver = self.pool.acquire()
             self.wait = WebDriverWait(self.driver, 20)
 
             # Скрываем автоматизацию
@@ -117,11 +123,8 @@ class CookieClickerAI:
     def take_screenshot(self, name):
         """Создание игрового скриншота"""
         if self.driver:
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-            filename = f"{name}_{timestamp}.png"
-            filepath = os.path.join(self.screenshots_dir, filename)
-            self.driver.save_screenshot(filepath)
-            print(f"📸 Игровой скриншот: {filename}")
+            filepath = capture(self.driver, self.screenshots_dir, name)
+            print(f"📸 Игровой скриншот: {os.path.basename(filepath)}")
             return filepath
         return None
 
@@ -140,14 +143,17 @@ class CookieClickerAI:
                 EC.element_to_be_clickable((By.ID, "bigCookie"))
             )
 
-            time.sleep(5)  # Дополнительное время на загрузку ресурсов
+            # Ждем догрузки ресурсов игры (сеть затихла), но не дольше 15 секунд.
+            # DOM игры меняется постоянно (счетчики), поэтому его не ждем
+            wait_for_page_ready(self.driver, timeout=15, quiet_ms=500, dom_settle=False)
 
             # Проверяем, есть ли язык по умолчанию
             try:
                 language_selector = self.driver.find_element(By.ID, "langSelect-EN")
                 if language_selector:
+                    token = mark_document(self.driver)
                     language_selector.click()
-                    time.sleep(2)
+                    wait_for_page_ready(self.driver, timeout=10, dom_settle=False, navigated_from=token)
             except:
                 pass
 
@@ -724,9 +730,11 @@ class CookieClickerAI:
 
         finally:
             self.running = False
+            flush_screenshots()
             if self.driver:
-                self.driver.quit()
-                print("🔒 Браузер закрыт")
+                self.pool.release(self.driver)
+                self.driver = None
+                print("🔒 Браузер возвращен в пул")
 
 
 def run_interactive_cookie_test():
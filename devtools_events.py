@@ -0,0 +1,117 @@
+"""
+📡 ПЕРЕХВАТ СОБЫТИЙ КОНСОЛИ И ДИАЛОГОВ
+Буфер событий вкладки вместо опроса get_log и switch_to.alert после каждой попытки
+- Скрипт ставится через DevTools (Page.addScriptToEvaluateOnNewDocument) до скриптов страницы
+- console.*, необработанные ошибки, alert/confirm/prompt пишутся в буфер sessionStorage
+- Диалоги закрываются сразу: страница не блокируется, WebDriver не ловит UnexpectedAlert
+- Каждое событие помечено id попытки, во время которой оно произошло
+- Буфер переживает переход на страницу результата (та же вкладка, тот же origin)
+"""
+
+EVENT_BUFFER_KEY = "__hugoEventBuffer"
+ATTEMPT_KEY = "__hugoAttempt"
+MAX_BUFFERED_EVENTS = 200
+
+EVENT_CAPTURE_JS = """
+(function () {
+    if (window.__hugoEvents) { return; }
+    var KEY = '%(buffer)s', ATTEMPT = '%(attempt)s', LIMIT = %(limit)d;
+    var store = null;
+    try { store = window.sessionStorage; store.getItem(KEY); } catch (e) { store = null; }
+    var memory = [];
+
+    var push = function (type, level, text) {
+        var attempt = null;
+        try { attempt = store ? store.getItem(ATTEMPT) : null; } catch (e) {}
+        var event = {type: type, level: level, text: String(text).slice(0, 500),
+                     attempt: attempt, url: location.href, time: Date.now()};
+        try {
+            if (store) {
+                var buffer = JSON.parse(store.getItem(KEY) || '[]');
+                buffer.push(event);
+                if (buffer.length > LIMIT) { buffer.splice(0, buffer.length - LIMIT); }
+                store.setItem(KEY, JSON.stringify(buffer));
+                return;
+            }
+        } catch (e) {}
+        memory.push(event);
+    };
+    window.__hugoEvents = {memory: memory};
+
+    ['log', 'info', 'warn', 'error', 'debug'].forEach(function (level) {
+        var original = console[level];
+        console[level] = function () {
+            try { push('console', level, Array.prototype.map.call(arguments, String).join(' ')); } catch (e) {}
+            return original.apply(console, arguments);
+        };
+    });
+    window.addEventListener('error', function (e) { push('console', 'exception', e.message); });
+
+    // Диалоги фиксируются и сразу "закрываются"
+    window.alert = function (message) { push('dialog', 'alert', message); };
+    window.confirm = function (message) { push('dialog', 'confirm', message); return false; };
+    window.prompt = function (message) { push('dialog', 'prompt', message); return null; };
+})();
+""" % {"buffer": EVENT_BUFFER_KEY, "attempt": ATTEMPT_KEY, "limit": MAX_BUFFERED_EVENTS}
+
+DRAIN_EVENTS_JS = """
+var events = [];
+try {
+    events = JSON.parse(sessionStorage.getItem('%(buffer)s') || '[]');
+    sessionStorage.removeItem('%(buffer)s');
+} catch (e) {}
+if (window.__hugoEvents) { events = events.concat(window.__hugoEvents.memory.splice(0)); }
+return events;
+""" % {"buffer": EVENT_BUFFER_KEY}
+
+BEGIN_ATTEMPT_JS = """
+try {
+    sessionStorage.setItem('%(attempt)s', arguments[0]);
+    sessionStorage.removeItem('%(buffer)s');
+} catch (e) {}
+if (window.__hugoEvents) { window.__hugoEvents.memory.splice(0); }
+""" % {"buffer": EVENT_BUFFER_KEY, "attempt": ATTEMPT_KEY}
+
+
+def install_event_capture(driver):
+    """Зарегистрировать перехват для всех будущих документов (один раз на драйвер)"""
+    if getattr(driver, "_hugo_event_capture", False):
+        return True
+
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": EVENT_CAPTURE_JS})
+        driver._hugo_event_capture = True
+    except Exception:
+        return False
+
+    # Текущий документ уже загружен - ставим перехват напрямую
+    try:
+        driver.execute_script(EVENT_CAPTURE_JS)
+    except Exception:
+        pass
+    return True
+
+
+def has_event_capture(driver):
+    """True, если события вкладки идут в буфер"""
+    return getattr(driver, "_hugo_event_capture", False)
+
+
+def begin_attempt(driver, attempt_id):
+    """Пометить последующие события id попытки и сбросить старый буфер"""
+    try:
+        driver.execute_script(EVENT_CAPTURE_JS + BEGIN_ATTEMPT_JS, attempt_id)
+    except Exception:
+        pass
+
+
+def drain_events(driver, attempt_id=None):
+    """Забрать накопленные события (только своей попытки, если указан attempt_id)"""
+    try:
+        events = driver.execute_script(DRAIN_EVENTS_JS) or []
+    except Exception:
+        return []
+
+    if attempt_id is None:
+        return events
+    return [event for event in events if event.get("attempt") == attempt_id]
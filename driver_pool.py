@@ -0,0 +1,237 @@
+"""
+♻️ ПУЛ WEBDRIVER-СЕССИЙ
+Общий пул прогретых браузеров для всех тестовых наборов
+- Аренда и возврат сессий вместо холодного старта Chrome
+- Сброс состояния между использованиями (cookies, storage, вкладки)
+- Проверка здоровья сессии перед выдачей
+- Пересоздание после N использований или превышения порога памяти
+"""
+
+import atexit
+import threading
+import time
+from contextlib import contextmanager
+
+
+class DriverPool:
+    """Пул переиспользуемых WebDriver-сессий с одинаковыми настройками запуска"""
+
+    def __init__(self, factory, size=2, max_uses=25, max_memory_mb=768):
+        self.factory = factory  # функция без аргументов, возвращающая новый драйвер
+        self.size = size
+        self.max_uses = max_uses
+        self.max_memory_mb = max_memory_mb
+
+        self._idle = []
+        self._uses = {}
+        self._total = 0
+        self._closed = False
+        self._lock = threading.Condition()
+
+    def _create(self):
+        """Создать новую сессию (холодный старт Chrome)"""
+        driver = self.factory()
+        self._uses[id(driver)] = 0
+        return driver
+
+    def _destroy(self, driver):
+        """Закрыть сессию и освободить место в пуле"""
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def prewarm(self, count=1, background=True):
+        """Заранее запустить браузеры, чтобы первая аренда была мгновенной"""
+        def warm():
+            for _ in range(count):
+                with self._lock:
+                    if self._closed or self._total >= self.size:
+                        return
+                    self._total += 1
+                try:
+                    driver = self._create()
+                except Exception as e:
+                    print(f"⚠️ Ошибка прогрева браузера: {e}")
+                    with self._lock:
+                        self._total -= 1
+                        self._lock.notify()
+                    return
+                with self._lock:
+                    self._idle.append(driver)
+                    self._lock.notify()
+
+        if background:
+            threading.Thread(target=warm, daemon=True).start()
+        else:
+            warm()
+
+    def is_healthy(self, driver):
+        """Проверить, что сессия жива и отвечает на команды"""
+        try:
+            return driver.execute_script("return 1;") == 1
+        except Exception:
+            return False
+
+    def memory_usage_mb(self, driver):
+        """Получить объем JS-кучи вкладки в мегабайтах"""
+        try:
+            metrics = driver.execute_cdp_cmd("Performance.getMetrics", {})
+            for metric in metrics.get("metrics", []):
+                if metric.get("name") == "JSHeapUsedSize":
+                    return metric["value"] / (1024 * 1024)
+        except Exception:
+            pass
+
+        try:
+            used = driver.execute_script("return performance.memory ? performance.memory.usedJSHeapSize : 0;")
+            return (used or 0) / (1024 * 1024)
+        except Exception:
+            return 0
+
+    def reset(self, driver):
+        """Сбросить состояние сессии: вкладки, cookies, storage"""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        try:
+            driver.execute_script("try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}")
+        except Exception:
+            pass
+
+        try:
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except Exception:
+            driver.delete_all_cookies()
+
+        driver.get("about:blank")
+
+    def acquire(self, timeout=None):
+        """Взять сессию из пула (или запустить новую, если есть место)"""
+        deadline = None if timeout is None else time.time() + timeout
+
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("Пул драйверов уже закрыт")
+
+                driver = None
+                create = False
+
+                if self._idle:
+                    driver = self._idle.pop()
+                elif self._total < self.size:
+                    self._total += 1
+                    create = True
+                else:
+                    remaining = None if deadline is None else deadline - time.time()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError("Нет свободных браузеров в пуле")
+                    self._lock.wait(remaining)
+                    continue
+
+            if create:
+                try:
+                    return self._create()
+                except Exception:
+                    with self._lock:
+                        self._total -= 1
+                        self._lock.notify()
+                    raise
+
+            if self.is_healthy(driver):
+                return driver
+
+            # Мертвая сессия - заменяем новой
+            print("⚠️ Сессия из пула не отвечает, пересоздаем браузер")
+            self._destroy(driver)
+            try:
+                return self._create()
+            except Exception:
+                with self._lock:
+                    self._total -= 1
+                    self._lock.notify()
+                raise
+
+    def release(self, driver, broken=False):
+        """Вернуть сессию в пул (или закрыть, если ее пора пересоздать)"""
+        uses = self._uses.get(id(driver), 0) + 1
+        self._uses[id(driver)] = uses
+
+        recycle = broken or self._closed or uses >= self.max_uses
+        if not recycle and self.max_memory_mb:
+            recycle = self.memory_usage_mb(driver) > self.max_memory_mb
+
+        if not recycle:
+            try:
+                self.reset(driver)
+            except Exception as e:
+                print(f"⚠️ Не удалось сбросить сессию, пересоздаем: {e}")
+                recycle = True
+
+        if recycle:
+            self._destroy(driver)
+            with self._lock:
+                self._total -= 1
+                self._lock.notify()
+            return
+
+        with self._lock:
+            self._idle.append(driver)
+            self._lock.notify()
+
+    @contextmanager
+    def lease(self, timeout=None):
+        """Контекстный менеджер аренды сессии"""
+        driver = self.acquire(timeout)
+        broken = False
+        try:
+            yield driver
+        except Exception:
+            broken = not self.is_healthy(driver)
+            raise
+        finally:
+            self.release(driver, broken=broken)
+
+    def shutdown(self):
+        """Закрыть все свободные сессии и запретить новые аренды"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._total -= len(idle)
+            self._lock.notify_all()
+
+        for driver in idle:
+            self._destroy(driver)
+
+
+# Реестр пулов: один пул на набор настроек запуска
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(key, factory, **pool_kwargs):
+    """Получить общий пул по ключу, создав его при первом обращении"""
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool._closed:
+            pool = DriverPool(factory, **pool_kwargs)
+            _pools[key] = pool
+        return pool
+
+
+def shutdown_all_pools():
+    """Закрыть все пулы (вызывается автоматически при выходе)"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+
+    for pool in pools:
+        pool.shutdown()
+
+
+atexit.register(shutdown_all_pools)
@@ -0,0 +1,211 @@
+"""
+🧭 ОФЛАЙН-РАЗРЕШЕНИЕ CHROMEDRIVER
+Локальный кэш драйверов вместо ChromeDriverManager().install() при каждом запуске
+- Версия Chrome определяется один раз за процесс
+- Драйвер закрепляется в кэше по major-версии Chrome
+- Сеть используется только по явному запросу (HUGO_DRIVER_ONLINE=1); версия драйвера -
+  последний патч для major-версии Chrome (Chrome for Testing LATEST_RELEASE_<major>)
+- Если версия Chrome не определена, драйвер не закрепляется - используется только в этом процессе
+"""
+
+import glob
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import urllib.request
+
+from selenium.webdriver.chrome.service import Service
+
+# Корневая папка кэша драйверов
+DRIVER_CACHE_DIR = os.environ.get(
+    "HUGO_DRIVER_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "hugo_chromedriver")
+)
+
+DRIVER_NAME = "chromedriver.exe" if sys.platform.startswith("win") else "chromedriver"
+
+VERSION_PATTERN = re.compile(r"(\d+)\.(\d+)\.(\d+)\.(\d+)")
+
+# Последний выпуск chromedriver для major-версии Chrome
+CFT_LATEST_RELEASE_URL = "https://googlechromelabs.github.io/chrome-for-testing/LATEST_RELEASE_{major}"
+
+_NOT_DETECTED = object()  # версия еще не определялась (None - определить не удалось)
+_chrome_version = _NOT_DETECTED
+_resolved_paths = {}
+_lock = threading.Lock()
+
+
+def _run_version_command(command):
+    """Выполнить команду и вытащить из вывода версию вида 120.0.6099.109"""
+    try:
+        output = subprocess.run(command, capture_output=True, text=True, timeout=10).stdout
+    except Exception:
+        return None
+
+    match = VERSION_PATTERN.search(output or "")
+    return match.group(0) if match else None
+
+
+def detect_chrome_version():
+    """Определить установленную версию Chrome (результат кэшируется на процесс)"""
+    global _chrome_version
+
+    with _lock:
+        if _chrome_version is not _NOT_DETECTED:
+            return _chrome_version
+
+        # Явное указание версии имеет приоритет (удобно для CI)
+        version = os.environ.get("CHROME_VERSION")
+
+        if not version and sys.platform.startswith("win"):
+            for key in [r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon",
+                        r"HKEY_LOCAL_MACHINE\Software\Google\Chrome\BLBeacon"]:
+                version = _run_version_command(["reg", "query", key, "/v", "version"])
+                if version:
+                    break
+
+        if not version:
+            candidates = [
+                "google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome",
+                "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+            ]
+            for binary in candidates:
+                if os.path.isabs(binary) and not os.path.exists(binary):
+                    continue
+                if not os.path.isabs(binary) and not shutil.which(binary):
+                    continue
+                version = _run_version_command([binary, "--version"])
+                if version:
+                    break
+
+        _chrome_version = version or None  # неудача тоже кэшируется - пробы не повторяются
+        return _chrome_version
+
+
+def _major(version):
+    """Major-часть версии ('120.0.6099.109' -> '120')"""
+    return version.split(".")[0] if version else None
+
+
+def _driver_major(driver_path):
+    """Major-версия бинарника chromedriver"""
+    return _major(_run_version_command([driver_path, "--version"]))
+
+
+def _latest_driver_version(major):
+    """Полная версия последнего chromedriver для major-версии (None, если узнать не удалось)"""
+    try:
+        with urllib.request.urlopen(CFT_LATEST_RELEASE_URL.format(major=major), timeout=10) as response:
+            match = VERSION_PATTERN.search(response.read().decode("ascii", "replace"))
+    except Exception as e:
+        print(f"⚠️ Не удалось узнать последний ChromeDriver для Chrome {major}: {e}")
+        return None
+    return match.group(0) if match else None
+
+
+def _pin(driver_path, major):
+    """Скопировать драйвер в кэш под major-версию Chrome"""
+    target_dir = os.path.join(DRIVER_CACHE_DIR, major)
+    os.makedirs(target_dir, exist_ok=True)
+    target = os.path.join(target_dir, DRIVER_NAME)
+
+    if os.path.abspath(driver_path) != os.path.abspath(target):
+        shutil.copy2(driver_path, target)
+        os.chmod(target, 0o755)
+
+    print(f"📌 ChromeDriver {major} закреплен в кэше: {target}")
+    return target
+
+
+def _find_local_candidates():
+    """Драйверы, уже лежащие на диске: PATH и кэш webdriver_manager"""
+    candidates = []
+
+    on_path = shutil.which("chromedriver")
+    if on_path:
+        candidates.append(on_path)
+
+    wdm_root = os.path.join(os.path.expanduser("~"), ".wdm", "drivers", "chromedriver")
+    candidates.extend(sorted(glob.glob(os.path.join(wdm_root, "**", DRIVER_NAME), recursive=True), reverse=True))
+
+    return candidates
+
+
+def resolve_driver_path(allow_network=None):
+    """Найти chromedriver под локальный Chrome, по умолчанию без обращения к сети"""
+    if allow_network is None:
+        allow_network = os.environ.get("HUGO_DRIVER_ONLINE", "0") == "1"
+
+    version = detect_chrome_version()
+    major = _major(version)
+    cache_key = major or "unknown"
+
+    with _lock:
+        if cache_key in _resolved_paths:
+            return _resolved_paths[cache_key]
+
+    if major:
+        path = _resolve_for_major(major, allow_network)
+    else:
+        path = _resolve_unknown(allow_network)
+
+    if not path:
+        raise RuntimeError(
+            f"ChromeDriver для Chrome {version or '(версия не определена)'} не найден в кэше {DRIVER_CACHE_DIR}. "
+            f"Запустите один раз с HUGO_DRIVER_ONLINE=1 или положите chromedriver в PATH"
+        )
+
+    with _lock:
+        _resolved_paths[cache_key] = path
+    return path
+
+
+def _resolve_for_major(major, allow_network):
+    """Драйвер для известной major-версии: кэш, локальные драйверы, затем сеть (если разрешено)"""
+    # 1. Закрепленный драйвер в нашем кэше
+    pinned = os.path.join(DRIVER_CACHE_DIR, major, DRIVER_NAME)
+    if os.path.exists(pinned):
+        return pinned
+
+    # 2. Подходящий драйвер уже есть на диске
+    for candidate in _find_local_candidates():
+        if _driver_major(candidate) == major:
+            return _pin(candidate, major)
+
+    # 3. Сеть - только если разрешено явно; драйвер ищется по major, а не по точной сборке браузера
+    if not allow_network:
+        return None
+
+    from webdriver_manager.chrome import ChromeDriverManager
+    driver_version = _latest_driver_version(major)
+    print(f"🌐 Загружаем ChromeDriver {driver_version or '(версию выберет webdriver_manager)'} для Chrome {major}...")
+    manager = ChromeDriverManager(driver_version=driver_version) if driver_version else ChromeDriverManager()
+    downloaded = manager.install()
+
+    downloaded_major = _driver_major(downloaded)
+    if downloaded_major != major:
+        print(f"⚠️ Загружен ChromeDriver {downloaded_major or '?'} вместо {major} - в кэш не закрепляем")
+        return downloaded
+    return _pin(downloaded, major)
+
+
+def _resolve_unknown(allow_network):
+    """Версия Chrome не определена: рабочий драйвер только на этот процесс, без закрепления в кэше"""
+    for candidate in _find_local_candidates():
+        if _driver_major(candidate):
+            print(f"⚠️ Версия Chrome не определена - используем {candidate} без закрепления")
+            return candidate
+
+    if allow_network:
+        from webdriver_manager.chrome import ChromeDriverManager
+        print("🌐 Версия Chrome не определена - загружаем ChromeDriver, выбранный webdriver_manager...")
+        return ChromeDriverManager().install()
+    return None
+
+
+def make_chrome_service(allow_network=None):
+    """Service для webdriver.Chrome с драйвером из локального кэша"""
+    return Service(resolve_driver_path(allow_network))
@@ -0,0 +1,103 @@
+"""
+🎯 ПОИСК ПОЛЕЙ ФОРМЫ ЗА ОДИН ЗАПРОС
+Все селекторы всех полей проверяются одним execute_script
+- Альтернативы селектора перебираются по порядку, предпочтение - видимому и доступному элементу
+- Результат: поле -> элемент, сработавший селектор, видимость и доступность
+- Отсутствующие поля сообщаются сразу; ждем только скрытые/недоступные и явно ожидаемые (wait_for),
+  которых еще нет в DOM (SPA дорисовывает форму) - одним запросом на опрос до общего таймаута
+"""
+
+import time
+
+RESOLVE_FIELDS_JS = """
+var spec = arguments[0], result = {};
+
+var isVisible = function (el) {
+    if (!el.isConnected) { return false; }
+    var style = window.getComputedStyle(el);
+    if (style.visibility === 'hidden' || style.display === 'none' || parseFloat(style.opacity) === 0) { return false; }
+    var rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+};
+
+Object.keys(spec).forEach(function (field) {
+    var fallback = null, found = null;
+    for (var i = 0; i < spec[field].length && !found; i++) {
+        var matches = [];
+        try { matches = document.querySelectorAll(spec[field][i]); } catch (e) { continue; }
+        for (var j = 0; j < matches.length; j++) {
+            var el = matches[j];
+            var entry = {element: el, selector: spec[field][i], visible: isVisible(el),
+                         enabled: !el.disabled && !el.readOnly};
+            if (entry.visible && entry.enabled) { found = entry; break; }
+            fallback = fallback || entry;
+        }
+    }
+    result[field] = found || fallback;
+});
+return result;
+"""
+
+
+def split_selectors(selectors):
+    """Строка альтернатив "a, b, c" -> список селекторов (скобки и кавычки учитываются)"""
+    if not isinstance(selectors, str):
+        return list(selectors)
+
+    parts, current, depth, quote = [], [], 0, None
+    for char in selectors:
+        if quote:
+            quote = None if char == quote else quote
+        elif char in "'\"":
+            quote = char
+        elif char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append("".join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    parts.append("".join(current).strip())
+    return [part for part in parts if part]
+
+
+class FieldResolver:
+    """Поиск полей формы по именованным наборам селекторов"""
+
+    def __init__(self, driver, field_selectors):
+        self.driver = driver
+        self.spec = {field: split_selectors(selectors) for field, selectors in field_selectors.items()}
+        self.round_trips = 0
+
+    def resolve(self, fields=None):
+        """Одним запросом: поле -> {element, selector, visible, enabled} или None"""
+        spec = self.spec if fields is None else {field: self.spec[field] for field in fields if field in self.spec}
+        if not spec:
+            return {}
+        self.round_trips += 1
+        return self.driver.execute_script(RESOLVE_FIELDS_JS, spec) or {}
+
+    def resolve_ready(self, fields=None, wait_for=(), timeout=5, poll=0.1):
+        """Поля, готовые к вводу, и отсутствующие; отсутствие ждем только для полей из wait_for"""
+        resolved = self.resolve(fields)
+        wait_for = set(wait_for)
+        ready = {field: entry for field, entry in resolved.items() if entry and entry["visible"] and entry["enabled"]}
+        # Найденные, но скрытые/недоступные - ждем всегда; отсутствующие - только ожидаемые (SPA дорисует форму)
+        pending = [field for field, entry in resolved.items()
+                   if field not in ready and (entry or field in wait_for)]
+
+        deadline = time.monotonic() + timeout
+        while pending and time.monotonic() < deadline:
+            time.sleep(poll)
+            for field, entry in self.resolve(pending).items():
+                resolved[field] = entry or resolved[field]
+                if entry and entry["visible"] and entry["enabled"]:
+                    ready[field] = entry
+            pending = [field for field in pending if field not in ready]
+
+        # Необязательные отсутствующие - сразу после первого запроса; ожидаемые - после таймаута
+        missing = [field for field, entry in resolved.items() if not entry]
+        not_ready = {field: entry for field, entry in resolved.items() if entry and field not in ready}
+        return ready, missing, not_ready
@@ -0,0 +1,189 @@
+"""
+🗂️ ИНДЕКС НАХОДОК
+Одна запись на уязвимость вместо строки на каждый payload и детектор
+- Ключ: (URL, параметр, класс уязвимости)
+- Число срабатываний, детекторы, первый payload, ссылки на доказательства (скриншоты)
+- Итоговый статус - самый серьезный из срабатываний (VULNERABLE важнее WARNING)
+- Экспорт в JSON и SARIF 2.1.0 по ходу прогона (атомарная перезапись, не чаще раза в интервал)
+"""
+
+import json
+import os
+import threading
+import time
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+MAX_EVIDENCE = 10  # ссылок на доказательства в одной записи
+
+SEVERITY = {"WARNING": 1, "VULNERABLE": 2}
+SARIF_LEVELS = {"WARNING": "warning", "VULNERABLE": "error"}
+
+# Класс уязвимости по префиксу id проверки (детектору)
+VULN_CLASSES = {
+    "xss": ("Cross-site scripting", "Ввод пользователя выполняется или отражается на странице без экранирования"),
+    "sqli": ("SQL injection", "Ввод пользователя попадает в SQL-запрос без параметризации"),
+}
+
+
+def split_check_id(check_id):
+    """id проверки "детектор:страница[:поле]" -> (детектор, страница, поле); только для находок
+    без структурных полей (старые журналы) - поле берется после последнего ':', т.к. в query бывает ':'"""
+    detector, _, rest = check_id.partition(":")
+    page, _, parameter = rest.rpartition(":")
+    if not page:
+        page, parameter = rest, None
+    return detector, page or "/", parameter or None
+
+
+def finding_location(finding):
+    """(детектор, страница, поле) находки: структурные поля make_finding, иначе разбор id"""
+    if "page" in finding:
+        return finding["detector"], finding["page"] or "/", finding["parameter"]
+    return split_check_id(finding["check_id"])
+
+
+def vuln_class(detector):
+    """Класс уязвимости детектора: xss или sqli (вход - это SQL injection)"""
+    return "xss" if detector.startswith("xss") else "sqli"
+
+
+class FindingsIndex:
+    """Дедуплицированные находки прогона с инкрементальной выгрузкой"""
+
+    def __init__(self, target, path_prefix, tool_name="Hugo-I security suite", flush_interval=2.0):
+        self.target = target.rstrip("/")
+        self.json_path = path_prefix + ".json"
+        self.sarif_path = path_prefix + ".sarif"
+        self.tool_name = tool_name
+        self.flush_interval = flush_interval
+        self.entries = {}  # (url, параметр, класс) -> запись
+        self.hits = 0
+        self._dirty = False
+        self._flushed_at = 0.0
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def add(self, finding):
+        """Учесть находку (словарь make_finding); SECURE и прочие статусы не индексируются"""
+        status = finding["status"]
+        if status not in SEVERITY:
+            return None
+
+        detector, page, parameter = finding_location(finding)
+        key = (f"{self.target}{page}", parameter or "-", vuln_class(detector))
+        details = finding.get("details") or {}
+        now = time.time()
+
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                entry = self.entries[key] = {
+                    "url": key[0],
+                    "parameter": parameter,
+                    "class": key[2],
+                    "status": status,
+                    "hits": 0,
+                    "detectors": {},
+                    "first_payload": details.get("payload"),
+                    "first_message": finding["message"],
+                    "first_seen": now,
+                    "last_seen": now,
+                    "evidence": [],
+                }
+
+            entry["hits"] += 1
+            entry["detectors"][detector] = entry["detectors"].get(detector, 0) + 1
+            entry["last_seen"] = now
+            if SEVERITY[status] > SEVERITY[entry["status"]]:
+                entry["status"] = status
+            if entry["first_payload"] is None:
+                entry["first_payload"] = details.get("payload")
+            for artifact in finding.get("artifacts") or []:
+                if artifact and artifact not in entry["evidence"] and len(entry["evidence"]) < MAX_EVIDENCE:
+                    entry["evidence"].append(artifact)
+
+            self.hits += 1
+            self._dirty = True
+            due = now - self._flushed_at >= self.flush_interval
+
+        if due:
+            self.flush()
+        return entry
+
+    def by_status(self, status):
+        """Уникальные находки с итоговым статусом"""
+        with self._lock:
+            return [dict(entry) for entry in self.entries.values() if entry["status"] == status]
+
+    def to_json(self):
+        """Отчет в JSON-виде"""
+        with self._lock:
+            entries = sorted((dict(entry, detectors=dict(entry["detectors"]), evidence=list(entry["evidence"]))
+                              for entry in self.entries.values()),
+                             key=lambda entry: (-SEVERITY[entry["status"]], entry["url"], entry["parameter"] or ""))
+        return {
+            "target": self.target,
+            "generated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "unique_findings": len(entries),
+            "total_hits": self.hits,
+            "findings": entries,
+        }
+
+    def to_sarif(self):
+        """Отчет в формате SARIF 2.1.0"""
+        report = self.to_json()
+        rules = [{
+            "id": rule_id,
+            "name": name,
+            "shortDescription": {"text": name},
+            "fullDescription": {"text": description},
+        } for rule_id, (name, description) in VULN_CLASSES.items()]
+
+        results = []
+        for entry in report["findings"]:
+            where = f" (параметр {entry['parameter']})" if entry["parameter"] else ""
+            results.append({
+                "ruleId": entry["class"],
+                "ruleIndex": list(VULN_CLASSES).index(entry["class"]),
+                "level": SARIF_LEVELS[entry["status"]],
+                "message": {"text": f"{VULN_CLASSES[entry['class']][0]}{where}: {entry['first_message']}"},
+                "locations": [{"physicalLocation": {"artifactLocation": {"uri": entry["url"]}}}],
+                "partialFingerprints": {"findingKey/v1": f"{entry['url']}|{entry['parameter']}|{entry['class']}"},
+                "properties": {
+                    "parameter": entry["parameter"],
+                    "hits": entry["hits"],
+                    "detectors": entry["detectors"],
+                    "firstPayload": entry["first_payload"],
+                    "evidence": entry["evidence"],
+                },
+            })
+
+        return {
+            "$schema": SARIF_SCHEMA,
+            "version": "2.1.0",
+            "runs": [{
+                "tool": {"driver": {"name": self.tool_name, "rules": rules}},
+                "originalUriBaseIds": {"TARGET": {"uri": self.target + "/"}},
+                "results": results,
+            }],
+        }
+
+    def _write(self, path, data):
+        """Атомарная запись JSON-файла"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = path + ".part"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+        os.replace(temp_path, path)
+
+    def flush(self):
+        """Выгрузить JSON и SARIF, если были изменения"""
+        with self._lock:
+            if not self._dirty and self._flushed_at:
+                return
+            self._dirty = False
+            self._flushed_at = time.time()
+
+        with self._write_lock:
+            self._write(self.json_path, self.to_json())
+            self._write(self.sarif_path, self.to_sarif())
@@ -0,0 +1,545 @@
+"""
+🧬 ГЕНЕРАТОР ДАННЫХ ДЛЯ ФОРМ
+Воспроизводимые синтетические записи вместо одной зашитой записи на страну
+- Имена, телефоны, адреса, индексы и компании в формате 24 локалей
+- Seed задает всю последовательность: тот же seed - те же данные
+- Потоковая выдача пачками: миллионы записей без хранения в памяти
+- С NumPy случайные столбцы и шаблоны индексов/телефонов строятся векторно, без NumPy - тот же API на random
+  (последовательности двух бэкендов различаются, внутри бэкенда seed воспроизводим)
+"""
+
+import random
+import string
+import unicodedata
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Шаблоны: "#" - цифра, "A" - заглавная латинская буква, остальное - как есть (только ASCII)
+# Имена чередуются: четный индекс - мужское, нечетный - женское (для last_female, где фамилия зависит от рода)
+LOCALES = {
+    "en_US": {
+        "country": "US", "postal": "#####", "phone": "+1 (2##) 555-01##",
+        "address": "{n} {street}, {city}, {region} {postal}",
+        "first": ["James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda", "David", "Emily"],
+        "last": ["Smith", "Johnson", "Williams", "Brown", "Jones", "Miller", "Davis", "Wilson", "Taylor", "Clark"],
+        "streets": ["Main Street", "Oak Avenue", "Maple Drive", "Cedar Lane", "Park Road", "Elm Street"],
+        "cities": [("New York", "NY"), ("Chicago", "IL"), ("Houston", "TX"), ("Phoenix", "AZ"), ("Denver", "CO"),
+                   ("Seattle", "WA")],
+        "companies": ["LLC", "Inc.", "Corp."],
+    },
+    "en_GB": {
+        "country": "UK", "postal": "AA# #AA", "phone": "+44 20 #### ####",
+        "address": "{n} {street}, {city} {postal}",
+        "first": ["Oliver", "Amelia", "George", "Isla", "Harry", "Ava", "Jack", "Emily", "James", "Sophie"],
+        "last": ["Smith", "Jones", "Taylor", "Brown", "Williams", "Wilson", "Evans", "Thomas", "Roberts", "Walker"],
+        "streets": ["High Street", "Station Road", "Church Lane", "Victoria Road", "Baker Street", "Mill Lane"],
+        "cities": [("London", ""), ("Manchester", ""), ("Bristol", ""), ("Leeds", ""), ("Liverpool", "")],
+        "companies": ["Ltd", "PLC", "& Sons Ltd"],
+    },
+    "en_CA": {
+        "country": "CA", "postal": "A#A #A#", "phone": "+1 (4##) 555-01##",
+        "address": "{n} {street}, {city}, {region} {postal}",
+        "first": ["Liam", "Olivia", "Noah", "Emma", "William", "Charlotte", "Lucas", "Chloe", "Ethan", "Maya"],
+        "last": ["Smith", "Brown", "Tremblay", "Martin", "Roy", "Wilson", "MacDonald", "Gagnon", "Lee", "Campbell"],
+        "streets": ["Yonge Street", "King Street", "Queen Street", "Bay Street", "Dundas Street", "Maple Avenue"],
+        "cities": [("Toronto", "ON"), ("Vancouver", "BC"), ("Calgary", "AB"), ("Ottawa", "ON"), ("Halifax", "NS")],
+        "companies": ["Inc.", "Ltd.", "Corp."],
+    },
+    "en_AU": {
+        "country": "AU", "postal": "####", "phone": "+61 4## ### ###",
+        "address": "{n} {street}, {city} {region} {postal}",
+        "first": ["Jack", "Charlotte", "William", "Olivia", "Thomas", "Mia", "Lachlan", "Ruby", "Cooper", "Zoe"],
+        "last": ["Smith", "Jones", "Williams", "Brown", "Wilson", "Taylor", "Nguyen", "Kelly", "Ryan", "White"],
+        "streets": ["George Street", "Collins Street", "Queen Street", "Pitt Street", "Beach Road", "Hill Street"],
+        "cities": [("Sydney", "NSW"), ("Melbourne", "VIC"), ("Brisbane", "QLD"), ("Perth", "WA"), ("Adelaide", "SA")],
+        "companies": ["Pty Ltd", "Group", "Holdings"],
+    },
+    "en_IN": {
+        "country": "IN", "postal": "######", "phone": "+91 9#### #####",
+        "address": "{n}, {street}, {city}, {region} {postal}",
+        "first": ["Raj", "Priya", "Amit", "Anjali", "Rahul", "Sneha", "Vikram", "Pooja", "Arjun", "Neha"],
+        "last": ["Patel", "Sharma", "Singh", "Kumar", "Gupta", "Reddy", "Iyer", "Nair", "Joshi", "Mehta"],
+        "streets": ["MG Road", "Brigade Road", "Park Street", "Linking Road", "Anna Salai", "Residency Road"],
+        "cities": [("Bangalore", "Karnataka"), ("Mumbai", "Maharashtra"), ("Chennai", "Tamil Nadu"),
+                   ("Delhi", "Delhi"), ("Kolkata", "West Bengal"), ("Pune", "Maharashtra")],
+        "companies": ["Pvt Ltd", "Technologies", "Solutions"],
+    },
+    "de_DE": {
+        "country": "DE", "postal": "#####", "phone": "+49 30 ########",
+        "address": "{street} {n}, {postal} {city}",
+        "first": ["Lukas", "Anna", "Maximilian", "Lena", "Felix", "Sophie", "Jonas", "Marie", "Leon", "Hannah"],
+        "last": ["Müller", "Schmidt", "Schneider", "Fischer", "Weber", "Meyer", "Wagner", "Becker", "Hoffmann",
+                 "Schäfer"],
+        "streets": ["Hauptstraße", "Schulstraße", "Bahnhofstraße", "Gartenstraße", "Lindenweg", "Bergstraße"],
+        "cities": [("Berlin", ""), ("Hamburg", ""), ("München", ""), ("Köln", ""), ("Frankfurt am Main", "")],
+        "companies": ["GmbH", "AG", "GmbH & Co. KG"],
+    },
+    "de_AT": {
+        "country": "AT", "postal": "####", "phone": "+43 1 #######",
+        "address": "{street} {n}, {postal} {city}",
+        "first": ["Lukas", "Anna", "David", "Laura", "Tobias", "Julia", "Florian", "Lea", "Paul", "Sarah"],
+        "last": ["Gruber", "Huber", "Bauer", "Wagner", "Pichler", "Steiner", "Moser", "Mayer", "Hofer", "Leitner"],
+        "streets": ["Mariahilfer Straße", "Hauptplatz", "Kirchengasse", "Ringstraße", "Dorfstraße", "Bahnhofweg"],
+        "cities": [("Wien", ""), ("Graz", ""), ("Linz", ""), ("Salzburg", ""), ("Innsbruck", "")],
+        "companies": ["GmbH", "AG", "KG"],
+    },
+    "de_CH": {
+        "country": "CH", "postal": "####", "phone": "+41 44 ### ## ##",
+        "address": "{street} {n}, {postal} {city}",
+        "first": ["Noah", "Mia", "Luca", "Emma", "Leon", "Lina", "Elias", "Lara", "Nico", "Nina"],
+        "last": ["Müller", "Meier", "Schmid", "Keller", "Weber", "Huber", "Schneider", "Frei", "Brunner", "Baumann"],
+        "streets": ["Bahnhofstrasse", "Dorfstrasse", "Seestrasse", "Kirchweg", "Hauptstrasse", "Rosenweg"],
+        "cities": [("Zürich", ""), ("Bern", ""), ("Basel", ""), ("Luzern", ""), ("St. Gallen", "")],
+        "companies": ["AG", "GmbH", "SA"],
+    },
+    "fr_FR": {
+        "country": "FR", "postal": "#####", "phone": "+33 6 ## ## ## ##",
+        "address": "{n} {street}, {postal} {city}",
+        "first": ["Louis", "Emma", "Gabriel", "Jade", "Léo", "Louise", "Hugo", "Chloé", "Jules", "Camille"],
+        "last": ["Martin", "Bernard", "Dubois", "Thomas", "Robert", "Richard", "Petit", "Durand", "Leroy", "Moreau"],
+        "streets": ["rue de la Paix", "avenue Victor Hugo", "boulevard Voltaire", "rue Nationale", "rue du Moulin",
+                    "place de la République"],
+        "cities": [("Paris", ""), ("Lyon", ""), ("Marseille", ""), ("Toulouse", ""), ("Nantes", ""), ("Lille", "")],
+        "companies": ["SARL", "SA", "SAS"],
+    },
+    "fr_BE": {
+        "country": "BE", "postal": "####", "phone": "+32 4## ## ## ##",
+        "address": "{street} {n}, {postal} {city}",
+        "first": ["Arthur", "Olivia", "Louis", "Emma", "Jules", "Alice", "Victor", "Léa", "Adam", "Lina"],
+        "last": ["Peeters", "Janssens", "Dubois", "Lambert", "Dupont", "Martin", "Simon", "Laurent", "Leroy", "Renard"],
+        "streets": ["rue Neuve", "avenue Louise", "chaussée de Wavre", "rue Royale", "boulevard Anspach",
+                    "rue de la Station"],
+        "cities": [("Bruxelles", ""), ("Liège", ""), ("Namur", ""), ("Charleroi", ""), ("Mons", "")],
+        "companies": ["SPRL", "SA", "SRL"],
+    },
+    "es_ES": {
+        "country": "ES", "postal": "#####", "phone": "+34 6## ### ###",
+        "address": "{street} {n}, {postal} {city}",
+        "first": ["Hugo", "Lucía", "Martín", "Sofía", "Pablo", "María", "Daniel", "Paula", "Alejandro", "Carmen"],
+        "last": ["García", "Fernández", "González", "Rodríguez", "López", "Martínez", "Sánchez", "Pérez", "Gómez",
+                 "Ruiz"],
+        "streets": ["Calle Mayor", "Gran Vía", "Calle de Alcalá", "Avenida de la Constitución", "Calle Real",
+                    "Paseo del Prado"],
+        "cities": [("Madrid", ""), ("Barcelona", ""), ("Valencia", ""), ("Sevilla", ""), ("Bilbao", "")],
+        "companies": ["S.L.", "S.A.", "S.L.U."],
+    },
+    "es_MX": {
+        "country": "MX", "postal": "#####", "phone": "+52 55 #### ####",
+        "address": "{street} {n}, {postal} {city}, {region}",
+        "first": ["Santiago", "Sofía", "Mateo", "Valentina", "Diego", "Regina", "Emiliano", "Camila", "Leonardo",
+                  "Ximena"],
+        "last": ["Hernández", "García", "Martínez", "López", "González", "Pérez", "Rodríguez", "Sánchez", "Ramírez",
+                 "Flores"],
+        "streets": ["Avenida Reforma", "Calle Madero", "Avenida Insurgentes", "Calle Juárez", "Calle Morelos",
+                    "Avenida Hidalgo"],
+        "cities": [("Ciudad de México", "CDMX"), ("Guadalajara", "Jal."), ("Monterrey", "N.L."),
+                   ("Puebla", "Pue."), ("Mérida", "Yuc.")],
+        "companies": ["S.A. de C.V.", "S. de R.L.", "S.C."],
+    },
+    "it_IT": {
+        "country": "IT", "postal": "#####", "phone": "+39 3## ### ####",
+        "address": "{street} {n}, {postal} {city}",
+        "first": ["Leonardo", "Sofia", "Francesco", "Giulia", "Alessandro", "Aurora", "Lorenzo", "Alice", "Mattia",
+                  "Ginevra"],
+        "last": ["Rossi", "Russo", "Ferrari", "Esposito", "Bianchi", "Romano", "Colombo", "Ricci", "Marino", "Greco"],
+        "streets": ["Via Roma", "Via Garibaldi", "Corso Italia", "Via Mazzini", "Piazza Dante", "Via Verdi"],
+        "cities": [("Roma", ""), ("Milano", ""), ("Napoli", ""), ("Torino", ""), ("Bologna", ""), ("Firenze", "")],
+        "companies": ["S.r.l.", "S.p.A.", "S.n.c."],
+    },
+    "pt_BR": {
+        "country": "BR", "postal": "#####-###", "phone": "+55 11 9####-####",
+        "address": "{street}, {n}, {city} - {region}, {postal}",
+        "first": ["Carlos", "Ana", "Lucas", "Mariana", "Gabriel", "Juliana", "Rafael", "Beatriz", "Pedro", "Larissa"],
+        "last": ["Silva", "Santos", "Oliveira", "Souza", "Rodrigues", "Ferreira", "Alves", "Pereira", "Lima", "Gomes"],
+        "streets": ["Av. Paulista", "Rua Augusta", "Rua das Flores", "Av. Atlântica", "Rua XV de Novembro",
+                    "Av. Brasil"],
+        "cities": [("São Paulo", "SP"), ("Rio de Janeiro", "RJ"), ("Belo Horizonte", "MG"), ("Curitiba", "PR"),
+                   ("Salvador", "BA")],
+        "companies": ["Ltda", "S.A.", "ME"],
+    },
+    "pt_PT": {
+        "country": "PT", "postal": "####-###", "phone": "+351 9## ### ###",
+        "address": "{street}, {n}, {postal} {city}",
+        "first": ["João", "Maria", "Rodrigo", "Leonor", "Martim", "Matilde", "Tomás", "Beatriz", "Duarte", "Inês"],
+        "last": ["Silva", "Santos", "Ferreira", "Pereira", "Oliveira", "Costa", "Rodrigues", "Martins", "Sousa",
+                 "Fernandes"],
+        "streets": ["Rua Augusta", "Avenida da Liberdade", "Rua de Santa Catarina", "Rua do Carmo",
+                    "Avenida dos Aliados", "Rua Direita"],
+        "cities": [("Lisboa", ""), ("Porto", ""), ("Braga", ""), ("Coimbra", ""), ("Faro", "")],
+        "companies": ["Lda.", "S.A.", "Unipessoal Lda."],
+    },
+    "nl_NL": {
+        "country": "NL", "postal": "#### AA", "phone": "+31 6 ########",
+        "address": "{street} {n}, {postal} {city}",
+        "first": ["Daan", "Emma", "Sem", "Julia", "Lucas", "Tess", "Levi", "Sophie", "Finn", "Anna"],
+        "last": ["de Jong", "Jansen", "de Vries", "van den Berg", "Bakker", "Visser", "Smit", "Meijer", "de Boer",
+                 "Mulder"],
+        "streets": ["Kerkstraat", "Dorpsstraat", "Stationsweg", "Molenweg", "Schoolstraat", "Prinsengracht"],
+        "cities": [("Amsterdam", ""), ("Rotterdam", ""), ("Utrecht", ""), ("Den Haag", ""), ("Eindhoven", "")],
+        "companies": ["B.V.", "N.V.", "V.O.F."],
+    },
+    "pl_PL": {
+        "country": "PL", "postal": "##-###", "phone": "+48 ### ### ###",
+        "address": "ul. {street} {n}, {postal} {city}",
+        "first": ["Jakub", "Zuzanna", "Antoni", "Julia", "Jan", "Maja", "Szymon", "Zofia", "Łukasz", "Hanna"],
+        "last": ["Nowak", "Kowalski", "Wiśniewski", "Wójcik", "Kamiński", "Lewandowski", "Zieliński", "Szymański",
+                 "Woźniak", "Dąbrowski"],
+        "last_female": ["Nowak", "Kowalska", "Wiśniewska", "Wójcik", "Kamińska", "Lewandowska", "Zielińska",
+                        "Szymańska", "Woźniak", "Dąbrowska"],
+        "streets": ["Marszałkowska", "Długa", "Polna", "Lipowa", "Mickiewicza", "Kościuszki"],
+        "cities": [("Warszawa", ""), ("Kraków", ""), ("Wrocław", ""), ("Poznań", ""), ("Gdańsk", "")],
+        "companies": ["Sp. z o.o.", "S.A.", "Sp.j."],
+    },
+    "sv_SE": {
+        "country": "SE", "postal": "### ##", "phone": "+46 70 ### ## ##",
+        "address": "{street} {n}, {postal} {city}",
+        "first": ["William", "Alice", "Lucas", "Maja", "Elias", "Elsa", "Hugo", "Astrid", "Oscar", "Ebba"],
+        "last": ["Andersson", "Johansson", "Karlsson", "Nilsson", "Eriksson", "Larsson", "Olsson", "Persson",
+                 "Svensson", "Lindberg"],
+        "streets": ["Storgatan", "Drottninggatan", "Kungsgatan", "Skolgatan", "Kyrkogatan", "Sveavägen"],
+        "cities": [("Stockholm", ""), ("Göteborg", ""), ("Malmö", ""), ("Uppsala", ""), ("Västerås", "")],
+        "companies": ["AB", "HB", "Aktiebolag"],
+    },
+    "cs_CZ": {
+        "country": "CZ", "postal": "### ##", "phone": "+420 6## ### ###",
+        "address": "{street} {n}, {postal} {city}",
+        "first": ["Jakub", "Eliška", "Jan", "Tereza", "Tomáš", "Anna", "Adam", "Adéla", "Matyáš", "Natálie"],
+        "last": ["Novák", "Svoboda", "Novotný", "Dvořák", "Černý", "Procházka", "Kučera", "Veselý", "Horák",
+                 "Němec"],
+        "last_female": ["Nováková", "Svobodová", "Novotná", "Dvořáková", "Černá", "Procházková", "Kučerová",
+                        "Veselá", "Horáková", "Němcová"],
+        "streets": ["Národní", "Vodičkova", "Husova", "Palackého", "Masarykova", "Nádražní"],
+        "cities": [("Praha", ""), ("Brno", ""), ("Ostrava", ""), ("Plzeň", ""), ("Olomouc", "")],
+        "companies": ["s.r.o.", "a.s.", "v.o.s."],
+    },
+    "tr_TR": {
+        "country": "TR", "postal": "#####", "phone": "+90 5## ### ## ##",
+        "address": "{street} No:{n}, {postal} {city}",
+        "first": ["Yusuf", "Zeynep", "Eymen", "Elif", "Mustafa", "Defne", "Ömer", "Azra", "Emir", "Ecrin"],
+        "last": ["Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Yıldız", "Yıldırım", "Öztürk", "Aydın", "Özdemir"],
+        "streets": ["Atatürk Caddesi", "İstiklal Caddesi", "Cumhuriyet Caddesi", "Gazi Sokak", "Bağdat Caddesi",
+                    "Fatih Sokak"],
+        "cities": [("İstanbul", ""), ("Ankara", ""), ("İzmir", ""), ("Bursa", ""), ("Antalya", "")],
+        "companies": ["A.Ş.", "Ltd. Şti.", "Tic. A.Ş."],
+    },
+    "ru_RU": {
+        "country": "RU", "postal": "######", "phone": "+7 (9##) ###-##-##",
+        "address": "{postal}, г. {city}, {street}, д. {n}",
+        "first": ["Александр", "Анна", "Дмитрий", "Мария", "Максим", "Елена", "Иван", "Ольга", "Сергей", "Наталья"],
+        "first_latin": ["Aleksandr", "Anna", "Dmitriy", "Mariya", "Maksim", "Elena", "Ivan", "Olga", "Sergey",
+                        "Natalya"],
+        "last": ["Иванов", "Смирнов", "Кузнецов", "Попов", "Васильев", "Петров", "Соколов", "Михайлов", "Новиков",
+                 "Федоров"],
+        "last_latin": ["Ivanov", "Smirnov", "Kuznetsov", "Popov", "Vasilev", "Petrov", "Sokolov", "Mikhaylov",
+                       "Novikov", "Fedorov"],
+        "last_female": ["Иванова", "Смирнова", "Кузнецова", "Попова", "Васильева", "Петрова", "Соколова",
+                        "Михайлова", "Новикова", "Федорова"],
+        "last_female_latin": ["Ivanova", "Smirnova", "Kuznetsova", "Popova", "Vasileva", "Petrova", "Sokolova",
+                              "Mikhaylova", "Novikova", "Fedorova"],
+        "streets": ["ул. Ленина", "ул. Тверская", "пр. Мира", "ул. Садовая", "ул. Гагарина", "Невский пр."],
+        "cities": [("Москва", ""), ("Санкт-Петербург", ""), ("Новосибирск", ""), ("Екатеринбург", ""),
+                   ("Казань", "")],
+        "companies": ["ООО", "АО", "ПАО"],
+        "company_first": True,
+    },
+    "uk_UA": {
+        "country": "UA", "postal": "#####", "phone": "+380 ## ### ## ##",
+        "address": "{street}, {n}, м. {city}, {postal}",
+        "first": ["Олександр", "Анна", "Андрій", "Марія", "Дмитро", "Олена", "Іван", "Софія", "Максим", "Катерина"],
+        "first_latin": ["Oleksandr", "Anna", "Andrii", "Mariia", "Dmytro", "Olena", "Ivan", "Sofiia", "Maksym",
+                        "Kateryna"],
+        "last": ["Мельник", "Шевченко", "Бойко", "Коваленко", "Бондаренко", "Ткаченко", "Кравченко", "Олійник",
+                 "Шевчук", "Поліщук"],
+        "last_latin": ["Melnyk", "Shevchenko", "Boiko", "Kovalenko", "Bondarenko", "Tkachenko", "Kravchenko",
+                       "Oliinyk", "Shevchuk", "Polishchuk"],
+        "streets": ["вул. Хрещатик", "вул. Шевченка", "просп. Перемоги", "вул. Садова", "вул. Франка",
+                    "вул. Лесі Українки"],
+        "cities": [("Київ", ""), ("Львів", ""), ("Харків", ""), ("Одеса", ""), ("Дніпро", "")],
+        "companies": ["ТОВ", "ПАТ", "ПП"],
+        "company_first": True,
+    },
+    "ja_JP": {
+        "country": "JP", "postal": "###-####", "phone": "+81 90-####-####",
+        "address": "〒{postal} {city}{street}{n}",
+        "first": ["翔太", "さくら", "大輝", "陽菜", "蓮", "結衣", "悠真", "美咲", "健太", "葵"],
+        "first_latin": ["Shota", "Sakura", "Daiki", "Hina", "Ren", "Yui", "Yuma", "Misaki", "Kenta", "Aoi"],
+        "last": ["佐藤", "鈴木", "高橋", "田中", "伊藤", "渡辺", "山本", "中村", "小林", "加藤"],
+        "last_latin": ["Sato", "Suzuki", "Takahashi", "Tanaka", "Ito", "Watanabe", "Yamamoto", "Nakamura",
+                       "Kobayashi", "Kato"],
+        "streets": ["中央1丁目", "本町2丁目", "栄3丁目", "桜町1丁目", "緑町4丁目", "旭町2丁目"],
+        "cities": [("東京都千代田区", ""), ("大阪府大阪市", ""), ("愛知県名古屋市", ""), ("北海道札幌市", ""),
+                   ("福岡県福岡市", "")],
+        "companies": ["株式会社", "合同会社", "有限会社"],
+        "company_sep": "",
+        "name_order": "last_first",
+    },
+    "zh_CN": {
+        "country": "CN", "postal": "######", "phone": "+86 13# #### ####",
+        "address": "{city}{street}{n}号 {postal}",
+        "first": ["伟", "芳", "娜", "敏", "静", "强", "磊", "洋", "艳", "杰"],
+        "first_latin": ["Wei", "Fang", "Na", "Min", "Jing", "Qiang", "Lei", "Yang", "Yan", "Jie"],
+        "last": ["王", "李", "张", "刘", "陈", "杨", "黄", "赵", "吴", "周"],
+        "last_latin": ["Wang", "Li", "Zhang", "Liu", "Chen", "Yang", "Huang", "Zhao", "Wu", "Zhou"],
+        "streets": ["中山路", "人民路", "解放路", "建设路", "和平路", "长安街"],
+        "cities": [("北京市", ""), ("上海市", ""), ("广州市", ""), ("深圳市", ""), ("杭州市", "")],
+        "companies": ["有限公司", "股份有限公司", "科技有限公司"],
+        "company_sep": "",
+        "name_sep": "",
+        "name_order": "last_first",
+    },
+}
+
+# Коды стран GeoProxyFormTester -> локаль
+COUNTRY_LOCALES = {spec["country"]: code for code, spec in reversed(list(LOCALES.items()))}
+
+EMAIL_DOMAINS = ["example.com", "example.org", "example.net", "test.example"]
+MAX_HOUSE_NUMBER = 200
+
+# Буквы, которые NFKD не раскладывает на базовую латиницу
+ASCII_EXTRA = str.maketrans({"ł": "l", "Ł": "L", "ß": "ss", "ø": "o", "Ø": "O", "æ": "ae", "đ": "d", "ı": "i"})
+
+
+def ascii_fold(text):
+    """Имя для e-mail: латиница в нижнем регистре, без диакритики и пробелов"""
+    text = unicodedata.normalize("NFKD", text.translate(ASCII_EXTRA)).encode("ascii", "ignore").decode()
+    return "".join(char for char in text.lower() if char in string.ascii_lowercase)
+
+
+def locale_for_country(country):
+    """Локаль по коду страны прокси (US, UK, IN, BR...); по умолчанию en_US"""
+    return COUNTRY_LOCALES.get(country, "en_US")
+
+
+def template_parts(template):
+    """Шаблон "{n} {street}" -> список литералов и имен столбцов для склейки"""
+    parts = []
+    for literal, field, _, _ in string.Formatter().parse(template):
+        if literal:
+            parts.append(("text", literal))
+        if field:
+            parts.append(("column", field))
+    return parts
+
+
+class NumpyBackend:
+    """Случайные столбцы целиком через numpy.random.Generator"""
+
+    def __init__(self, seed):
+        self.rng = np.random.default_rng(seed)
+
+    def integers(self, low, high, size):
+        return self.rng.integers(low, high, size)
+
+    def take(self, values, indices):
+        return np.asarray(values, dtype=object)[indices]
+
+    def numbers(self, low, high, size):
+        return self.rng.integers(low, high, size).astype(str).astype(object)
+
+    def by_gender(self, last_idx, first_idx):
+        return last_idx * 2 + first_idx % 2
+
+    def pattern(self, pattern, size):
+        """Строки по шаблону: матрица байтов (size x len) -> массив строк одним view"""
+        codes = np.empty((size, len(pattern)), dtype=np.uint8)
+        for column, char in enumerate(pattern):
+            if char == "#":
+                codes[:, column] = self.rng.integers(48, 58, size)
+            elif char == "A":
+                codes[:, column] = self.rng.integers(65, 91, size)
+            else:
+                codes[:, column] = ord(char)
+        return codes.view(f"S{len(pattern)}").ravel().astype(str).astype(object)
+
+    def concat(self, parts):
+        result = parts[0]
+        for part in parts[1:]:
+            result = result + part  # поэлементно для object-массивов, строка транслируется
+        return result
+
+    def to_list(self, column, size):
+        return column.tolist() if not isinstance(column, str) else [column] * size
+
+
+class PythonBackend:
+    """Тот же API на random.Random - без NumPy"""
+
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+
+    def integers(self, low, high, size):
+        return [self.rng.randrange(low, high) for _ in range(size)]
+
+    def take(self, values, indices):
+        return [values[i] for i in indices]
+
+    def numbers(self, low, high, size):
+        return [str(self.rng.randrange(low, high)) for _ in range(size)]
+
+    def by_gender(self, last_idx, first_idx):
+        return [last * 2 + first % 2 for last, first in zip(last_idx, first_idx)]
+
+    def pattern(self, pattern, size):
+        choice = self.rng.choice
+        digits, letters = string.digits, string.ascii_uppercase
+        return ["".join(choice(digits) if char == "#" else choice(letters) if char == "A" else char
+                        for char in pattern) for _ in range(size)]
+
+    def concat(self, parts):
+        size = max(len(part) for part in parts if not isinstance(part, str))
+        columns = [[part] * size if isinstance(part, str) else part for part in parts]
+        return ["".join(row) for row in zip(*columns)]
+
+    def to_list(self, column, size):
+        return list(column) if not isinstance(column, str) else [column] * size
+
+
+class FormDataGenerator:
+    """Потоковый генератор записей для форм по локалям"""
+
+    FIELDS = ("first_name", "last_name", "full_name", "email", "phone", "address", "company", "zip_code", "city",
+              "country", "locale")
+
+    def __init__(self, seed=None, locales=None, batch_size=10000, use_numpy=None):
+        self.seed = random.SystemRandom().randrange(2 ** 32) if seed is None else seed
+        self.locales = list(locales or LOCALES)
+        unknown = [code for code in self.locales if code not in LOCALES]
+        if unknown:
+            raise ValueError(f"Неизвестные локали: {', '.join(unknown)}")
+        self.batch_size = batch_size
+        use_numpy = NUMPY_AVAILABLE if use_numpy is None else use_numpy and NUMPY_AVAILABLE
+        self.backend = NumpyBackend(self.seed) if use_numpy else PythonBackend(self.seed)
+        self._names = {}  # локаль -> подготовленные списки имен и фамилий
+        self._stream = None
+
+    def _prepared_names(self, code):
+        """Фамилии парами (мужская, женская) и их латиница для e-mail - один раз на локаль"""
+        if code not in self._names:
+            spec = LOCALES[code]
+            male_latin = spec.get("last_latin", spec["last"])
+            female = spec.get("last_female", spec["last"])
+            female_latin = spec.get("last_female_latin", male_latin if "last_female" not in spec else female)
+            surnames = [name for pair in zip(spec["last"], female) for name in pair]
+            surnames_latin = [ascii_fold(name) for pair in zip(male_latin, female_latin) for name in pair]
+            first_latin = [ascii_fold(name) for name in spec.get("first_latin", spec["first"])]
+            self._names[code] = (surnames, surnames_latin, first_latin)
+        return self._names[code]
+
+    def columns(self, code, size):
+        """Пачка записей одной локали по столбцам: имя столбца -> список значений"""
+        spec, b = LOCALES[code], self.backend
+        surnames, surnames_latin, first_latin = self._prepared_names(code)
+
+        first_idx = b.integers(0, len(spec["first"]), size)
+        last_idx = b.by_gender(b.integers(0, len(spec["last"]), size), first_idx)
+        city_idx = b.integers(0, len(spec["cities"]), size)
+
+        first = b.take(spec["first"], first_idx)
+        last = b.take(surnames, last_idx)
+        columns = {
+            "n": b.numbers(1, MAX_HOUSE_NUMBER, size),
+            "street": b.take(spec["streets"], b.integers(0, len(spec["streets"]), size)),
+            "city": b.take([city for city, _ in spec["cities"]], city_idx),
+            "region": b.take([region for _, region in spec["cities"]], city_idx),
+            "postal": b.pattern(spec["postal"], size),
+        }
+        address = b.concat([text if kind == "text" else columns[text]
+                            for kind, text in template_parts(spec["address"])])
+        name_sep = spec.get("name_sep", " ")
+        if spec.get("name_order") == "last_first":
+            full_name = b.concat([last, name_sep, first])
+        else:
+            full_name = b.concat([first, name_sep, last])
+
+        email = b.concat([b.take(first_latin, first_idx), ".", b.take(surnames_latin, last_idx),
+                          b.numbers(1, 1000, size), "@",
+                          b.take(EMAIL_DOMAINS, b.integers(0, len(EMAIL_DOMAINS), size))])
+        suffix = b.take(spec["companies"], b.integers(0, len(spec["companies"]), size))
+        company_sep = spec.get("company_sep", " ")
+        if spec.get("company_first"):
+            company = b.concat([suffix, company_sep, last])
+        else:
+            company = b.concat([last, company_sep, suffix])
+
+        return {
+            "first_name": b.to_list(first, size),
+            "last_name": b.to_list(last, size),
+            "full_name": b.to_list(full_name, size),
+            "email": b.to_list(email, size),
+            "phone": b.to_list(b.pattern(spec["phone"], size), size),
+            "address": b.to_list(address, size),
+            "company": b.to_list(company, size),
+            "zip_code": b.to_list(columns["postal"], size),
+            "city": b.to_list(columns["city"], size),
+            "country": [spec["country"]] * size,
+            "locale": [code] * size,
+        }
+
+    def batches(self, count=None, locale=None):
+        """Пачки по столбцам (до batch_size строк); count=None - бесконечно; локаль - по строкам вперемешку"""
+        produced = 0
+        while count is None or produced < count:
+            size = self.batch_size if count is None else min(self.batch_size, count - produced)
+            if locale or len(self.locales) == 1:
+                yield self.columns(locale or self.locales[0], size)
+            else:
+                yield self._mixed_batch(size)
+            produced += size
+
+    def _mixed_batch(self, size):
+        """Пачка со случайной локалью каждой строки (порядок строк воспроизводим)"""
+        assignment = list(self.backend.integers(0, len(self.locales), size))
+        result = {field: [None] * size for field in self.FIELDS}
+        for index, code in enumerate(self.locales):
+            positions = [row for row, value in enumerate(assignment) if value == index]
+            if not positions:
+                continue
+            columns = self.columns(code, len(positions))
+            for field in self.FIELDS:
+                target, values = result[field], columns[field]
+                for position, value in zip(positions, values):
+                    target[position] = value
+        return result
+
+    def records(self, count=None, locale=None):
+        """Потоковый итератор записей-словарей"""
+        for batch in self.batches(count, locale):
+            fields = list(batch)
+            for row in zip(*(batch[field] for field in fields)):
+                yield dict(zip(fields, row))
+
+    def one(self, locale=None):
+        """Следующая запись общего потока (или одна запись указанной локали)"""
+        if locale:
+            columns = self.columns(locale, 1)
+            return {field: values[0] for field, values in columns.items()}
+        if self._stream is None:
+            self._stream = self.records()
+        return next(self._stream)
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    generator = FormDataGenerator(seed=42)
+    print(f"🧬 Бэкенд: {'NumPy' if isinstance(generator.backend, NumpyBackend) else 'random'}, "
+          f"локалей: {len(generator.locales)}")
+
+    for code in ("en_US", "de_DE", "pt_BR", "ru_RU", "pl_PL", "ja_JP"):
+        print(f"  {code}: {generator.one(code)}")
+
+    started = time.perf_counter()
+    rows = sum(len(batch["email"]) for batch in FormDataGenerator(seed=42).batches(count))
+    elapsed = time.perf_counter() - started
+    print(f"⏱️ {rows} записей по столбцам за {elapsed:.2f}с ({rows / elapsed:,.0f} в секунду)")
+
+    first = [record["email"] for record in FormDataGenerator(seed=7).records(1000)]
+    again = [record["email"] for record in FormDataGenerator(seed=7).records(1000)]
+    assert first == again, "seed должен воспроизводить поток"
+    print("✅ Поток воспроизводим по seed")
@@ -0,0 +1,167 @@
+"""
+🧾 КЭШ СХЕМ ФОРМ
+Каждая страница разбирается один раз за прогон
+- Одним execute_script: формы, action/method, поля, кнопки отправки (ранжированные submit_finder)
+- Для каждого поля - стабильный CSS-селектор и список совпавших именованных запросов
+- Ключ кэша - URL; отпечаток структуры форм (DOM-хэш) сбрасывает устаревшую схему
+- Пока схема актуальна, страницу не нужно открывать заново ради поиска полей
+"""
+
+import threading
+import time
+
+from submit_finder import CSS_PATH_JS, SUBMIT_RANKER_JS
+
+# Отпечаток структуры форм: FNV-1a по тегам, типам, именам полей и action форм
+FINGERPRINT_JS = """
+var hugoFormFingerprint = function () {
+    var parts = [];
+    Array.prototype.forEach.call(document.forms, function (f) {
+        parts.push('F' + (f.getAttribute('action') || '') + '|' + (f.getAttribute('method') || ''));
+    });
+    document.querySelectorAll('input, textarea, select, button').forEach(function (el) {
+        parts.push(el.tagName + '|' + (el.getAttribute('type') || '') + '|' +
+                   (el.getAttribute('name') || '') + '|' + (el.id || ''));
+    });
+    var text = parts.join('\\n'), hash = 0x811c9dc5;
+    for (var i = 0; i < text.length; i++) {
+        hash ^= text.charCodeAt(i);
+        hash = Math.imul(hash, 0x01000193) >>> 0;
+    }
+    return ('0000000' + hash.toString(16)).slice(-8) + ':' + parts.length;
+};
+"""
+
+HASH_JS = FINGERPRINT_JS + "return hugoFormFingerprint();"
+
+EXTRACT_SCHEMA_JS = FINGERPRINT_JS + CSS_PATH_JS + SUBMIT_RANKER_JS + """
+var queries = arguments[0] || {};
+var formList = Array.prototype.slice.call(document.forms);
+
+var matches = function (el, css) {
+    try { return el.matches(css); } catch (e) { return false; }
+};
+
+// Кнопки отправки ранжируются в странице: для каждой формы - свой список, лучшая первой
+var plain = function (c) { return {selector: c.selector, form: c.form, type: c.type, text: c.text, score: c.score}; };
+var forms = formList.map(function (f, i) {
+    return {index: i, action: f.action, method: (f.getAttribute('method') || 'get').toLowerCase(),
+            submits: hugoRankSubmits(f).filter(function (c) { return c.form === i && c.score > 0; })
+                                       .map(function (c) { return c.selector; })};
+});
+var submits = hugoRankSubmits(null).filter(function (c) { return c.score > 0; }).map(plain);
+
+var fields = [];
+document.querySelectorAll('input, textarea, select, button').forEach(function (el) {
+    var formIndex = el.form ? formList.indexOf(el.form) : -1;
+    var type = (el.type || el.tagName).toLowerCase();
+
+    if (el.tagName === 'BUTTON' || type === 'submit' || type === 'image' || type === 'button') { return; }
+    if (type === 'hidden' || type === 'reset') { return; }
+
+    fields.push({
+        selector: hugoCssPath(el),
+        name: el.getAttribute('name'),
+        id: el.id || null,
+        type: type,
+        tag: el.tagName.toLowerCase(),
+        maxlength: el.maxLength > 0 ? el.maxLength : null,
+        form: formIndex,
+        queries: Object.keys(queries).filter(function (q) { return matches(el, queries[q]); })
+    });
+});
+
+return {hash: hugoFormFingerprint(), forms: forms, fields: fields, submits: submits};
+"""
+
+
+def normalize_url(url):
+    """URL без фрагмента и завершающего слэша - для сравнения страниц"""
+    return (url or "").split("#")[0].rstrip("/")
+
+
+class FormSchema:
+    """Схема форм одной страницы"""
+
+    def __init__(self, url, data):
+        self.url = url
+        self.dom_hash = data["hash"]
+        self.forms = data["forms"]
+        self.fields = data["fields"]
+        self.submits = data["submits"]
+        self.extracted_at = time.time()
+
+    def fields_for(self, query):
+        """Поля, совпавшие с именованным запросом, в порядке документа"""
+        return [field for field in self.fields if query in field["queries"]]
+
+    def submit_for(self, field):
+        """Селектор лучшей кнопки отправки для формы поля (или лучшей кнопки страницы)"""
+        if field.get("form", -1) >= 0:
+            submits = self.forms[field["form"]]["submits"]
+            if submits:
+                return submits[0]
+        return self.submits[0]["selector"] if self.submits else None
+
+
+class FormSchemaCache:
+    """Кэш схем форм на один прогон"""
+
+    def __init__(self, queries):
+        self.queries = queries  # имя -> CSS-запрос полей, например {"xss": "input[type='text']"}
+        self.hits = 0
+        self.extractions = 0
+        self._schemas = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, url):
+        """Схема из кэша без обращения к браузеру"""
+        with self._lock:
+            return self._schemas.get(normalize_url(url))
+
+    def invalidate(self, url=None):
+        """Сбросить схему страницы (или все схемы)"""
+        with self._lock:
+            if url is None:
+                self._schemas.clear()
+            else:
+                self._schemas.pop(normalize_url(url), None)
+
+    def is_at(self, driver, url):
+        """Браузер сейчас на этой странице"""
+        try:
+            return normalize_url(driver.current_url) == normalize_url(url)
+        except Exception:
+            return False
+
+    def current_hash(self, driver):
+        """Отпечаток форм текущего документа"""
+        return driver.execute_script(HASH_JS)
+
+    def extract(self, driver, url):
+        """Разобрать формы текущего документа одним скриптом и сохранить"""
+        schema = FormSchema(url, driver.execute_script(EXTRACT_SCHEMA_JS, self.queries))
+        with self._lock:
+            self._schemas[normalize_url(url)] = schema
+            self.extractions += 1
+        return schema
+
+    def get(self, driver, url, open_page):
+        """Схема страницы и флаг свежего разбора; переход - только если схемы нет"""
+        cached = self.lookup(url)
+
+        if cached is not None and not self.is_at(driver, url):
+            # Страница уже разобрана, а браузер на другой - открывать ее незачем
+            self.hits += 1
+            return cached, False
+
+        if not self.is_at(driver, url):
+            open_page(driver, url)
+
+        if cached is not None and self.current_hash(driver) == cached.dom_hash:
+            self.hits += 1
+            return cached, False
+
+        if cached is not None:
+            print(f"🔄 Формы на {url} изменились - схема обновлена")
+        return self.extract(driver, url), True
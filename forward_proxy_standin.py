@@ -0,0 +1,144 @@
+"""
+🔀 ЛОКАЛЬНЫЙ FORWARD-ПРОКСИ
+Офлайн-замена внешних прокси для проверки предполетного опроса
+- GET с абсолютным URL пересылается на целевой сервер (http.client)
+- CONNECT открывает TCP-туннель к host:port
+- delay - искусственная задержка ответа, broken - прокси отвечает 502 на все запросы
+
+Запуск отдельно: python forward_proxy_standin.py [порт]
+"""
+
+import http.client
+import select
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+
+class ForwardProxyHandler(BaseHTTPRequestHandler):
+    """Обработчик запросов прокси"""
+
+    server_version = "StandinProxy/1.0"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _prepare(self):
+        """Задержка и режим отказа стенда; False - запрос уже отклонен"""
+        if self.server.delay:
+            time.sleep(self.server.delay)
+        if self.server.broken:
+            self.send_error(502, "Bad Gateway")
+            return False
+        return True
+
+    def do_GET(self):
+        if not self._prepare():
+            return
+
+        parts = urlsplit(self.path)
+        if not parts.hostname:
+            self.send_error(400, "Absolute URL required")
+            return
+
+        try:
+            connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=10)
+            path = parts.path or "/"
+            if parts.query:
+                path += "?" + parts.query
+            connection.request("GET", path, headers={"Host": parts.netloc, "Connection": "close"})
+            response = connection.getresponse()
+            body = response.read()
+            connection.close()
+        except OSError as e:
+            self.send_error(502, f"Upstream error: {e}")
+            return
+
+        self.send_response(response.status)
+        self.send_header("Content-Type", response.getheader("Content-Type", "application/octet-stream"))
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_CONNECT(self):
+        if not self._prepare():
+            return
+
+        host, _, port = self.path.rpartition(":")
+        try:
+            upstream = socket.create_connection((host, int(port)), timeout=10)
+        except (OSError, ValueError) as e:
+            self.send_error(502, f"Tunnel error: {e}")
+            return
+
+        self.send_response(200, "Connection Established")
+        self.end_headers()
+        self.close_connection = True
+
+        # Пересылаем байты в обе стороны, пока одна из сторон не закроется
+        sockets = [self.connection, upstream]
+        try:
+            while True:
+                readable, _, broken = select.select(sockets, [], sockets, 30)
+                if broken or not readable:
+                    break
+                for sock in readable:
+                    data = sock.recv(65536)
+                    if not data:
+                        return
+                    (upstream if sock is self.connection else self.connection).sendall(data)
+        except OSError:
+            pass
+        finally:
+            upstream.close()
+
+
+class LocalForwardProxy:
+    """Forward-прокси в фоновом потоке"""
+
+    def __init__(self, host="127.0.0.1", port=0, delay=0.0, broken=False):
+        self.httpd = ThreadingHTTPServer((host, port), ForwardProxyHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.delay = delay
+        self.httpd.broken = broken
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def address(self):
+        return self.httpd.server_address[:2]
+
+    def as_pool_entry(self, name="Local proxy", country="US"):
+        """Запись в формате proxy_pool GeoProxyFormTester"""
+        host, port = self.address
+        return {"ip": host, "port": str(port), "country": country, "name": name}
+
+    def start(self):
+        """Запустить прокси; вернуть себя"""
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Остановить прокси"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8888
+    proxy = LocalForwardProxy(port=port)
+    host, port = proxy.address
+    print(f"🔀 Локальный прокси: {host}:{port} (Ctrl+C - остановить)")
+    try:
+        proxy.httpd.serve_forever()
+    except KeyboardInterrupt:
+        proxy.stop()
@@ -0,0 +1,187 @@
+"""
+🧪 HTTP-ПРЕДОТБОР PAYLOAD'ОВ
+Быстрая проверка payload'ов без браузера перед подтверждением в Chrome
+- Формы (action, method, поля) разбираются из HTML страницы один раз
+- Payload'ы отправляются через общий пул HTTP-соединений
+- В браузер уходят только кандидаты: отражение payload'а или сигнатура ошибки СУБД
+- Если форму или поле не удалось разобрать, браузер проверяет все payload'ы
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Поля, которые браузер отправил бы вместе с формой
+SUBMITTABLE_TYPES = ("text", "search", "password", "email", "hidden", "tel", "url", "number", "textarea")
+
+
+class FormParser(HTMLParser):
+    """Сборщик форм и их полей из HTML"""
+
+    def __init__(self):
+        super().__init__()
+        self.forms = []
+        self._form = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+
+        if tag == "form":
+            self._form = {
+                "action": attrs.get("action") or "",
+                "method": (attrs.get("method") or "get").lower(),
+                "fields": {},
+                "types": {},
+                "submit": None,
+            }
+            self.forms.append(self._form)
+            return
+
+        if self._form is None or tag not in ("input", "textarea", "select", "button"):
+            return
+
+        name = attrs.get("name")
+        field_type = (attrs.get("type") or ("textarea" if tag == "textarea" else "text")).lower()
+
+        if field_type in ("submit", "image") or tag == "button":
+            # Браузер отправляет имя/значение только нажатой кнопки - берем первую
+            if name and self._form["submit"] is None:
+                self._form["submit"] = (name, attrs.get("value") or "")
+            return
+
+        if name and (field_type in SUBMITTABLE_TYPES or tag == "select"):
+            self._form["fields"][name] = attrs.get("value") or ""
+            self._form["types"][name] = field_type
+
+    def handle_endtag(self, tag):
+        if tag == "form":
+            self._form = None
+
+
+def parse_forms(html, base_url):
+    """Формы страницы с абсолютными action URL"""
+    parser = FormParser()
+    try:
+        parser.feed(html)
+    except Exception:
+        pass
+
+    for form in parser.forms:
+        form["action"] = urljoin(base_url, form["action"])
+    return parser.forms
+
+
+class HttpPrescreener:
+    """Предотбор payload'ов через HTTP: какие из них стоит подтверждать в браузере"""
+
+    def __init__(self, matcher, pool_size=8, timeout=10, governor=None):
+        self.matcher = matcher  # ResponseMatcher с группами sql_error и login_bypass
+        self.timeout = timeout
+        self.governor = governor  # RateGovernor: темп и параллельность запросов к хосту
+        self.pool_size = pool_size
+        self.requests_sent = 0
+
+        # Общий пул keep-alive соединений для всех потоков
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["User-Agent"] = "Mozilla/5.0 (HugoSecurityPrescreen)"
+
+        self._forms = {}
+        self._lock = threading.Lock()
+
+    def _request(self, method, url, **kwargs):
+        """HTTP-запрос через регулятор нагрузки на хост"""
+        with self._lock:
+            self.requests_sent += 1
+        if not self.governor:
+            return self.session.request(method, url, timeout=self.timeout, **kwargs)
+
+        with self.governor.slot(url) as slot:
+            response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+            slot["status"] = response.status_code
+            slot["retry_after"] = response.headers.get("Retry-After")
+        return response
+
+    def forms_for(self, page_url):
+        """Формы страницы (скачиваются и разбираются один раз)"""
+        with self._lock:
+            if page_url in self._forms:
+                return self._forms[page_url]
+
+        try:
+            response = self._request("GET", page_url)
+            forms = parse_forms(response.text, response.url)
+        except Exception as e:
+            print(f"⚠️ Предотбор: не удалось разобрать формы {page_url}: {e}")
+            forms = []
+
+        with self._lock:
+            self._forms[page_url] = forms
+        return forms
+
+    def remember_forms(self, page_url, forms):
+        """Принять уже разобранные формы (например, из обхода сайта)"""
+        with self._lock:
+            self._forms[page_url] = forms
+
+    def find_form(self, page_url, field_name):
+        """Форма, в которой есть поле с указанным именем"""
+        for form in self.forms_for(page_url):
+            if field_name in form["fields"]:
+                return form
+        return None
+
+    def submit(self, form, field_name, payload):
+        """Отправить форму с payload'ом в поле; вернуть тело ответа"""
+        data = dict(form["fields"])
+        data[field_name] = payload
+        if form["submit"]:
+            data[form["submit"][0]] = form["submit"][1]
+
+        if form["method"] == "post":
+            response = self._request("POST", form["action"], data=data)
+        else:
+            response = self._request("GET", form["action"], params=data)
+        return response.text
+
+    def classify(self, kind, payload, body):
+        """Причина отправить payload в браузер или None"""
+        if kind == "xss":
+            # Payload вернулся без экранирования - браузер проверит, выполнится ли он
+            return "reflected" if self.matcher.match_text(body, [payload]).get("reflected") else None
+
+        hits = self.matcher.match_text(body)
+        if hits.get("sql_error"):
+            return f"sql_error:{hits['sql_error'][0]}"
+        if hits.get("login_bypass"):
+            return "login_marker"
+        return None
+
+    def screen(self, page_url, field_name, kind, payloads):
+        """Индексы payload'ов-кандидатов или None, если предотбор невозможен"""
+        form = self.find_form(page_url, field_name)
+        if form is None:
+            return None
+
+        def probe(indexed):
+            index, payload = indexed
+            try:
+                body = self.submit(form, field_name, payload)
+            except Exception:
+                return index, "http_error"  # не смогли проверить - пусть решает браузер
+            return index, self.classify(kind, payload, body)
+
+        with ThreadPoolExecutor(max_workers=self.pool_size) as executor:
+            verdicts = list(executor.map(probe, payloads))
+
+        return {index: reason for index, reason in verdicts if reason}
+
+    def close(self):
+        """Закрыть пул соединений"""
+        self.session.close()
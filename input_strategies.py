@@ -0,0 +1,71 @@
+"""
+⌨️ СТРАТЕГИИ ВВОДА ТЕКСТА
+Единый переключатель способа ввода для всех тестовых наборов
+- human     : посимвольный ввод с паузами (поведение по умолчанию)
+- send_keys : вся строка одним send_keys
+- cdp       : DevTools Input.insertText в сфокусированное поле
+- js        : установка value через JS с событиями input/change
+
+Режим задается переменной окружения HUGO_INPUT_MODE или set_input_mode()
+"""
+
+import os
+
+INPUT_MODES = ("human", "send_keys", "cdp", "js")
+
+# Нативный сеттер value, чтобы React/Vue увидели изменение
+SET_VALUE_JS = """
+var el = arguments[0], value = arguments[1];
+var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+var setter = Object.getOwnPropertyDescriptor(proto, 'value').set;
+el.focus();
+setter.call(el, value);
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+"""
+
+CLEAR_AND_FOCUS_JS = """
+var el = arguments[0];
+el.focus();
+if ('value' in el) { el.value = ''; }
+"""
+
+_mode = os.environ.get("HUGO_INPUT_MODE", "human")
+if _mode not in INPUT_MODES:
+    print(f"⚠️ Неизвестный HUGO_INPUT_MODE='{_mode}', используем 'human'")
+    _mode = "human"
+
+
+def set_input_mode(mode):
+    """Переключить способ ввода для всех наборов"""
+    global _mode
+    if mode not in INPUT_MODES:
+        raise ValueError(f"Неизвестный режим ввода: {mode}. Доступны: {', '.join(INPUT_MODES)}")
+    _mode = mode
+
+
+def current_input_mode():
+    """Текущий режим ввода"""
+    return _mode
+
+
+def is_fast_mode():
+    """True, если посимвольная имитация человека отключена"""
+    return _mode != "human"
+
+
+def fill_text(element, text, mode=None):
+    """Заполнить поле целиком выбранной стратегией (human = один send_keys)"""
+    mode = mode or _mode
+    driver = element.parent
+
+    if mode == "js":
+        driver.execute_script(SET_VALUE_JS, element, text)
+
+    elif mode == "cdp":
+        driver.execute_script(CLEAR_AND_FOCUS_JS, element)
+        driver.execute_cdp_cmd("Input.insertText", {"text": text})
+
+    else:
+        element.clear()
+        element.send_keys(text)
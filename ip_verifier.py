@@ -0,0 +1,216 @@
+"""
+📍 ПРОВЕРКА IP И ГЕОЛОКАЦИИ ЧЕРЕЗ HTTP
+Без переходов браузера по IP-сервисам
+- Пул keep-alive соединений (requests.Session) на каждый маршрут: прямой, прокси, Tor
+- Все сервисы опрашиваются параллельно, принимается первый достаточный ответ
+- Результат кэшируется по маршруту на TTL
+- Список сервисов настраивается (аргумент или HUGO_IP_SERVICES) - можно подставить локальный echo-сервер
+
+Самопроверка на локальных стендах: python ip_verifier.py
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_IP_SERVICES = [
+    "https://ipinfo.io/json",
+    "https://api.ipify.org?format=json",
+    "https://httpbin.org/ip",
+]
+
+# Поля разных сервисов, в которых лежат IP и геоданные
+IP_FIELDS = ("ip", "origin", "query")
+COUNTRY_FIELDS = ("country", "countryCode", "country_code")
+CITY_FIELDS = ("city",)
+REGION_FIELDS = ("region", "regionName")
+
+
+def configured_services():
+    """Сервисы из HUGO_IP_SERVICES (через запятую) или список по умолчанию"""
+    value = os.environ.get("HUGO_IP_SERVICES", "").strip()
+    return [url.strip() for url in value.split(",") if url.strip()] if value else list(DEFAULT_IP_SERVICES)
+
+
+def pick(data, fields):
+    """Первое непустое значение из списка полей"""
+    for field in fields:
+        if data.get(field):
+            return str(data[field])
+    return None
+
+
+def parse_answer(service, data):
+    """Ответ сервиса -> {ip, country, city, region, service}"""
+    ip = pick(data, IP_FIELDS)
+    if ip and "," in ip:
+        ip = ip.split(",")[0].strip()  # httpbin через прокси: "клиент, прокси"
+    return {
+        "ip": ip,
+        "country": pick(data, COUNTRY_FIELDS),
+        "city": pick(data, CITY_FIELDS),
+        "region": pick(data, REGION_FIELDS),
+        "service": service,
+    }
+
+
+class IpVerifier:
+    """Определение внешнего IP и страны маршрута через пул HTTP-сессий"""
+
+    def __init__(self, services=None, timeout=8, ttl=600):
+        self.services = list(services or configured_services())
+        self.timeout = timeout
+        self.ttl = ttl
+        self.requests_sent = 0
+        self._sessions = {}  # маршрут -> requests.Session
+        self._cache = {}     # маршрут -> (время, результат)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max(4, len(self.services) * 2))
+
+    def session_for(self, proxy_url):
+        """Сессия с пулом соединений для маршрута (None - напрямую)"""
+        with self._lock:
+            session = self._sessions.get(proxy_url)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=len(self.services), pool_maxsize=len(self.services),
+                                      max_retries=0)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers["User-Agent"] = "Mozilla/5.0 (HugoIpVerifier)"
+                if proxy_url:
+                    session.proxies = {"http": proxy_url, "https": proxy_url}
+                self._sessions[proxy_url] = session
+            return session
+
+    def _query(self, session, service):
+        """Один запрос к сервису; разобранный ответ или исключение"""
+        with self._lock:
+            self.requests_sent += 1
+        response = session.get(service, timeout=self.timeout)
+        response.raise_for_status()
+        return parse_answer(service, response.json())
+
+    def verify(self, proxy_url=None, need_country=True):
+        """IP и геоданные маршрута: первый достаточный ответ из параллельных запросов (или None)"""
+        with self._lock:
+            cached = self._cache.get(proxy_url)
+        if cached and time.time() - cached[0] < self.ttl:
+            return dict(cached[1], cached=True)
+
+        started = time.perf_counter()
+        session = self.session_for(proxy_url)
+        futures = {self._executor.submit(self._query, session, service): service for service in self.services}
+
+        best, errors = None, []
+        for future in as_completed(futures):
+            try:
+                answer = future.result()
+            except Exception as e:
+                errors.append(f"{futures[future]}: {str(e)[:80]}")
+                continue
+            if not answer["ip"]:
+                continue
+            if not need_country or answer["country"]:
+                best = answer
+                break  # достаточно - остальные ответы не ждем
+            best = best or answer  # только IP - запасной вариант, если страну не даст никто
+
+        for future in futures:
+            future.cancel()
+
+        if best is None:
+            for error in errors:
+                print(f"⚠️ {error}")
+            return None
+
+        result = dict(best, elapsed_ms=round((time.perf_counter() - started) * 1000, 1), cached=False)
+        with self._lock:
+            self._cache[proxy_url] = (time.time(), result)
+        return result
+
+    def invalidate(self, proxy_url=None):
+        """Сбросить кэш маршрута"""
+        with self._lock:
+            self._cache.pop(proxy_url, None)
+
+    def close(self):
+        """Закрыть сессии и пул потоков"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+        self._executor.shutdown(wait=False)
+
+
+_verifier = None
+_verifier_lock = threading.Lock()
+
+
+def get_ip_verifier(**kwargs):
+    """Общий проверяющий процесса: сессии и кэш делятся между воркерами"""
+    global _verifier
+    with _verifier_lock:
+        if _verifier is None:
+            _verifier = IpVerifier(**kwargs)
+        return _verifier
+
+
+if __name__ == "__main__":
+    import json
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from forward_proxy_standin import LocalForwardProxy
+
+    class EchoHandler(BaseHTTPRequestHandler):
+        """Локальный IP-сервис: /ip - только IP, /geo - IP и страна (с задержкой)"""
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            data = {"origin": self.client_address[0]}
+            if self.path.startswith("/geo"):
+                time.sleep(0.2)
+                data = {"ip": self.client_address[0], "country": "US", "city": "Localhost", "region": "LO"}
+            body = json.dumps(data).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    echo = ThreadingHTTPServer(("127.0.0.1", 0), EchoHandler)
+    threading.Thread(target=echo.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{echo.server_address[1]}"
+
+    print("📍 Самопроверка IP-проверки на локальном echo-сервере")
+    with LocalForwardProxy() as proxy:
+        proxy_url = "http://%s:%s" % proxy.address
+        verifier = IpVerifier(services=[f"{base}/ip", f"{base}/geo", "http://127.0.0.1:1/dead"], timeout=2)
+
+        first = verifier.verify(proxy_url)
+        print(f"✅ Через прокси: {first}")
+        assert first["country"] == "US" and not first["cached"]
+
+        second = verifier.verify(proxy_url)
+        assert second["cached"], second
+        print("✅ Повторная проверка - из кэша")
+
+        ip_only = verifier.verify(None, need_country=False)
+        print(f"✅ Напрямую, без страны: {ip_only}")
+        assert ip_only["ip"] == "127.0.0.1"
+
+        verifier.close()
+
+    # Маршрут действительно идет через прокси: отказавший прокси не дает ответа
+    with LocalForwardProxy(broken=True) as proxy:
+        verifier = IpVerifier(services=[f"{base}/ip", f"{base}/geo"], timeout=2)
+        assert verifier.verify("http://%s:%s" % proxy.address) is None
+        print("✅ Через отказавший прокси - нет ответа")
+        verifier.close()
+    echo.shutdown()
@@ -0,0 +1,170 @@
+"""
+⏱️ ОЖИДАНИЕ ГОТОВНОСТИ СТРАНИЦЫ
+Замена фиксированных time.sleep на ожидание реальных сигналов готовности
+- document.readyState == 'complete'
+- Сетевой простой: нет активных fetch/XHR и новых ресурсов
+- DOM успокоился: MutationObserver не видит изменений
+- Жесткий потолок времени на каждый вызов
+"""
+
+import time
+
+from selenium.common.exceptions import UnexpectedAlertPresentException
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Скрипт-наблюдатель: ставится в каждый новый документ через DevTools
+READINESS_PROBE_JS = """
+(function () {
+    if (window.__hugoReady) { return; }
+    var now = performance.now();
+    var state = window.__hugoReady = {inflight: 0, lastDom: now, lastNet: now, mark: null, markTime: null};
+    var touchDom = function () { state.lastDom = performance.now(); };
+    var touch = function () { state.lastNet = performance.now(); };
+
+    var startObserver = function () {
+        try {
+            new MutationObserver(touchDom).observe(document.documentElement || document,
+                {childList: true, subtree: true, attributes: true, characterData: true});
+        } catch (e) {}
+    };
+    if (document.documentElement) { startObserver(); }
+    else { document.addEventListener('DOMContentLoaded', startObserver); }
+
+    try { new PerformanceObserver(touch).observe({entryTypes: ['resource']}); } catch (e) {}
+
+    var origFetch = window.fetch;
+    if (origFetch) {
+        window.fetch = function () {
+            state.inflight++; touch();
+            return origFetch.apply(this, arguments).finally(function () { state.inflight--; touch(); });
+        };
+    }
+
+    var origSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        state.inflight++; touch();
+        this.addEventListener('loadend', function () { state.inflight--; touch(); });
+        return origSend.apply(this, arguments);
+    };
+})();
+"""
+
+POLL_STATE_JS = """
+var s = window.__hugoReady;
+return {
+    ready: document.readyState,
+    installed: !!s,
+    inflight: s ? s.inflight : 0,
+    domQuiet: s ? performance.now() - s.lastDom : 1e9,
+    netQuiet: s ? performance.now() - s.lastNet : 1e9,
+    mark: s ? s.mark : null,
+    changedSinceMark: !!(s && s.markTime !== null && Math.max(s.lastDom, s.lastNet) > s.markTime)
+};
+"""
+
+
+def install_readiness_probe(driver):
+    """Зарегистрировать наблюдатель для всех будущих документов (один раз на драйвер)"""
+    if getattr(driver, "_hugo_readiness_probe", False):
+        return
+
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": READINESS_PROBE_JS})
+        driver._hugo_readiness_probe = True
+    except Exception:
+        pass
+
+    # Текущий документ уже загружен - ставим наблюдатель напрямую
+    try:
+        driver.execute_script(READINESS_PROBE_JS)
+    except Exception:
+        pass
+
+
+def mark_document(driver):
+    """Пометить текущий документ, чтобы после действия дождаться реакции страницы"""
+    token = f"m{time.time_ns()}"
+    try:
+        driver.execute_script(READINESS_PROBE_JS +
+                              "window.__hugoReady.mark = arguments[0];"
+                              "window.__hugoReady.markTime = performance.now();", token)
+    except Exception:
+        return None
+    return token
+
+
+def remember_alert(driver, error):
+    """Запомнить текст диалога, который WebDriver закрыл во время ожидания"""
+    driver._hugo_dismissed_alert = error.alert_text or ""
+
+
+def pop_dismissed_alert(driver):
+    """Забрать текст закрытого во время ожидания диалога (или None)"""
+    text = getattr(driver, "_hugo_dismissed_alert", None)
+    driver._hugo_dismissed_alert = None
+    return text
+
+
+def wait_for_page_ready(driver, timeout=10, quiet_ms=300, network_idle=True, dom_settle=True,
+                        navigated_from=None, navigation_grace=1.5):
+    """Дождаться готовности страницы; возвращает True, если успели до потолка timeout"""
+    install_readiness_probe(driver)
+    deadline = time.time() + timeout
+
+    # После клика/submit ждем реакции: новый документ или изменения DOM/сети
+    if navigated_from:
+        grace_deadline = min(deadline, time.time() + navigation_grace)
+        while time.time() < grace_deadline:
+            try:
+                state = driver.execute_script(POLL_STATE_JS)
+                if state["mark"] != navigated_from or state["changedSinceMark"]:
+                    break
+            except UnexpectedAlertPresentException as e:
+                remember_alert(driver, e)
+                return True
+            except Exception:
+                break  # документ сменился прямо во время опроса
+            time.sleep(0.05)
+
+    def page_ready(drv):
+        try:
+            state = drv.execute_script(POLL_STATE_JS)
+        except UnexpectedAlertPresentException as e:
+            # Диалог блокирует страницу - дальше ждать нечего
+            remember_alert(drv, e)
+            return True
+        except Exception:
+            return False
+
+        if state["ready"] != "complete":
+            return False
+
+        if not state["installed"]:
+            # Документ загрузился раньше регистрации наблюдателя
+            try:
+                drv.execute_script(READINESS_PROBE_JS)
+            except Exception:
+                pass
+            return False
+
+        if network_idle and (state["inflight"] > 0 or state["netQuiet"] < quiet_ms):
+            return False
+
+        if dom_settle and state["domQuiet"] < quiet_ms:
+            return False
+
+        return True
+
+    remaining = max(0.0, deadline - time.time())
+    try:
+        WebDriverWait(driver, remaining, poll_frequency=0.05).until(page_ready)
+        return True
+    except Exception:
+        return False
+
+
+def navigate(driver, url, timeout=15, **wait_kwargs):
+    """Открыть URL и дождаться готовности страницы"""
+    install_readiness_probe(driver)
+    driver.get(url)
+    return wait_for_page_ready(driver, timeout=timeout, **wait_kwargs)
@@ -0,0 +1,216 @@
+"""
+📚 КОРПУС PAYLOAD'ОВ
+Потоковая загрузка payload'ов из файлов вместо списков в коде
+- Форматы: .txt (строка = payload, директивы '# class:' и '# tags:') и .jsonl
+- Ленивое чтение построчно; большие файлы - через mmap
+- Дедупликация по нормализованной форме с учетом регистра (хранятся только 8-байтовые дайджесты)
+- Автоматические теги класса (xss/sql) и контекста (html, attribute, js, union, ...)
+- Выбор подмножества по классу, тегам и бюджету без загрузки всего корпуса
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import re
+import unicodedata
+
+# Файлы больше этого размера читаются через mmap
+MMAP_THRESHOLD = 1024 * 1024
+
+# Эвристики классов и контекстов: тег -> регулярное выражение
+CLASS_RULES = {
+    "xss": re.compile(r"<\s*\w+|javascript:|on\w+\s*=|alert\s*\(|prompt\s*\(|confirm\s*\(", re.I),
+    "sql": re.compile(r"'\s*(or|and)\s|\bunion\b.*\bselect\b|--|#\s*$|/\*|\bsleep\s*\(|\bwaitfor\b|;\s*drop\b", re.I),
+}
+
+CONTEXT_RULES = {
+    # XSS
+    "html": re.compile(r"<\s*[a-z]", re.I),
+    "script-tag": re.compile(r"<\s*script", re.I),
+    "event-handler": re.compile(r"\bon\w+\s*=", re.I),
+    "attribute": re.compile(r"^\s*['\"]\s*(>|\s+on\w+)", re.I),
+    "js-string": re.compile(r"^\s*['\"]\s*;"),
+    "url": re.compile(r"^\s*javascript:", re.I),
+    # SQL
+    "sql-string": re.compile(r"^\s*\w*'"),
+    "boolean": re.compile(r"\b(or|and)\b\s*['\"]?\w+['\"]?\s*=\s*['\"]?\w+", re.I),
+    "union": re.compile(r"\bunion\b.*\bselect\b", re.I),
+    "comment": re.compile(r"--|#|/\*"),
+    "stacked": re.compile(r";\s*(drop|insert|update|delete|select)\b", re.I),
+    "time-based": re.compile(r"\b(sleep|benchmark|pg_sleep|waitfor)\b", re.I),
+}
+
+
+class Payload:
+    """Один payload корпуса"""
+
+    __slots__ = ("text", "payload_class", "tags", "source")
+
+    def __init__(self, text, payload_class, tags=(), source=None):
+        self.text = text
+        self.payload_class = payload_class
+        self.tags = frozenset(tags)
+        self.source = source
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return f"Payload({self.payload_class}, {self.text[:40]!r})"
+
+
+def normalize_payload(text):
+    """Нормализованная форма для поиска дубликатов: Unicode NFC и пробелы; регистр сохраняется -
+    варианты вроде <ScRiPt> проверяют обход фильтров и дубликатами не считаются"""
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFC", text).strip())
+
+
+def payload_digest(text):
+    """Короткий дайджест нормализованного payload'а"""
+    return hashlib.blake2b(normalize_payload(text).encode("utf-8"), digest_size=8).digest()
+
+
+def classify_payload(text):
+    """Класс payload'а по эвристикам (None, если не распознан)"""
+    for payload_class, rule in CLASS_RULES.items():
+        if rule.search(text):
+            return payload_class
+    return None
+
+
+def context_tags(text):
+    """Теги контекста, в котором payload может сработать"""
+    return {tag for tag, rule in CONTEXT_RULES.items() if rule.search(text)}
+
+
+def iter_lines(path):
+    """Построчное чтение файла: обычное или через mmap для больших файлов"""
+    if os.path.getsize(path) < MMAP_THRESHOLD:
+        with open(path, "rb") as f:
+            for line in f:
+                yield line.decode("utf-8", "replace").rstrip("\r\n")
+        return
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for line in iter(mm.readline, b""):
+            yield line.decode("utf-8", "replace").rstrip("\r\n")
+
+
+def iter_text_source(path, default_class=None):
+    """Payload'ы из .txt: директивы '# class: xss' и '# tags: a, b' действуют до следующей директивы"""
+    current_class, current_tags = default_class, set()
+
+    for line in iter_lines(path):
+        if not line.strip():
+            continue
+
+        directive = re.match(r"#\s*(class|tags)\s*:\s*(.*)$", line.strip(), re.I)
+        if directive:
+            if directive.group(1).lower() == "class":
+                current_class = directive.group(2).strip().lower() or default_class
+            else:
+                current_tags = {tag.strip() for tag in directive.group(2).split(",") if tag.strip()}
+            continue
+
+        yield line, current_class, current_tags
+
+
+def iter_jsonl_source(path, default_class=None):
+    """Payload'ы из .jsonl: {"payload": ..., "class": ..., "tags": [...], "contexts": [...]}"""
+    for line in iter_lines(path):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+
+        text = record.get("payload") if isinstance(record, dict) else record
+        if not isinstance(text, str):
+            continue
+        tags = set(record.get("tags", [])) | set(record.get("contexts", [])) if isinstance(record, dict) else set()
+        payload_class = record.get("class", default_class) if isinstance(record, dict) else default_class
+        yield text, payload_class, tags
+
+
+class PayloadCorpus:
+    """Корпус payload'ов из встроенных списков и файлов"""
+
+    def __init__(self):
+        self.sources = []  # (тип, данные, класс по умолчанию)
+        self.stats = {"read": 0, "duplicates": 0, "yielded": 0}
+
+    def add_builtin(self, payload_class, payloads):
+        """Добавить встроенный список payload'ов"""
+        self.sources.append(("builtin", list(payloads), payload_class))
+        return self
+
+    def add_file(self, path, default_class=None):
+        """Добавить файл корпуса (.txt или .jsonl); класс по умолчанию - из имени файла"""
+        if default_class is None:
+            name = os.path.basename(path).lower()
+            default_class = next((c for c in CLASS_RULES if c in name), None)
+        self.sources.append(("file", path, default_class))
+        return self
+
+    def _iter_raw(self):
+        """Сырые записи всех источников по порядку"""
+        for source_type, data, default_class in self.sources:
+            if source_type == "builtin":
+                for text in data:
+                    yield text, default_class, set(), "builtin"
+            elif data.lower().endswith((".jsonl", ".ndjson")):
+                for text, payload_class, tags in iter_jsonl_source(data, default_class):
+                    yield text, payload_class, tags, data
+            else:
+                for text, payload_class, tags in iter_text_source(data, default_class):
+                    yield text, payload_class, tags, data
+
+    def iter_payloads(self):
+        """Поток уникальных payload'ов с классом и тегами; stats - счетчики текущего прохода"""
+        stats = self.stats = {"read": 0, "duplicates": 0, "yielded": 0}
+        seen = set()
+        for text, payload_class, tags, source in self._iter_raw():
+            stats["read"] += 1
+
+            digest = payload_digest(text)
+            if digest in seen:
+                stats["duplicates"] += 1
+                continue
+            seen.add(digest)
+
+            payload_class = payload_class or classify_payload(text)
+            yield Payload(text, payload_class, set(tags) | context_tags(text) | {payload_class or "unknown"}, source)
+
+    def select(self, payload_class=None, tags=None, exclude_tags=None, budget=None):
+        """Поток payload'ов класса с любым из тегов tags, без exclude_tags, не больше budget"""
+        tags = set(tags or ())
+        exclude_tags = set(exclude_tags or ())
+        count = 0
+
+        for payload in self.iter_payloads():
+            if budget is not None and count >= budget:
+                return
+            if payload_class and payload.payload_class != payload_class:
+                continue
+            if tags and not payload.tags & tags:
+                continue
+            if payload.tags & exclude_tags:
+                continue
+
+            count += 1
+            self.stats["yielded"] += 1
+            yield payload
+
+
+def iter_chunks(items, size):
+    """Порции по size элементов из потока, без чтения потока целиком"""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
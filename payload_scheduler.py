@@ -0,0 +1,129 @@
+"""
+🧭 ПЛАНИРОВЩИК PAYLOAD'ОВ
+Адаптивный порядок и ранняя остановка для матрицы поля x payload'ы
+- Payload'ы упорядочиваются по исторической доле находок в своем контексте
+- После подтвержденной находки (страница, поле, класс) остальные попытки пропускаются
+- Поля, тип или maxlength которых делает класс payload'ов бессмысленным, не тестируются
+- Счетчики сэкономленных попыток для отчета
+- История хранится в JSON между прогонами
+"""
+
+import json
+import os
+import threading
+
+from payload_corpus import payload_digest
+
+HISTORY_PATH = os.path.join("test_reports", "payload_history.json")
+
+# Типы полей, в которые браузер не даст ввести или отправить произвольный текст
+NON_TEXT_TYPES = {
+    "number", "range", "date", "datetime-local", "month", "week", "time",
+    "color", "checkbox", "radio", "file", "email",
+}
+
+
+class PayloadScheduler:
+    """Порядок, фильтрация и ранняя остановка payload-задач"""
+
+    def __init__(self, history_path=HISTORY_PATH, confirmed_status="VULNERABLE"):
+        self.history_path = history_path
+        self.confirmed_status = confirmed_status
+        self.history = {}       # контекст -> {дайджест payload'а: [попытки, находки]}
+        self.confirmed = set()  # (страница, поле, класс) с подтвержденной находкой
+        self.saved = {"field_type": 0, "maxlength": 0, "after_finding": 0}
+        self.executed = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        """Загрузить историю прошлых прогонов"""
+        try:
+            with open(self.history_path, encoding="utf-8") as f:
+                self.history = json.load(f)
+        except (OSError, ValueError):
+            self.history = {}
+
+    def save(self):
+        """Сохранить историю (атомарно)"""
+        os.makedirs(os.path.dirname(self.history_path) or ".", exist_ok=True)
+        temp_path = self.history_path + ".part"
+        with self._lock:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(self.history, f)
+        os.replace(temp_path, self.history_path)
+
+    def context_key(self, task):
+        """Контекст для статистики: класс payload'а и тип поля"""
+        return f"{task['kind']}:{task.get('field_type') or 'text'}"
+
+    def group_key(self, task):
+        """Группа ранней остановки: (страница, поле, класс)"""
+        return task["page"], task["field_name"], task["kind"]
+
+    def hit_rate(self, task):
+        """Сглаженная доля находок payload'а в контексте (неизвестные - в середине)"""
+        stats = self.history.get(self.context_key(task), {}).get(payload_digest(task["payload"]).hex())
+        attempts, hits = stats if stats else (0, 0)
+        return (hits + 1) / (attempts + 2)
+
+    def skip_reason(self, task):
+        """Причина не запускать задачу вовсе (или None)"""
+        if (task.get("field_type") or "text") in NON_TEXT_TYPES:
+            return "field_type"
+        maxlength = task.get("maxlength")
+        if maxlength and len(task["payload"]) > maxlength:
+            return "maxlength"  # браузер обрежет payload при вводе
+        return None
+
+    def plan(self, tasks):
+        """Отфильтровать бессмысленные задачи и упорядочить: лучшие payload'ы каждой группы - первыми"""
+        groups = {}
+        for task in tasks:
+            reason = self.skip_reason(task)
+            if reason:
+                self.saved[reason] += 1
+                continue
+            groups.setdefault(self.group_key(task), []).append(task)
+
+        # Внутри группы - по убыванию доли находок (sorted устойчив к равным)
+        ordered_groups = [sorted(group, key=self.hit_rate, reverse=True) for group in groups.values()]
+
+        # По кругу между группами, чтобы параллельные воркеры брали разные поля
+        planned = []
+        for position in range(max((len(group) for group in ordered_groups), default=0)):
+            for group in ordered_groups:
+                if position < len(group):
+                    planned.append(group[position])
+        return planned
+
+    def should_run(self, task):
+        """False, если для группы задачи уже есть подтвержденная находка"""
+        with self._lock:
+            if self.group_key(task) in self.confirmed:
+                self.saved["after_finding"] += 1
+                return False
+            self.executed += 1
+            return True
+
+    def record(self, task, findings):
+        """Учесть результат попытки в истории и в ранней остановке"""
+        hit = any(finding["status"] == self.confirmed_status for finding in findings)
+        digest = payload_digest(task["payload"]).hex()
+
+        with self._lock:
+            stats = self.history.setdefault(self.context_key(task), {}).setdefault(digest, [0, 0])
+            stats[0] += 1
+            if hit:
+                stats[1] += 1
+                self.confirmed.add(self.group_key(task))
+
+    def restore(self, task, findings):
+        """Учесть находки попытки из журнала прошлого прогона (только ранняя остановка, без истории)"""
+        if any(finding["status"] == self.confirmed_status for finding in findings):
+            with self._lock:
+                self.confirmed.add(self.group_key(task))
+
+    def saved_total(self):
+        """Сколько попыток удалось не выполнять"""
+        return sum(self.saved.values())
@@ -0,0 +1,212 @@
+"""
+🩺 ПРЕДПОЛЕТНАЯ ПРОВЕРКА ПРОКСИ
+Мертвые прокси отсеиваются до запуска Chrome
+- Весь пул опрашивается параллельно на asyncio: TCP-подключение и один запрос через прокси
+- Для https-цели - CONNECT к host:443, для http - GET с абсолютным URL
+- Задержки подключения и ответа сохраняются в таблицу здоровья с TTL (JSON между прогонами)
+- Рабочие прокси ранжируются по задержке, нерабочие исключаются
+
+Самопроверка на локальных стендах: python proxy_probe.py
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+HEALTH_PATH = os.path.join("test_reports", "proxy_health.json")
+DEFAULT_PROBE_URL = "http://httpbin.org/ip"
+
+
+def proxy_key(proxy):
+    """Ключ прокси в таблице здоровья"""
+    return f"{proxy['ip']}:{proxy['port']}"
+
+
+def build_probe_request(target_url):
+    """Запрос, который отправляется прокси: CONNECT для https, GET с абсолютным URL для http"""
+    parts = urlsplit(target_url)
+    host = parts.hostname
+    if parts.scheme == "https":
+        authority = f"{host}:{parts.port or 443}"
+        return f"CONNECT {authority} HTTP/1.1\r\nHost: {authority}\r\n\r\n".encode()
+
+    path = target_url if parts.path else target_url + "/"
+    netloc = parts.netloc
+    return (f"GET {path} HTTP/1.1\r\nHost: {netloc}\r\nUser-Agent: Mozilla/5.0 (HugoProxyProbe)\r\n"
+            f"Connection: close\r\n\r\n").encode()
+
+
+async def probe_proxy(proxy, target_url=DEFAULT_PROBE_URL, timeout=5.0):
+    """Проверить один прокси: TCP-подключение и один запрос; вернуть запись таблицы здоровья"""
+    result = {"key": proxy_key(proxy), "ok": False, "connect_ms": None, "response_ms": None,
+              "status": None, "error": None, "checked_at": time.time()}
+    writer = None
+    started = time.perf_counter()
+
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(proxy["ip"], int(proxy["port"])), timeout)
+        result["connect_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+        sent = time.perf_counter()
+        writer.write(build_probe_request(target_url))
+        await writer.drain()
+        status_line = await asyncio.wait_for(reader.readline(), timeout)
+        result["response_ms"] = round((time.perf_counter() - sent) * 1000, 1)
+
+        parts = status_line.decode("latin-1").split()
+        result["status"] = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else None
+        result["ok"] = result["status"] is not None and 200 <= result["status"] < 400
+        if not result["ok"]:
+            result["error"] = f"ответ: {status_line.decode('latin-1').strip()[:80] or 'пусто'}"
+
+    except asyncio.TimeoutError:
+        result["error"] = "таймаут"
+    except (OSError, ValueError) as e:
+        result["error"] = str(e)[:120]
+    finally:
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+
+    return result
+
+
+class ProxyHealthTable:
+    """Таблица здоровья прокси с TTL"""
+
+    def __init__(self, path=HEALTH_PATH, ttl=600):
+        self.path = path  # None - таблица только в памяти
+        self.ttl = ttl
+        self.entries = {}
+        self._lock = threading.Lock()
+        if path:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def fresh(self, proxy):
+        """Запись прокси, если она не старше TTL"""
+        entry = self.entries.get(proxy_key(proxy))
+        if entry and time.time() - entry["checked_at"] < self.ttl:
+            return entry
+        return None
+
+    def update(self, results):
+        """Обновить записи по результатам опроса"""
+        with self._lock:
+            for result in results:
+                self.entries[result["key"]] = result
+
+    def save(self):
+        """Сохранить таблицу (атомарно)"""
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = self.path + ".part"
+        with self._lock:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.path)
+
+    def score(self, proxy):
+        """Ключ сортировки: рабочие по суммарной задержке, затем непроверенные, затем нерабочие"""
+        entry = self.entries.get(proxy_key(proxy))
+        if entry is None:
+            return 1, 0.0
+        if not entry["ok"]:
+            return 2, 0.0
+        return 0, (entry["connect_ms"] or 0) + (entry["response_ms"] or 0)
+
+    def rank(self, proxies):
+        """Прокси в порядке предпочтения (sorted устойчив - равные сохраняют порядок пула)"""
+        return sorted(proxies, key=self.score)
+
+
+class ProxyProber:
+    """Параллельный опрос пула прокси с кэшем результатов"""
+
+    def __init__(self, table=None, target_url=DEFAULT_PROBE_URL, timeout=5.0, concurrency=32):
+        self.table = table or ProxyHealthTable()
+        self.target_url = target_url
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self.probed = 0
+
+    async def _probe_all(self, proxies):
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def bounded(proxy):
+            async with semaphore:
+                return await probe_proxy(proxy, self.target_url, self.timeout)
+
+        return await asyncio.gather(*(bounded(proxy) for proxy in proxies))
+
+    def probe(self, proxies):
+        """Опросить прокси без свежей записи в таблице; вернуть записи для всех"""
+        stale = [proxy for proxy in proxies if self.table.fresh(proxy) is None]
+        if stale:
+            results = asyncio.run(self._probe_all(stale))
+            self.probed += len(results)
+            self.table.update(results)
+            try:
+                self.table.save()
+            except OSError as e:
+                print(f"⚠️ Не удалось сохранить таблицу прокси: {e}")
+        return [self.table.entries[proxy_key(proxy)] for proxy in proxies]
+
+    def usable(self, proxies):
+        """Рабочие прокси, лучшие первыми; нерабочие отброшены"""
+        self.probe(proxies)
+        return [proxy for proxy in self.table.rank(proxies) if self.table.entries[proxy_key(proxy)]["ok"]]
+
+    def print_table(self, proxies):
+        """Таблица здоровья пула в выводе"""
+        for proxy in self.table.rank(proxies):
+            entry = self.table.entries.get(proxy_key(proxy))
+            if entry is None:
+                continue
+            if entry["ok"]:
+                print(f"  ✅ {proxy.get('name', entry['key'])} ({entry['key']}): "
+                      f"подключение {entry['connect_ms']} мс, ответ {entry['response_ms']} мс")
+            else:
+                print(f"  ❌ {proxy.get('name', entry['key'])} ({entry['key']}): {entry['error']}")
+
+
+if __name__ == "__main__":
+    import socket
+    from forward_proxy_standin import LocalForwardProxy
+    from vuln_standin_server import StandinServer
+
+    print("🩺 Самопроверка предполетного опроса на локальных стендах")
+    with StandinServer() as site, LocalForwardProxy() as fast, LocalForwardProxy(delay=0.3) as slow, \
+            LocalForwardProxy(broken=True) as broken:
+        dead_socket = socket.socket()
+        dead_socket.bind(("127.0.0.1", 0))
+        dead_port = dead_socket.getsockname()[1]
+        dead_socket.close()  # порт свободен - подключение будет отклонено
+
+        pool = [
+            slow.as_pool_entry("Slow"),
+            {"ip": "127.0.0.1", "port": str(dead_port), "country": "US", "name": "Dead"},
+            broken.as_pool_entry("Broken"),
+            fast.as_pool_entry("Fast"),
+        ]
+        prober = ProxyProber(ProxyHealthTable(path=None), target_url=f"{site.base_url}/index.php", timeout=2)
+
+        started = time.perf_counter()
+        usable = prober.usable(pool)
+        print(f"⏱️ Опрос {len(pool)} прокси: {time.perf_counter() - started:.2f}с")
+        prober.print_table(pool)
+
+        names = [proxy["name"] for proxy in usable]
+        assert names == ["Fast", "Slow"], names
+        print("✅ Рабочие прокси ранжированы по задержке, нерабочие отброшены")
@@ -0,0 +1,239 @@
+"""
+🚦 РЕГУЛЯТОР НАГРУЗКИ НА ХОСТЫ
+Общий для всех наборов темп запросов вместо фиксированных time.sleep
+- Token bucket на каждый хост: средняя частота + небольшой запас на всплеск
+- Лимит одновременных запросов (max in-flight) к одному хосту
+- AIMD: частота растет понемногу после успешных ответов и делится пополам на 429/5xx,
+  сетевых ошибках или росте задержки относительно базовой
+- Retry-After из ответа 429/503 приостанавливает хост целиком
+- Ошибкой хоста считаются только сетевые сбои и таймауты; ошибки страницы (элемент недоступен,
+  устаревший элемент, неудачный клик) не меняют ни темп, ни задержку
+- Навигации браузера учитываются по статусу из Navigation Timing API
+"""
+
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+from page_waits import navigate
+
+# HTTP-статус текущего документа (Chrome 109+); 0 - статус недоступен
+NAVIGATION_STATUS_JS = """
+try {
+    var entry = performance.getEntriesByType('navigation')[0];
+    return entry && entry.responseStatus ? entry.responseStatus : 0;
+} catch (e) { return 0; }
+"""
+
+THROTTLE_STATUSES = {429, 503}
+MIN_BASELINE = 0.2  # секунд: быстрее этого колебания задержки не считаются замедлением
+
+
+# Имена классов сетевых ошибок requests/urllib3/selenium - без импорта этих библиотек
+NETWORK_ERROR_NAMES = {
+    "Timeout", "TimeoutException", "ConnectTimeout", "ReadTimeout", "ConnectionError", "ProxyError",
+    "SSLError", "ChunkedEncodingError", "NewConnectionError", "MaxRetryError", "ProtocolError",
+}
+# Сетевые ошибки навигации Chrome приходят как WebDriverException с кодом net::ERR_*
+NETWORK_ERROR_MARKERS = ("net::ERR_", "ERR_CONNECTION", "ERR_TIMED_OUT", "ERR_PROXY")
+
+
+def is_network_error(error):
+    """Сбой сети или таймаут (признак перегрузки хоста), а не ошибка логики страницы"""
+    if isinstance(error, (TimeoutError, ConnectionError, socket.timeout)):
+        return True
+    if any(cls.__name__ in NETWORK_ERROR_NAMES for cls in type(error).__mro__):
+        return True
+    return any(marker in str(error) for marker in NETWORK_ERROR_MARKERS)
+
+
+def parse_retry_after(value):
+    """Retry-After в секундах (числовая форма заголовка; дата не поддерживается)"""
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class HostState:
+    """Состояние одного хоста: корзина токенов, запросы в полете, задержки"""
+
+    __slots__ = ("rate", "tokens", "refilled_at", "in_flight", "paused_until", "decreased_at",
+                 "latency", "baseline", "requests", "backoffs")
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.tokens = burst
+        self.refilled_at = time.monotonic()
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.decreased_at = 0.0
+        self.latency = {}   # вид запроса (http/browser) -> быстрая EWMA задержки
+        self.baseline = {}  # вид запроса -> лучшая наблюдавшаяся EWMA
+        self.requests = 0
+        self.backoffs = 0
+
+
+class RateGovernor:
+    """Темп и параллельность запросов по хостам с адаптивным откатом"""
+
+    def __init__(self, requests_per_second=4, max_in_flight=4, max_rate=None, min_rate=0.25,
+                 burst=2.0, increase=0.5, latency_factor=3.0):
+        self.start_rate = requests_per_second  # 0 - без ограничения частоты
+        self.max_in_flight = max_in_flight
+        self.max_rate = max_rate or requests_per_second * 4
+        self.min_rate = min_rate
+        self.burst = burst
+        self.increase = increase  # прибавка к частоте (запросов/с) примерно за секунду успешной работы
+        self.latency_factor = latency_factor
+        self._hosts = {}
+        self._cond = threading.Condition()
+
+    def _host(self, url):
+        host = urlparse(url).netloc or url
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = HostState(self.start_rate, self.burst)
+        return host, state
+
+    def _refill(self, state, now):
+        if state.rate:
+            state.tokens = min(self.burst, state.tokens + (now - state.refilled_at) * state.rate)
+        state.refilled_at = now
+
+    def acquire(self, url, kind="http"):
+        """Дождаться токена и свободного слота для хоста; вернуть квитанцию для release"""
+        with self._cond:
+            host, state = self._host(url)
+            while True:
+                now = time.monotonic()
+                self._refill(state, now)
+
+                waits = []
+                if state.paused_until > now:
+                    waits.append(state.paused_until - now)
+                if self.max_in_flight and state.in_flight >= self.max_in_flight:
+                    waits.append(1.0)  # освободится по release - он будит ожидающих
+                if state.rate and state.tokens < 1:
+                    waits.append((1 - state.tokens) / state.rate)
+
+                if not waits:
+                    break
+                self._cond.wait(max(waits))
+
+            if state.rate:
+                state.tokens -= 1
+            state.in_flight += 1
+            state.requests += 1
+            return host, kind, time.monotonic()
+
+    def release(self, ticket, status=None, error=False, retry_after=None, neutral=False):
+        """Отчитаться о запросе: статус ответа или ошибка; neutral - только освободить слот"""
+        host, kind, started = ticket
+        retry_after = parse_retry_after(retry_after)
+        now = time.monotonic()
+        elapsed = now - started
+
+        with self._cond:
+            state = self._hosts[host]
+            state.in_flight -= 1
+            if neutral:
+                # Исход ничего не говорит о хосте - задержка и AIMD не меняются
+                self._cond.notify_all()
+                return
+
+            throttled = error or (status is not None and (status in THROTTLE_STATUSES or status >= 500))
+            slow = False
+            if not error:
+                # Задержки HTTP-запросов и навигаций браузера несравнимы - у каждого вида своя базовая
+                latency = state.latency.get(kind)
+                latency = elapsed if latency is None else 0.7 * latency + 0.3 * elapsed
+                state.latency[kind] = latency
+                state.baseline[kind] = min(state.baseline.get(kind, latency), latency)
+                slow = latency > self.latency_factor * max(state.baseline[kind], MIN_BASELINE)
+
+            if retry_after:
+                state.paused_until = max(state.paused_until, now + retry_after)
+
+            if throttled or slow:
+                self._decrease(state, now)
+            elif state.rate:
+                # Аддитивный рост: ~increase запросов/с за каждую секунду работы на текущей частоте
+                state.rate = min(self.max_rate, state.rate + self.increase / max(state.rate, 1.0))
+
+            self._cond.notify_all()
+
+    def _decrease(self, state, now):
+        """Мультипликативный откат - не чаще раза за окно, чтобы одна волна ошибок не обнулила темп"""
+        window = max(1.0, 2.0 / state.rate) if state.rate else 1.0
+        if now - state.decreased_at < window:
+            return
+        state.decreased_at = now
+        state.backoffs += 1
+        if state.rate:
+            state.rate = max(self.min_rate, state.rate / 2)
+        else:
+            # Без лимита частоты откат - короткая пауза хоста
+            state.paused_until = max(state.paused_until, now + 1.0)
+        # Задержка после отката считается заново
+        state.latency.clear()
+
+    @contextmanager
+    def slot(self, url, kind="http"):
+        """with governor.slot(url) as slot: ...; slot["status"] = код, slot["retry_after"] = заголовок Retry-After"""
+        ticket = self.acquire(url, kind)
+        slot = {"status": None, "retry_after": None}
+        try:
+            yield slot
+        except Exception as e:
+            # Откат темпа - только на сетевые сбои; ошибки страницы лишь освобождают слот
+            if is_network_error(e):
+                self.release(ticket, error=True)
+            else:
+                self.release(ticket, neutral=True)
+            raise
+        self.release(ticket, status=slot["status"], retry_after=slot["retry_after"])
+
+    def stats(self):
+        """Текущая частота, число запросов и откатов по хостам"""
+        with self._cond:
+            return {host: {"rate": round(state.rate, 2), "requests": state.requests, "backoffs": state.backoffs}
+                    for host, state in self._hosts.items()}
+
+
+def navigation_status(driver):
+    """HTTP-статус текущего документа браузера (None - неизвестен)"""
+    try:
+        return driver.execute_script(NAVIGATION_STATUS_JS) or None
+    except Exception:
+        return None
+
+
+def governed_navigate(governor, driver, url, **kwargs):
+    """navigate() через регулятор: слот хоста, затем статус и задержка идут в AIMD"""
+    with governor.slot(url, kind="browser") as slot:
+        ready = navigate(driver, url, **kwargs)
+        slot["status"] = navigation_status(driver)
+    return ready
+
+
+@contextmanager
+def governed_submit(governor, driver, url=None):
+    """Отправка формы через регулятор: with governed_submit(g, driver): кнопка.click() + ожидание"""
+    with governor.slot(url or driver.current_url, kind="browser") as slot:
+        yield slot
+        slot["status"] = navigation_status(driver)
+
+
+_governors = {}
+_governors_lock = threading.Lock()
+
+
+def get_governor(name="default", **kwargs):
+    """Общий регулятор процесса (параметры учитываются при первом создании)"""
+    with _governors_lock:
+        if name not in _governors:
+            _governors[name] = RateGovernor(**kwargs)
+        return _governors[name]
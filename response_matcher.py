@@ -0,0 +1,118 @@
+"""
+🔎 СОПОСТАВЛЕНИЕ СИГНАТУР В ОТВЕТЕ
+Один матчер для всех наборов признаков вместо выгрузки page_source на каждую попытку
+- Группы сигнатур (ошибки СУБД, признаки входа и т.п.) собираются один раз
+- В браузере поиск выполняется внутри страницы, в Python возвращаются только совпадения
+- Для HTTP-ответов - автомат Ахо-Корасик: все сигнатуры за один проход по тексту
+- Отражение payload'а проверяется с учетом регистра, сигнатуры - без
+"""
+
+# Поиск внутри страницы: spec = {группа: [сигнатуры в нижнем регистре]}, reflections = payload'ы
+MATCH_PAGE_JS = """
+var spec = arguments[0], reflections = arguments[1] || [];
+var root = document.documentElement;
+var text = root ? root.outerHTML : '';
+var lower = text.toLowerCase();
+var hits = {};
+for (var group in spec) {
+    var found = spec[group].filter(function (p) { return lower.indexOf(p) !== -1; });
+    if (found.length) { hits[group] = found; }
+}
+var reflected = reflections.filter(function (p) { return p && text.indexOf(p) !== -1; });
+if (reflected.length) { hits.reflected = reflected; }
+return hits;
+"""
+
+
+class AhoCorasick:
+    """Автомат Ахо-Корасик для поиска множества подстрок за один проход"""
+
+    def __init__(self, patterns):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [set()]
+
+        for pattern in patterns:
+            if pattern:
+                self._add(pattern)
+        self._build()
+
+    def _add(self, pattern):
+        """Добавить строку в бор"""
+        state = 0
+        for char in pattern:
+            nxt = self.goto[state].get(char)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[state][char] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append(set())
+            state = nxt
+        self.output[state].add(pattern)
+
+    def _build(self):
+        """Суффиксные ссылки обходом в ширину"""
+        queue = list(self.goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for char, nxt in self.goto[state].items():
+                queue.append(nxt)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[nxt] = self.goto[fallback].get(char, 0)
+                self.output[nxt] |= self.output[self.fail[nxt]]
+
+    def find_all(self, text):
+        """Множество найденных в тексте строк"""
+        found = set()
+        state = 0
+        for char in text:
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            if self.output[state]:
+                found |= self.output[state]
+        return found
+
+
+class ResponseMatcher:
+    """Набор групп сигнатур, проверяемых одним проходом по ответу"""
+
+    def __init__(self, groups):
+        # Порядок сигнатур в группе сохраняется: первая совпавшая - самая приоритетная
+        self.groups = {name: [pattern.lower() for pattern in patterns] for name, patterns in groups.items()}
+        self.automaton = AhoCorasick({p for patterns in self.groups.values() for p in patterns})
+
+    def _group_hits(self, found):
+        """Разложить найденные сигнатуры по группам в исходном порядке"""
+        hits = {}
+        for name, patterns in self.groups.items():
+            matched = [p for p in patterns if p in found]
+            if matched:
+                hits[name] = matched
+        return hits
+
+    def match_text(self, text, reflections=()):
+        """Совпадения в уже полученном тексте (например, теле HTTP-ответа)"""
+        hits = self._group_hits(self.automaton.find_all(text.lower()))
+        reflected = [p for p in reflections if p and p in text]
+        if reflected:
+            hits["reflected"] = reflected
+        return hits
+
+    def match_page(self, driver, reflections=()):
+        """Совпадения в текущей странице браузера без передачи HTML в Python"""
+        try:
+            return driver.execute_script(MATCH_PAGE_JS, self.groups, list(reflections)) or {}
+        except Exception:
+            pass
+
+        # Скрипт не выполнился (смена документа) - разбираем исходник страницы
+        try:
+            return self.match_text(driver.page_source, reflections)
+        except Exception:
+            return {}
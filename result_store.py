@@ -0,0 +1,151 @@
+"""
+📊 ХРАНИЛИЩЕ РЕЗУЛЬТАТОВ ПРОВЕРОК
+Типизированные результаты вместо списков строк с эмодзи
+- Записи CheckResult со __slots__: статус, id проверки, длительность, артефакты
+- Счетчики по статусам за O(1) без пересканирования списка
+- Потоковая запись в JSONL по мере поступления результатов
+- Экспорт в JUnit XML в конце прогона
+"""
+
+import json
+import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+
+# Статусы проверок
+PASS = "PASS"
+FAIL = "FAIL"
+WARNING = "WARNING"
+VULNERABLE = "VULNERABLE"
+SECURE = "SECURE"
+
+STATUS_ICONS = {
+    PASS: "✅",
+    FAIL: "❌",
+    WARNING: "⚠️",
+    VULNERABLE: "🔥",
+    SECURE: "✅",
+}
+
+REPORTS_DIR = "test_reports"
+
+
+class CheckResult:
+    """Результат одной проверки"""
+
+    __slots__ = ("status", "check_id", "message", "duration", "artifacts", "details", "timestamp")
+
+    def __init__(self, status, check_id, message="", duration=None, artifacts=None, details=None, timestamp=None):
+        self.status = status
+        self.check_id = check_id
+        self.message = message or check_id
+        self.duration = duration
+        self.artifacts = list(artifacts or [])
+        self.details = details or {}
+        self.timestamp = timestamp or time.time()
+
+    def __str__(self):
+        return f"{STATUS_ICONS.get(self.status, '•')} {self.message}"
+
+    def to_dict(self):
+        """Словарь для JSON"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class ResultStore:
+    """Результаты тестового набора со счетчиками и потоковой выгрузкой"""
+
+    def __init__(self, suite, stream=True, reports_dir=REPORTS_DIR):
+        self.suite = suite
+        self.records = []
+        self.counters = {}
+        self.started_at = time.time()
+
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        self.junit_path = os.path.join(reports_dir, f"{suite}_{stamp}.xml")
+        self.jsonl_path = os.path.join(reports_dir, f"{suite}_{stamp}.jsonl") if stream else None
+        self._stream = None
+        self._lock = threading.Lock()
+
+        if stream:
+            os.makedirs(reports_dir, exist_ok=True)
+
+    def add(self, status, check_id, message="", duration=None, artifacts=None, **details):
+        """Добавить результат проверки"""
+        return self.add_record(CheckResult(status, check_id, message, duration, artifacts, details))
+
+    def add_record(self, record):
+        """Добавить готовую запись (например, из параллельного воркера)"""
+        with self._lock:
+            self.records.append(record)
+            self.counters[record.status] = self.counters.get(record.status, 0) + 1
+
+            if self.jsonl_path:
+                if self._stream is None:
+                    self._stream = open(self.jsonl_path, "a", encoding="utf-8")
+                self._stream.write(json.dumps(record.to_dict(), ensure_ascii=False, default=str) + "\n")
+                self._stream.flush()
+
+        return record
+
+    def extend(self, records):
+        """Добавить несколько записей"""
+        for record in records:
+            self.add_record(record)
+
+    def count(self, *statuses):
+        """Количество результатов с указанными статусами"""
+        return sum(self.counters.get(status, 0) for status in statuses)
+
+    def by_status(self, *statuses):
+        """Результаты с указанными статусами"""
+        return [record for record in self.records if record.status in statuses]
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(list(self.records))
+
+    def export_junit(self, path=None, failure_statuses=(FAIL, VULNERABLE)):
+        """Выгрузить результаты в JUnit XML"""
+        path = path or self.junit_path
+
+        suite = ET.Element("testsuite", {
+            "name": self.suite,
+            "tests": str(len(self.records)),
+            "failures": str(self.count(*failure_statuses)),
+            "errors": "0",
+            "skipped": "0",
+            "time": f"{time.time() - self.started_at:.3f}",
+        })
+
+        for record in self.records:
+            case = ET.SubElement(suite, "testcase", {
+                "classname": self.suite,
+                "name": record.check_id,
+                "time": f"{record.duration or 0:.3f}",
+            })
+
+            if record.artifacts:
+                props = ET.SubElement(case, "properties")
+                for artifact in record.artifacts:
+                    ET.SubElement(props, "property", {"name": "artifact", "value": str(artifact)})
+
+            if record.status in failure_statuses:
+                failure = ET.SubElement(case, "failure", {"type": record.status, "message": record.message})
+                failure.text = json.dumps(record.details, ensure_ascii=False, default=str)
+            elif record.status == WARNING:
+                ET.SubElement(case, "system-out").text = f"WARNING: {record.message}"
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        ET.ElementTree(suite).write(path, encoding="utf-8", xml_declaration=True)
+        return path
+
+    def close(self):
+        """Закрыть потоковый JSONL-файл"""
+        with self._lock:
+            if self._stream:
+                self._stream.close()
+                self._stream = None
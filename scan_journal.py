@@ -0,0 +1,151 @@
+"""
+📓 ЖУРНАЛ СКАНИРОВАНИЯ
+Контрольные точки security-прогона для продолжения после сбоя
+- Журнал только дописывается: одна JSON-строка на завершенную попытку, fsync после каждой
+- Ключ попытки: класс, страница, поле, селектор поля и дайджест точных байтов payload'а -
+  не зависит от порядка payload'ов
+- Файл открывается (и без --resume перезаписывается) только при первой записи или чтении,
+  а не при создании набора
+- Вместе с попыткой сохраняются ее находки - при продолжении они возвращаются в результаты
+- Инвентарь обхода сайта тоже сохраняется - повторный обход не нужен
+- Оборванная последняя строка (сбой во время записи) при чтении пропускается
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+JOURNAL_DIR = "test_reports"
+
+
+def journal_path(target, journal_dir=JOURNAL_DIR):
+    """Файл журнала для целевого сайта"""
+    slug = re.sub(r"[^\w.-]", "_", re.sub(r"^\w+://", "", target)).strip("_")
+    return os.path.join(journal_dir, f"scan_journal_{slug or 'target'}.jsonl")
+
+
+def exact_digest(*parts):
+    """Дайджест точных байтов частей (без нормализации регистра и пробелов)"""
+    return hashlib.blake2b("\0".join(parts).encode("utf-8"), digest_size=12).hexdigest()
+
+
+def attempt_key(task):
+    """Ключ payload-попытки: класс|страница|поле|дайджест селектора поля и payload'а"""
+    return (f"{task['kind']}|{task['page']}|{task['field_name']}|"
+            f"{exact_digest(task.get('field_selector') or '', task['payload'])}")
+
+
+def login_key(path, username, password):
+    """Ключ попытки входа с опасными учетными данными"""
+    return f"login|{path}|{exact_digest(username, password)}"
+
+
+class ScanJournal:
+    """Журнал завершенных попыток и находок одного целевого сайта"""
+
+    def __init__(self, target, path=None, resume=False):
+        self.target = target
+        self.path = path or journal_path(target)
+        self.resume = resume
+        self.completed = {}     # ключ попытки -> находки
+        self._inventory = None  # страницы из обхода сайта
+        self.restored = 0       # попыток пропущено благодаря журналу
+        self._file = None
+        self._started = False
+        self._lock = threading.RLock()
+
+    def start(self):
+        """Открыть журнал при начале сканирования (повторный вызов ничего не делает)"""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+
+            state = self._load() if self.resume else None
+
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            # Без --resume (или при чужом журнале) начинаем новый журнал; иначе дописываем в старый
+            self._file = open(self.path, "w" if state is None else "a", encoding="utf-8")
+            if state == "torn":
+                self._file.write("\n")  # отделяем оборванную строку от новых записей
+            self._append({"type": "scan", "target": self.target, "resume": self.resume, "time": time.time()})
+
+    @property
+    def started(self):
+        """Журнал уже открыт этим прогоном"""
+        return self._started
+
+    @property
+    def inventory(self):
+        """Инвентарь обхода сайта из журнала (None - обхода еще не было)"""
+        self.start()
+        return self._inventory
+
+    def _load(self):
+        """Прочитать журнал прошлого прогона: "torn" - оборван посреди строки, None - журнал не подходит"""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                text = f.read()
+        except OSError:
+            return None
+
+        for line in text.splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # оборванная запись
+
+            kind = record.get("type")
+            if kind == "scan" and record.get("target") != self.target:
+                print(f"⚠️ Журнал {self.path} относится к {record.get('target')} - начинаем заново")
+                self.completed, self._inventory = {}, None
+                return None
+            if kind == "attempt":
+                self.completed[record["key"]] = record.get("findings", [])
+            elif kind == "inventory":
+                self._inventory = record.get("pages")
+
+        if self.completed:
+            print(f"📓 Журнал: {len(self.completed)} завершенных попыток будут пропущены")
+        return "torn" if text and not text.endswith("\n") else "ok"
+
+    def _append(self, record):
+        """Дописать запись и сбросить ее на диск"""
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        self.start()
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def is_done(self, key):
+        """Попытка уже завершена в этом или прошлом прогоне"""
+        self.start()
+        return key in self.completed
+
+    def restore(self, key):
+        """Находки завершенной попытки (копии - их можно дополнять)"""
+        self.restored += 1
+        return [dict(finding, artifacts=list(finding.get("artifacts", []))) for finding in self.completed[key]]
+
+    def record_attempt(self, key, findings):
+        """Отметить попытку завершенной вместе с ее находками"""
+        self.completed[key] = findings
+        self._append({"type": "attempt", "key": key, "findings": findings, "time": time.time()})
+
+    def record_inventory(self, pages):
+        """Сохранить инвентарь обхода сайта"""
+        self._inventory = pages
+        self._append({"type": "inventory", "pages": pages, "time": time.time()})
+
+    def close(self):
+        """Закрыть файл журнала"""
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,236 @@
+"""
+🗂️ ХРАНИЛИЩЕ СКРИНШОТОВ С ДЕДУПЛИКАЦИЕЙ
+Контентно-адресуемое хранилище кадров с перцептивным хэшем
+- dHash (NumPy) для каждого кадра
+- Кадр сохраняется, только если заметно отличается от предыдущего кадра того же теста
+- Дубликаты записываются в индекс как ссылки на уже сохраненный файл
+- Политика хранения: удаление по возрасту и общему размеру - только файлов, записанных самим хранилищем
+- Индекс сжимается при запуске и после удаления: одна запись на живой файл
+"""
+
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+import time
+
+try:
+    import numpy as np
+    from PIL import Image
+    PERCEPTUAL_HASH_AVAILABLE = True
+except ImportError:
+    PERCEPTUAL_HASH_AVAILABLE = False
+
+INDEX_FILENAME = ".screenshot_index.jsonl"
+
+
+def dhash(png_bytes, hash_size=8):
+    """Разностный перцептивный хэш кадра (None, если нет NumPy/Pillow)"""
+    if not PERCEPTUAL_HASH_AVAILABLE:
+        return None
+
+    image = Image.open(io.BytesIO(png_bytes)).convert("L").resize((hash_size + 1, hash_size), Image.BILINEAR)
+    pixels = np.asarray(image, dtype=np.int16)
+    bits = (pixels[:, 1:] > pixels[:, :-1]).flatten()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def hamming_distance(hash_a, hash_b):
+    """Число различающихся бит двух хэшей"""
+    return bin(hash_a ^ hash_b).count("1")
+
+
+def test_key_from_name(name):
+    """Ключ теста по имени скриншота: '07_scrolled_3' -> '07_scrolled'"""
+    return re.sub(r"(_\d+)+$", "", name) or name
+
+
+class ScreenshotStore:
+    """Хранилище скриншотов одной папки с индексом и политикой хранения"""
+
+    def __init__(self, directory, threshold=4, max_age_days=14, max_total_mb=500, evict_every=50):
+        self.directory = directory
+        self.threshold = threshold
+        self.max_age_days = max_age_days
+        self.max_total_mb = max_total_mb
+        self.evict_every = evict_every
+
+        self.index_path = os.path.join(directory, INDEX_FILENAME)
+        self.by_digest = {}     # sha256 -> путь сохраненного файла
+        self.last_frame = {}    # ключ теста -> (phash, путь)
+        self.owned = {}         # путь -> запись индекса; только эти файлы касаются политики хранения
+        self.pending = set()    # приняты, но еще не записаны писателем
+        self.duplicates = 0
+        self._since_evict = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+        with self._lock:
+            self.evict()
+            self._compact_index()
+
+    def _load_index(self):
+        """Восстановить состояние из индекса прошлых запусков"""
+        if not os.path.exists(self.index_path):
+            return
+
+        with open(self.index_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+
+                if record.get("evicted"):
+                    self._forget(record["path"])
+                elif not record.get("ref"):
+                    self._remember(record)
+
+    def _remember(self, record):
+        """Путь снова занят новым кадром - старые хэши этого пути больше не верны"""
+        path = record["path"]
+        previous = self.owned.get(path)
+        if previous and self.by_digest.get(previous["sha256"]) == path:
+            del self.by_digest[previous["sha256"]]
+
+        self.by_digest[record["sha256"]] = path
+        self.owned[path] = record
+        if record.get("phash") is not None:
+            self.last_frame[record["test"]] = (int(record["phash"], 16), path)
+
+    def _forget(self, path):
+        """Убрать путь из состояния хранилища (обратный поиск через запись пути - O(1))"""
+        record = self.owned.pop(path, None)
+        self.pending.discard(path)
+        if record is None:
+            return
+        if self.by_digest.get(record["sha256"]) == path:
+            del self.by_digest[record["sha256"]]
+        frame = self.last_frame.get(record["test"])
+        if frame and frame[1] == path:
+            del self.last_frame[record["test"]]
+
+    def _compact_index(self):
+        """Переписать индекс одной записью на каждый живой файл: ссылки и удаленные не копятся"""
+        temp_path = self.index_path + ".part"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for record in self.owned.values():
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(temp_path, self.index_path)
+
+    def _append_index(self, record):
+        """Дописать запись в индекс (append-only)"""
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def admit(self, png_bytes, filepath, name):
+        """Решить судьбу кадра: вернуть None, если сохранять, или путь оригинала для дубликата"""
+        digest = hashlib.sha256(png_bytes).hexdigest()
+        test_key = test_key_from_name(name)
+
+        try:
+            phash = dhash(png_bytes)
+        except Exception:
+            phash = None
+
+        with self._lock:
+            reference = self.by_digest.get(digest)
+
+            if reference is None and phash is not None and test_key in self.last_frame:
+                previous_hash, previous_path = self.last_frame[test_key]
+                if hamming_distance(phash, previous_hash) <= self.threshold:
+                    reference = previous_path
+
+            record = {
+                "path": filepath,
+                "test": test_key,
+                "sha256": digest,
+                "phash": f"{phash:016x}" if phash is not None else None,
+                "time": time.time(),
+                "size": len(png_bytes),
+            }
+
+            # Оригинал может еще стоять в очереди писателя - он будет записан раньше, чем понадобится
+            if reference and reference != filepath and (reference in self.pending or os.path.exists(reference)):
+                record["ref"] = reference
+                self.duplicates += 1
+                self._append_index(record)
+                return reference
+
+            self._remember(record)
+            self.pending.add(filepath)
+            self._append_index(record)
+
+            self._since_evict += 1
+            if self._since_evict >= self.evict_every:
+                self._since_evict = 0
+                self.evict()
+
+            return None
+
+    def written(self, filepath, ok=True):
+        """Писатель закончил с файлом; неудачная запись убирается из индекса"""
+        with self._lock:
+            self.pending.discard(filepath)
+            if not ok:
+                self._forget(filepath)
+                self._append_index({"path": filepath, "evicted": True, "time": time.time()})
+
+    def evict(self):
+        """Удалить старые и самые старые сверх лимита размера - только файлы из индекса хранилища"""
+        files = []
+        for path in list(self.owned.keys() - self.pending):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                self._forget(path)  # файл удален извне - забываем без записи в индекс
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        files.sort()
+        now = time.time()
+        total = sum(size for _, size, _ in files)
+        max_total = self.max_total_mb * 1024 * 1024 if self.max_total_mb else None
+        removed = 0
+
+        for mtime, size, path in files:
+            too_old = self.max_age_days and now - mtime > self.max_age_days * 86400
+            too_big = max_total is not None and total > max_total
+            if not (too_old or too_big):
+                break
+
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+
+            total -= size
+            removed += 1
+            self._forget(path)
+            self._append_index({"path": path, "evicted": True, "time": now})
+
+        if removed:
+            self._compact_index()
+            print(f"🧹 Удалено старых скриншотов: {removed} ({self.directory})")
+        return removed
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(directory):
+    """Общее хранилище для папки скриншотов"""
+    key = os.path.abspath(directory)
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = ScreenshotStore(
+                directory,
+                threshold=int(os.environ.get("HUGO_SCREENSHOT_DEDUP_BITS", "4")),
+                max_age_days=float(os.environ.get("HUGO_SCREENSHOT_MAX_AGE_DAYS", "14")),
+                max_total_mb=float(os.environ.get("HUGO_SCREENSHOT_MAX_MB", "500")),
+            )
+        return _stores[key]
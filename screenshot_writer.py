@@ -0,0 +1,163 @@
+"""
+📸 АСИНХРОННАЯ ЗАПИСЬ СКРИНШОТОВ
+Фоновый писатель скриншотов вместо синхронного driver.save_screenshot
+- Сырые PNG-байты снимаются через get_screenshot_as_png и ставятся в очередь
+- Кодирование (PNG/WebP/JPEG) и запись на диск - в фоновом потоке
+- Имена без коллизий: миллисекунды + порядковый номер
+- Ограниченная очередь: при переполнении тестовый поток ждет (back-pressure)
+- Почти одинаковые кадры отсеиваются хранилищем screenshot_store до возврата пути: для дубликата
+  возвращается путь уже сохраненного оригинала
+
+Формат и качество: HUGO_SCREENSHOT_FORMAT (png/webp/jpeg), HUGO_SCREENSHOT_QUALITY
+Дедупликация: HUGO_SCREENSHOT_DEDUP=0 отключает
+"""
+
+import atexit
+import io
+import itertools
+import os
+import queue
+import threading
+import time
+
+from screenshot_store import get_store
+
+EXTENSIONS = {"png": ".png", "webp": ".webp", "jpeg": ".jpg"}
+
+
+class ScreenshotWriter:
+    """Фоновый писатель скриншотов с ограниченной очередью"""
+
+    def __init__(self, image_format="png", quality=80, max_queue=32, deduplicate=True):
+        image_format = {"jpg": "jpeg"}.get(image_format, image_format)
+        if image_format not in EXTENSIONS:
+            raise ValueError(f"Неизвестный формат скриншотов: {image_format}")
+
+        self.image_format = image_format
+        self.quality = quality
+        self.deduplicate = deduplicate
+        self.written = 0
+        self.deduplicated = 0
+        self.failed = 0
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._sequence = itertools.count(1)
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+        if image_format != "png":
+            try:
+                import PIL  # noqa: F401
+            except ImportError:
+                print("⚠️ Pillow не установлен - скриншоты будут сохраняться в PNG")
+                self.image_format = "png"
+
+    def make_filepath(self, directory, name, timestamped=True):
+        """Уникальный путь для скриншота"""
+        extension = EXTENSIONS[self.image_format]
+        if not timestamped:
+            return os.path.join(directory, f"{name}{extension}")
+
+        now = time.time()
+        stamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(now))
+        millis = int(now * 1000) % 1000
+        return os.path.join(directory, f"{name}_{stamp}_{millis:03d}_{next(self._sequence):04d}{extension}")
+
+    def submit(self, png_bytes, directory, name, timestamped=True):
+        """Поставить снимок в очередь на запись; вернуть путь, по которому будет кадр"""
+        filepath = self.make_filepath(directory, name, timestamped)
+
+        if self.deduplicate:
+            reference = get_store(directory).admit(png_bytes, filepath, name)
+            if reference:
+                # Кадр почти не отличается от сохраненного - отдаем путь оригинала, файл не пишем
+                self.deduplicated += 1
+                return reference
+
+        job = (png_bytes, filepath, directory)
+
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            # Back-pressure: диск не успевает, тестовый поток ждет освобождения места
+            print("⏳ Очередь скриншотов заполнена, ждем записи на диск...")
+            self._queue.put(job)
+
+        return filepath
+
+    def _encode(self, png_bytes):
+        """Перекодировать PNG в целевой формат"""
+        if self.image_format == "png":
+            return png_bytes
+
+        from PIL import Image
+
+        image = Image.open(io.BytesIO(png_bytes))
+        output = io.BytesIO()
+        if self.image_format == "jpeg":
+            image.convert("RGB").save(output, format="JPEG", quality=self.quality, optimize=True)
+        else:
+            image.save(output, format="WEBP", quality=self.quality, method=4)
+        return output.getvalue()
+
+    def _worker(self):
+        """Фоновый поток: кодирование и запись файлов"""
+        while True:
+            png_bytes, filepath, directory = self._queue.get()
+            ok = False
+            try:
+                data = self._encode(png_bytes)
+                os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+
+                # Пишем во временный файл и атомарно переименовываем
+                temp_path = filepath + ".part"
+                with open(temp_path, "wb") as f:
+                    f.write(data)
+                os.replace(temp_path, filepath)
+                self.written += 1
+                ok = True
+
+            except Exception as e:
+                self.failed += 1
+                print(f"⚠️ Ошибка записи скриншота {filepath}: {e}")
+
+            finally:
+                if self.deduplicate:
+                    get_store(directory).written(filepath, ok)
+                self._queue.task_done()
+
+    def flush(self):
+        """Дождаться записи всех поставленных в очередь снимков"""
+        self._queue.join()
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_screenshot_writer():
+    """Общий писатель скриншотов на процесс"""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = ScreenshotWriter(
+                image_format=os.environ.get("HUGO_SCREENSHOT_FORMAT", "png").lower(),
+                quality=int(os.environ.get("HUGO_SCREENSHOT_QUALITY", "80")),
+                deduplicate=os.environ.get("HUGO_SCREENSHOT_DEDUP", "1") == "1",
+            )
+        return _writer
+
+
+def capture(driver, directory, name, timestamped=True):
+    """Снять скриншот без блокировки на кодировании и записи; вернуть путь (для дубликата - путь оригинала)"""
+    png_bytes = driver.get_screenshot_as_png()
+    return get_screenshot_writer().submit(png_bytes, directory, name, timestamped)
+
+
+def flush_screenshots():
+    """Дождаться записи всех скриншотов (перед отчетом или выходом)"""
+    if _writer is not None:
+        _writer.flush()
+
+
+atexit.register(flush_screenshots)
@@ -0,0 +1,129 @@
+"""
+⏱️ БЕНЧМАРК SECURITY-НАБОРА
+Воспроизводимые замеры сканера на локальном уязвимом стенде
+- Стенд vuln_standin_server поднимается в фоне на свободном порту
+- Каждый прогон: время, число попыток в браузере и попыток в секунду, HTTP-запросы предотбора
+- Полнота (recall) по эталону EXPECTED_FINDINGS и список ложных срабатываний
+- Результаты дописываются в test_reports/security_benchmark.jsonl - база для сравнения изменений
+
+Запуск: python security_benchmark.py --runs 3 --workers 4
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from Security_test import SecurityTestSuite
+from payload_scheduler import PayloadScheduler
+from result_store import VULNERABLE
+from vuln_standin_server import StandinServer, EXPECTED_FINDINGS
+
+BENCHMARK_PATH = os.path.join("test_reports", "security_benchmark.jsonl")
+
+
+def finding_kind(check_id):
+    """Класс уязвимости по id проверки"""
+    return "xss" if check_id.startswith("xss") else "sql"
+
+
+def score_findings(results, expected=EXPECTED_FINDINGS):
+    """Полнота по эталону, пропущенные эталоны и ложные срабатывания"""
+    vulnerable = results.by_status(VULNERABLE)
+
+    def matches(record, target):
+        kind, fragment = target
+        return finding_kind(record.check_id) == kind and fragment in record.check_id
+
+    missed = [target for target in expected if not any(matches(record, target) for record in vulnerable)]
+    false_positives = sorted({record.check_id for record in vulnerable
+                              if not any(matches(record, target) for target in expected)})
+    recall = (len(expected) - len(missed)) / len(expected) if expected else 1.0
+    return recall, missed, false_positives
+
+
+def run_once(base_url, run_index, workers, prescreen, crawl, payload_files, payload_budget):
+    """Один прогон набора на стенде; словарь метрик"""
+    suite = SecurityTestSuite(workers=workers, requests_per_second=0, prescreen=prescreen, crawl=crawl,
+                              payload_files=payload_files, payload_budget=payload_budget, base_url=base_url)
+
+    # Чистая история payload'ов в каждом прогоне - порядок попыток не зависит от прошлых запусков
+    history_dir = tempfile.mkdtemp(prefix="hugo_bench_")
+    suite.scheduler = PayloadScheduler(history_path=os.path.join(history_dir, "history.json"))
+
+    started = time.time()
+    suite.run_comprehensive_security_test()
+    wall_time = time.time() - started
+
+    attempts = suite.scheduler.executed
+    recall, missed, false_positives = score_findings(suite.test_results)
+
+    return {
+        "run": run_index,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "workers": workers,
+        "prescreen": prescreen,
+        "crawl": crawl,
+        "wall_time_s": round(wall_time, 3),
+        "browser_attempts": attempts,
+        "attempts_per_s": round(attempts / wall_time, 3) if wall_time else None,
+        "attempts_saved": suite.scheduler.saved_total(),
+        "http_prescreen_requests": suite.prescreener.requests_sent if suite.prescreener else 0,
+        "findings": suite.test_results.count(VULNERABLE),
+        "unique_findings": len(suite.findings.entries),
+        "recall": round(recall, 3),
+        "missed": [f"{kind}:{fragment}" for kind, fragment in missed],
+        "false_positives": false_positives,
+    }
+
+
+def run_benchmark(runs=1, workers=1, prescreen=True, crawl=True, payload_files=(), payload_budget=None,
+                  output=BENCHMARK_PATH):
+    """Серия прогонов на стенде; метрики пишутся в JSONL"""
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    records = []
+
+    with StandinServer() as server:
+        print(f"🧪 Стенд запущен: {server.base_url}")
+
+        for run_index in range(1, runs + 1):
+            print(f"\n⏱️ === ПРОГОН {run_index}/{runs} ===")
+            record = run_once(server.base_url, run_index, workers, prescreen, crawl, payload_files, payload_budget)
+            records.append(record)
+
+            with open(output, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    print("\n" + "=" * 60)
+    print("⏱️ ИТОГИ БЕНЧМАРКА")
+    print("=" * 60)
+    for record in records:
+        print(f"#{record['run']}: {record['wall_time_s']:.1f}с, попыток {record['browser_attempts']} "
+              f"({record['attempts_per_s']}/с), recall {record['recall']:.0%}, "
+              f"ложных {len(record['false_positives'])}")
+        for target in record["missed"]:
+            print(f"  ❌ пропущено: {target}")
+        for check_id in record["false_positives"]:
+            print(f"  ⚠️ ложное срабатывание: {check_id}")
+
+    if records:
+        times = sorted(record["wall_time_s"] for record in records)
+        print(f"\n📊 Медиана времени: {times[len(times) // 2]:.1f}с")
+    print(f"📄 Результаты: {output}")
+    return records
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Бенчмарк security-набора на локальном стенде")
+    parser.add_argument("--runs", type=int, default=1, help="число прогонов")
+    parser.add_argument("--workers", type=int, default=1, help="число параллельных браузеров")
+    parser.add_argument("--no-prescreen", action="store_true", help="без HTTP-предотбора")
+    parser.add_argument("--no-crawl", action="store_true", help="без обхода сайта")
+    parser.add_argument("--payloads", action="append", default=[], help="файл корпуса payload'ов")
+    parser.add_argument("--payload-budget", type=int, help="максимум payload'ов каждого класса")
+    parser.add_argument("--output", default=BENCHMARK_PATH, help="JSONL-файл результатов")
+    args = parser.parse_args()
+
+    run_benchmark(runs=args.runs, workers=args.workers, prescreen=not args.no_prescreen, crawl=not args.no_crawl,
+                  payload_files=args.payloads, payload_budget=args.payload_budget, output=args.output)
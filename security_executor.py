@@ -0,0 +1,120 @@
+"""
+⚡ ПАРАЛЛЕЛЬНОЕ ВЫПОЛНЕНИЕ SECURITY PAYLOAD'ОВ
+Распределение задач (страница, поле, payload) по нескольким браузерам
+- Каждый воркер - отдельный Chrome из пула: свои cookies, storage и вкладки
+- Упавший браузер воркера заменяется новым, прерванная задача повторяется один раз
+- Темп запросов к хосту задает общий регулятор набора (rate_governor)
+- Детерминированное слияние находок в порядке задач, а не завершения
+- Задачи, потерянные при остановке воркеров (браузер не запускается или падает повторно), подсчитываются
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from driver_pool import get_pool
+
+
+class ParallelPayloadExecutor:
+    """Выполнение payload-задач набора SecurityTestSuite в N изолированных браузерах"""
+
+    def __init__(self, suite, workers=4, max_replacements=2):
+        self.suite = suite
+        self.workers = workers
+        self.max_replacements = max_replacements  # сколько раз воркер может заменить упавший браузер
+        self.errored = 0  # попытки, завершившиеся ошибкой при живом браузере
+        self.skipped = 0  # задачи, потерянные при остановке воркеров
+
+    def _acquire(self, pool):
+        """Арендовать браузер; None - браузер не запустился"""
+        try:
+            return pool.acquire()
+        except Exception as e:
+            print(f"❌ Не удалось запустить браузер воркера: {e}")
+            return None
+
+    def _worker(self, pool, tasks, results, errored, cursor, cursor_lock):
+        """Воркер: арендует свой браузер и разбирает общую очередь задач; упавший браузер заменяется"""
+        driver = self._acquire(pool)
+        if driver is None:
+            return
+        replacements = 0
+        retry = None  # задача, прерванная падением браузера, - повторяется один раз на новом
+
+        try:
+            while True:
+                if retry is not None:
+                    index, retry = retry, None
+                    retried = True
+                else:
+                    with cursor_lock:
+                        index = cursor[0]
+                        cursor[0] += 1
+                    if index >= len(tasks):
+                        return
+                    retried = False
+
+                findings = self.suite.execute_task(driver, tasks[index])
+                if findings is not None:
+                    results[index] = findings
+                    continue
+
+                # Попытка завершилась ошибкой: если браузер жив - это ошибка самой попытки
+                if pool.is_healthy(driver):
+                    errored[index] = True
+                    continue
+
+                pool.release(driver, broken=True)
+                driver = None
+                if replacements >= self.max_replacements:
+                    print(f"❌ Браузер воркера падает повторно, воркер остановлен (задача {index + 1})")
+                    return
+                replacements += 1
+                print(f"⚠️ Браузер воркера не отвечает, запускаем новый ({replacements}/{self.max_replacements})")
+                driver = self._acquire(pool)
+                if driver is None:
+                    return
+                if not retried:
+                    retry = index
+
+        finally:
+            if driver is not None:
+                pool.release(driver, broken=not pool.is_healthy(driver))
+
+    def run(self, tasks):
+        """Выполнить задачи; вернуть находки в порядке задач"""
+        if not tasks:
+            return []
+
+        workers = min(self.workers, len(tasks))
+        pool = get_pool("security_workers", self.suite.create_driver, size=self.workers)
+        pool.prewarm(workers, background=False)
+
+        results = [None] * len(tasks)
+        errored = [False] * len(tasks)
+        cursor = [0]
+        cursor_lock = threading.Lock()
+
+        print(f"⚡ {len(tasks)} задач на {workers} браузерах")
+        started = time.time()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self._worker, pool, tasks, results, errored, cursor, cursor_lock)
+                       for _ in range(workers)]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"❌ Ошибка воркера: {e}")
+
+        print(f"⏱️ Задачи выполнены за {time.time() - started:.1f}с")
+
+        # Без результата остаются ошибочные попытки и задачи, до которых не дошли остановившиеся воркеры
+        self.errored = sum(errored)
+        self.skipped = sum(1 for index, task_findings in enumerate(results)
+                           if task_findings is None and not errored[index])
+        if self.skipped:
+            print(f"⚠️ Не выполнено задач: {self.skipped} из {len(tasks)} - воркеры остановлены падениями браузера, "
+                  f"находки по ним отсутствуют")
+
+        return [finding for task_findings in results for finding in (task_findings or [])]
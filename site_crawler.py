@@ -0,0 +1,213 @@
+"""
+🕸️ ОБХОД САЙТА ДЛЯ ПОИСКА ЦЕЛЕЙ
+Асинхронный краулер в пределах одного origin вместо ручных списков страниц
+- Ограниченная параллельность: N asyncio-воркеров, запросы в пуле потоков через requests
+- Фронтир без повторов: нормализованные URL и фильтр Блума для больших сайтов
+- Ограничения по глубине и числу страниц
+- Результат - инвентарь страниц и их форм для фаз XSS/SQL
+- Темп задает отдельный регулятор обхода, а не общий регулятор payload-проверок: при 4 запросах/с
+  сотни страниц обходились бы минутами. Цена - обход и проверки не делят один бюджет, поэтому
+  для чужих хостов частота обхода ограничена (AIMD и Retry-After сохраняются), без лимита - только локальный стенд
+"""
+
+import asyncio
+import hashlib
+import math
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from http_prescreen import FormParser
+
+# Ресурсы, которые не бывают HTML-страницами
+SKIP_EXTENSIONS = (
+    ".jpg", ".jpeg", ".png", ".gif", ".svg", ".ico", ".webp", ".bmp",
+    ".css", ".js", ".pdf", ".zip", ".gz", ".rar", ".mp3", ".mp4", ".avi",
+    ".woff", ".woff2", ".ttf", ".swf", ".exe", ".dmg",
+)
+
+
+def normalize_url(url):
+    """Канонический вид URL: без фрагмента, порта по умолчанию, с отсортированным query"""
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    port = parts.port
+    if port and not ((scheme == "http" and port == 80) or (scheme == "https" and port == 443)):
+        host = f"{host}:{port}"
+
+    path = posixpath.normpath(parts.path) if parts.path else "/"
+    if parts.path.endswith("/") and path != "/":
+        path += "/"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+class BloomFilter:
+    """Фильтр Блума на bytearray: память не растет с числом URL"""
+
+    def __init__(self, capacity=100000, error_rate=0.001):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, int(round(self.size / capacity * math.log(2))))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        """Позиции бит: двойное хэширование по одному blake2b"""
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, item):
+        """Добавить элемент; вернуть True, если его (вероятно) еще не было"""
+        added = False
+        for position in self._positions(item):
+            byte, bit = divmod(position, 8)
+            if not self.bits[byte] & (1 << bit):
+                self.bits[byte] |= 1 << bit
+                added = True
+        return added
+
+    def __contains__(self, item):
+        return all(self.bits[p // 8] & (1 << (p % 8)) for p in self._positions(item))
+
+
+class PageParser(FormParser):
+    """Формы страницы плюс ссылки для фронтира"""
+
+    LINK_ATTRS = {"a": "href", "area": "href", "frame": "src", "iframe": "src", "form": "action"}
+
+    def __init__(self):
+        super().__init__()
+        self.links = []
+
+    def handle_starttag(self, tag, attrs):
+        super().handle_starttag(tag, attrs)
+        attr = self.LINK_ATTRS.get(tag)
+        if attr:
+            value = dict(attrs).get(attr)
+            if value:
+                self.links.append(value)
+
+
+class SiteCrawler:
+    """Асинхронный обход страниц одного origin"""
+
+    def __init__(self, base_url, max_pages=300, max_depth=3, concurrency=8, timeout=10, governor=None):
+        self.base_url = normalize_url(base_url)
+        self.origin = urlsplit(self.base_url)[:2]
+        self.max_pages = max_pages
+        self.max_depth = max_depth
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.governor = governor  # RateGovernor обхода: темп и параллельность запросов к хосту
+
+        self.seen = BloomFilter(capacity=max(1000, max_pages * 20))
+        self.pages = []
+        self.scheduled = 0
+        self.errors = 0
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["User-Agent"] = "Mozilla/5.0 (HugoSecurityCrawler)"
+
+    def is_in_scope(self, url):
+        """Тот же origin и не статический ресурс"""
+        parts = urlsplit(url)
+        if parts[:2] != self.origin:
+            return False
+        return not parts.path.lower().endswith(SKIP_EXTENSIONS)
+
+    def _fetch(self, url):
+        """Скачать страницу (выполняется в пуле потоков)"""
+        if self.governor:
+            with self.governor.slot(url) as slot:
+                response = self.session.get(url, timeout=self.timeout, allow_redirects=True)
+                slot["status"] = response.status_code
+                slot["retry_after"] = response.headers.get("Retry-After")
+        else:
+            response = self.session.get(url, timeout=self.timeout, allow_redirects=True)
+        content_type = response.headers.get("Content-Type", "")
+        html = response.text if "html" in content_type or not content_type else ""
+        return response.status_code, normalize_url(response.url), html
+
+    def _schedule(self, queue, url, depth):
+        """Поставить URL во фронтир, если он новый и лимиты позволяют"""
+        if self.scheduled >= self.max_pages or depth > self.max_depth:
+            return
+        if not self.is_in_scope(url) or not self.seen.add(url):
+            return
+        self.scheduled += 1
+        queue.put_nowait((url, depth))
+
+    async def _worker(self, queue, loop, executor):
+        """Воркер: берет URL из фронтира, скачивает, разбирает, добавляет новые ссылки"""
+        while True:
+            url, depth = await queue.get()
+            try:
+                status, final_url, html = await loop.run_in_executor(executor, self._fetch, url)
+
+                if final_url != url and (not self.is_in_scope(final_url) or not self.seen.add(final_url)):
+                    continue  # редирект за пределы сайта или на уже известную страницу
+
+                parser = PageParser()
+                try:
+                    parser.feed(html)
+                except Exception:
+                    pass
+
+                for form in parser.forms:
+                    form["action"] = urljoin(final_url, form["action"])
+
+                self.pages.append({
+                    "url": final_url,
+                    "path": self.relative_path(final_url),
+                    "depth": depth,
+                    "status": status,
+                    "forms": parser.forms,
+                })
+
+                for link in parser.links:
+                    if link.startswith(("javascript:", "mailto:", "tel:", "#")):
+                        continue
+                    self._schedule(queue, normalize_url(urljoin(final_url, link)), depth + 1)
+
+            except Exception:
+                self.errors += 1
+
+            finally:
+                queue.task_done()
+
+    async def crawl_async(self):
+        """Обход сайта; список страниц в порядке (глубина, URL)"""
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        self._schedule(queue, self.base_url, 0)
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            workers = [asyncio.ensure_future(self._worker(queue, loop, executor))
+                       for _ in range(self.concurrency)]
+            await queue.join()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        self.pages.sort(key=lambda page: (page["depth"], page["url"]))
+        return self.pages
+
+    def crawl(self):
+        """Синхронная обертка для тестовых наборов"""
+        try:
+            return asyncio.run(self.crawl_async())
+        finally:
+            self.session.close()
+
+    def relative_path(self, url):
+        """Путь страницы относительно origin (с query), как его ждут фазы тестов"""
+        parts = urlsplit(url)
+        return parts.path + (f"?{parts.query}" if parts.query else "")
@@ -0,0 +1,128 @@
+"""
+📤 ПОИСК КНОПКИ ОТПРАВКИ ФОРМЫ
+Один скрипт в странице вместо перебора селекторов по одному запросу WebDriver
+- Кандидаты: button, input submit/image/button, [role=button]
+- Оценка: тип submit, текст кнопки, принадлежность форме заполняемого поля, видимость, доступность
+- Только валидный CSS (без jQuery-селекторов вида button:contains)
+- Результат кэшируется по странице и сигнатуре формы: для той же формы ранжирование не повторяется;
+  кнопка из кэша проверяется на принадлежность форме заполненного поля
+- Кэш общий для параллельных воркеров: в страницу передается снимок, обновление - под блокировкой
+- Те же функции встроены в разбор схемы форм (form_schema)
+"""
+
+import threading
+
+# Стабильный CSS-путь элемента: id, затем name, затем цепочка nth-of-type
+CSS_PATH_JS = """
+var hugoCssPath = function (el) {
+    if (el.id && document.querySelectorAll('#' + CSS.escape(el.id)).length === 1) {
+        return '#' + CSS.escape(el.id);
+    }
+    var tag = el.tagName.toLowerCase(), name = el.getAttribute('name');
+    if (name) {
+        var byName = tag + '[name="' + name.replace(/(["\\\\])/g, '\\\\$1') + '"]';
+        if (document.querySelectorAll(byName).length === 1) { return byName; }
+    }
+    var parts = [];
+    for (var node = el; node && node.nodeType === 1 && node !== document.documentElement; node = node.parentElement) {
+        var index = 1;
+        for (var sib = node.previousElementSibling; sib; sib = sib.previousElementSibling) {
+            if (sib.tagName === node.tagName) { index++; }
+        }
+        parts.unshift(node.tagName.toLowerCase() + ':nth-of-type(' + index + ')');
+    }
+    return 'html > ' + parts.join(' > ');
+};
+"""
+
+SUBMIT_RANKER_JS = """
+var hugoSubmitText = /submit|send|search|go$|log ?in|sign ?(in|up)|register|continue|save|apply|отправ|войти|найти|поиск|сохран|продолж|регистр/i;
+var hugoSubmitNegative = /reset|cancel|clear|back|close|отмен|сброс|очист|назад|закры/i;
+
+var hugoFormSignature = function (form) {
+    if (!form) { return 'page:' + location.pathname; }
+    var names = Array.prototype.map.call(form.elements, function (el) {
+        return el.tagName + ':' + (el.getAttribute('type') || '') + ':' + (el.getAttribute('name') || el.id || '');
+    });
+    return (form.getAttribute('action') || '') + '|' + (form.getAttribute('method') || '') + '|' + names.join(',');
+};
+
+var hugoRankSubmits = function (anchorForm) {
+    var nodes = document.querySelectorAll(
+        'button, input[type="submit"], input[type="image"], input[type="button"], [role="button"]');
+    var ranked = [];
+    Array.prototype.forEach.call(nodes, function (el) {
+        var type = (el.getAttribute('type') || (el.tagName === 'BUTTON' ? 'submit' : '')).toLowerCase();
+        if (type === 'reset' || type === 'hidden') { return; }
+
+        var text = ((el.tagName === 'INPUT' ? el.value : el.textContent) || el.getAttribute('aria-label') || '').trim();
+        var style = window.getComputedStyle(el), rect = el.getBoundingClientRect();
+        var visible = style.display !== 'none' && style.visibility !== 'hidden' && rect.width > 0 && rect.height > 0;
+        var form = el.form || null;
+
+        var score = 0;
+        if (type === 'submit' || type === 'image') { score += 40; }
+        if (hugoSubmitText.test(text)) { score += 30; }
+        if (hugoSubmitNegative.test(text)) { score -= 60; }
+        if (anchorForm) { score += form === anchorForm ? 25 : (form ? -20 : 0); }
+        else if (form) { score += 5; }
+        if (/submit/i.test((el.id || '') + ' ' + (typeof el.className === 'string' ? el.className : ''))) { score += 10; }
+        score += visible ? 15 : -50;
+        if (el.disabled) { score -= 50; }
+
+        ranked.push({element: el, selector: hugoCssPath(el), score: score, type: type, text: text.slice(0, 50),
+                     form: form ? Array.prototype.indexOf.call(document.forms, form) : -1, visible: visible});
+    });
+    // Array.prototype.sort устойчива - при равной оценке сохраняется порядок документа
+    ranked.sort(function (a, b) { return b.score - a.score; });
+    return ranked;
+};
+"""
+
+FIND_SUBMIT_JS = CSS_PATH_JS + SUBMIT_RANKER_JS + """
+var anchor = arguments[0], known = arguments[1] || {};
+var form = anchor ? (anchor.form || anchor.closest('form')) : null;
+// Одинаковые по составу формы на разных страницах - разные записи кэша
+var signature = location.pathname + '#' + hugoFormSignature(form);
+
+if (known[signature]) {
+    var cached = document.querySelector(known[signature]);
+    // Кнопка из кэша годится, только если принадлежит той же форме, что и заполненное поле
+    var sameForm = cached && (!form || cached.form === form || form.contains(cached));
+    if (sameForm && !cached.disabled && cached.getClientRects().length) {
+        return {element: cached, selector: known[signature], signature: signature, cached: true};
+    }
+}
+
+var ranked = hugoRankSubmits(form).filter(function (c) { return c.score > 0; });
+if (!ranked.length) { return {element: null, signature: signature, cached: false}; }
+var best = ranked[0];
+return {element: best.element, selector: best.selector, score: best.score, text: best.text,
+        signature: signature, cached: false};
+"""
+
+
+class SubmitFinder:
+    """Лучшая кнопка отправки для формы с кэшем по сигнатуре формы"""
+
+    def __init__(self):
+        self.known = {}  # страница#сигнатура формы -> CSS-селектор лучшей кнопки
+        self.rankings = 0
+        self.hits = 0
+        self._lock = threading.Lock()
+
+    def find(self, driver, anchor=None):
+        """Кнопка отправки формы поля anchor (или страницы): {element, selector, ...} или None"""
+        with self._lock:
+            known = dict(self.known)  # снимок: другие воркеры могут дополнять кэш во время запроса
+        result = driver.execute_script(FIND_SUBMIT_JS, anchor, known)
+        if not result or not result.get("element"):
+            return None
+
+        with self._lock:
+            if result["cached"]:
+                self.hits += 1
+            else:
+                self.rankings += 1
+                self.known[result["signature"]] = result["selector"]
+        return result
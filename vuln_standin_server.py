@@ -0,0 +1,251 @@
+"""
+🧪 ЛОКАЛЬНЫЙ УЯЗВИМЫЙ СТЕНД
+Офлайн-замена testphp.vulnweb.com для воспроизводимых прогонов security-набора
+- Страницы: главная, поиск, вход, категории/товары, художники, гостевая книга
+- Поиск и гостевая книга отражают ввод без экранирования (XSS)
+- Вход и список товаров собирают "SQL" конкатенацией и выдают ошибки в стиле MySQL
+- Страница художников экранирует ввод и проверяет id - контрольная защищенная форма
+- EXPECTED_FINDINGS - эталон для подсчета полноты (recall)
+
+Запуск отдельно: python vuln_standin_server.py [порт]
+"""
+
+import html
+import re
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+# Эталон: (класс, подстрока id проверки) - какие уязвимости сканер обязан найти
+EXPECTED_FINDINGS = [
+    ("xss", "searchFor"),
+    ("xss", "/guestbook.php"),
+    ("sql", "/login.php"),
+    ("sql", ":cat"),
+]
+
+CATEGORIES = {1: "Posters", 2: "Paintings", 3: "Stickers", 4: "Graffiti"}
+ARTISTS = {1: "r4w8173", 2: "Blad3", 3: "lyzae"}
+USERS = {"test": ("test", "John Smith"), "admin": ("s3cr3t-admin", "Administrator")}
+
+MYSQL_WARNING = ("Warning: mysql_fetch_array() expects parameter 1 to be resource, boolean given "
+                 "in /var/www/{page} on line 74")
+MYSQL_SYNTAX = ("Error: You have an error in your SQL syntax; check the manual that corresponds to your "
+                "MySQL server version for the right syntax to use near '{near}' at line 1")
+
+TAUTOLOGY = re.compile(r"\bor\b\s*(['\"]?)(\w+)\1\s*=\s*(['\"]?)\2\3", re.I)
+
+
+def layout(title, body):
+    """Общая разметка страницы с формой поиска в шапке"""
+    return f"""<!DOCTYPE html>
+<html><head><title>{title} - stand-in art shop</title></head>
+<body>
+<div id="header">
+  <form action="search.php?test=query" method="post">
+    <label>search art</label>
+    <input name="searchFor" type="text" size="10">
+    <input name="goButton" type="submit" value="go">
+  </form>
+  <a href="index.php">home</a> | <a href="categories.php">categories</a> |
+  <a href="artists.php">artists</a> | <a href="guestbook.php">guestbook</a> |
+  <a href="login.php">signup / login</a>
+</div>
+<div id="content">
+<h2>{title}</h2>
+{body}
+</div>
+</body></html>"""
+
+
+def simulate_query(query):
+    """Грубая имитация СУБД: ('error', near, запрос) | ('rows', есть ли тавтология, запрос без комментария)"""
+    for comment in ("--", "#", "/*"):
+        if comment in query:
+            query = query[:query.index(comment)]
+
+    if query.count("'") % 2:
+        near = query[query.rfind("'"):][:40]
+        return "error", near, query
+
+    return "rows", bool(TAUTOLOGY.search(query)), query
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """Обработчик страниц стенда"""
+
+    server_version = "StandinShop/1.0"
+
+    def log_message(self, format, *args):
+        pass  # без шума в выводе тестов
+
+    def _params(self):
+        """GET- и POST-параметры одним словарем"""
+        params = {k: v[-1] for k, v in parse_qs(urlsplit(self.path).query, keep_blank_values=True).items()}
+        if self.command == "POST":
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length).decode("utf-8", "replace")
+            params.update({k: v[-1] for k, v in parse_qs(body, keep_blank_values=True).items()})
+        return params
+
+    def _send(self, body, status=200):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self.route()
+
+    def do_POST(self):
+        self.route()
+
+    def route(self):
+        """Выбор страницы по пути"""
+        path = urlsplit(self.path).path.rstrip("/") or "/index.php"
+        if path == "/":
+            path = "/index.php"
+
+        page = {
+            "/index.php": self.page_index,
+            "/search.php": self.page_search,
+            "/login.php": self.page_login,
+            "/userinfo.php": self.page_userinfo,
+            "/categories.php": self.page_categories,
+            "/listproducts.php": self.page_listproducts,
+            "/artists.php": self.page_artists,
+            "/guestbook.php": self.page_guestbook,
+        }.get(path)
+
+        if page is None:
+            self._send(layout("Not found", "<p>page not found</p>"), status=404)
+            return
+
+        try:
+            self._send(page(self._params()))
+        except Exception as e:
+            self._send(layout("Error", f"<p>internal error: {html.escape(str(e))}</p>"), status=500)
+
+    def page_index(self, params):
+        links = "".join(f'<li><a href="listproducts.php?cat={cid}">{name}</a></li>' for cid, name in CATEGORIES.items())
+        return layout("Home", f"<p>Our newest art.</p><ul>{links}</ul>")
+
+    def page_search(self, params):
+        # Уязвимо: ввод вставляется в HTML как есть
+        query = params.get("searchFor", "")
+        return layout("Search", f"<h3>searched for: {query}</h3><p>no results</p>")
+
+    def page_login(self, params):
+        return layout("Login", """
+<form name="loginform" method="post" action="userinfo.php">
+  Username: <input name="uname" type="text" size="20">
+  Password: <input name="pass" type="password" size="20">
+  <input type="submit" value="login">
+</form>""")
+
+    def page_userinfo(self, params):
+        # Уязвимо: "SQL" собирается конкатенацией
+        uname, password = params.get("uname", ""), params.get("pass", "")
+        query = f"SELECT * FROM users WHERE uname='{uname}' AND pass='{password}'"
+        result, value, executed = simulate_query(query)
+
+        if result == "error":
+            return layout("Login", f"<p>{MYSQL_SYNTAX.format(near=html.escape(value))}</p>")
+
+        # Комментарий мог отрезать проверку пароля: "admin'--"
+        login = executed.split("'")[1] if "'" in executed else uname
+        user = USERS.get(login)
+        password_ok = user and ("pass=" not in executed or user[0] == password)
+        if value or password_ok:
+            name = user[1] if user else "John Smith"
+            return layout("User info", f'<p>Welcome, {name}!</p><a href="login.php">Logout</a>')
+
+        return layout("Login", "<p>you must login</p>")
+
+    def page_categories(self, params):
+        links = "".join(f'<li><a href="listproducts.php?cat={cid}">{name}</a></li>' for cid, name in CATEGORIES.items())
+        return layout("Categories", f"""<ul>{links}</ul>
+<form action="listproducts.php" method="get">
+  Category id: <input name="cat" type="text">
+  <input type="submit" value="show">
+</form>""")
+
+    def page_listproducts(self, params):
+        # Уязвимо: числовой параметр без проверки попадает в запрос
+        cat = params.get("cat", "1")
+        result, value, _ = simulate_query(f"SELECT * FROM products WHERE cat_id={cat}")
+
+        if result == "error" or not cat.strip().isdigit() and not value:
+            return layout("Products", f"<p>{MYSQL_WARNING.format(page='listproducts.php')}</p>")
+
+        name = CATEGORIES.get(int(cat), "all categories") if cat.strip().isdigit() else "all categories"
+        return layout("Products", f"<p>Products in {name}</p>")
+
+    def page_artists(self, params):
+        # Защищено: id проверяется, ввод экранируется
+        links = "".join(f'<li><a href="artists.php?artist={aid}">{name}</a></li>' for aid, name in ARTISTS.items())
+        artist = params.get("artist", "")
+        if artist.isdigit() and int(artist) in ARTISTS:
+            info = f"<p>Artist: {ARTISTS[int(artist)]}</p>"
+        elif artist:
+            info = f"<p>No artist found for: {html.escape(artist)}</p>"
+        else:
+            info = ""
+        return layout("Artists", f"""<ul>{links}</ul>{info}
+<form action="artists.php" method="get">
+  Artist id: <input name="artist" type="text">
+  <input type="submit" value="find">
+</form>""")
+
+    def page_guestbook(self, params):
+        # Уязвимо: сообщение отражается без экранирования
+        text = params.get("text", "")
+        echo = f"<div class='entry'>{text}</div>" if text else ""
+        return layout("Guestbook", f"""{echo}
+<form action="guestbook.php" method="post">
+  <textarea name="text" rows="3"></textarea>
+  <input type="submit" value="add message">
+</form>""")
+
+
+class StandinServer:
+    """Стенд в фоновом потоке"""
+
+    def __init__(self, host="127.0.0.1", port=0):
+        self.httpd = ThreadingHTTPServer((host, port), StandinHandler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Запустить сервер; вернуть себя"""
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Остановить сервер"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
+    server = StandinServer(port=port)
+    print(f"🧪 Уязвимый стенд: {server.base_url} (Ctrl+C - остановить)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()